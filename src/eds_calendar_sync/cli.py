@@ -20,6 +20,7 @@ from eds_calendar_sync.db import get_all_calendar_ids
 from eds_calendar_sync.db import migrate_calendar_id
 from eds_calendar_sync.db import query_status_all_pairs
 from eds_calendar_sync.eds_client import get_calendar_display_info
+from eds_calendar_sync.eds_client import get_source_registry
 from eds_calendar_sync.models import DEFAULT_CONFIG
 from eds_calendar_sync.models import DEFAULT_STATE_DB
 from eds_calendar_sync.models import CalendarPairConfig
@@ -747,7 +748,7 @@ def _load_eds_calendars():
     from gi.repository import ECal
     from gi.repository import EDataServer
 
-    registry = EDataServer.SourceRegistry.new_sync(None)
+    registry = get_source_registry()
     sources = registry.list_sources(EDataServer.SOURCE_EXTENSION_CALENDAR)
     entries = []
     for source in sources:
@@ -1136,14 +1137,9 @@ def status() -> None:
 @app.command()
 def calendars() -> None:
     """List all configured EDS calendars."""
-    import gi
-
-    gi.require_version("EDataServer", "1.2")
-    from gi.repository import EDataServer
-
     from eds_calendar_sync.debug import list_calendars as _list_calendars
 
-    registry = EDataServer.SourceRegistry.new_sync(None)
+    registry = get_source_registry()
     _list_calendars(registry, console)
 
 
@@ -1173,16 +1169,14 @@ def inspect(
     """Inspect / debug events in a calendar."""
     import gi
 
-    gi.require_version("EDataServer", "1.2")
     gi.require_version("ECal", "2.0")
     gi.require_version("ICalGLib", "3.0")
     from gi.repository import ECal
-    from gi.repository import EDataServer
     from gi.repository import ICalGLib
 
     from eds_calendar_sync.debug import dump_event
 
-    registry = EDataServer.SourceRegistry.new_sync(None)
+    registry = get_source_registry()
     source = registry.ref_source(calendar_uid)
     if not source:
         console.print(f"[bold red]Error:[/] Calendar [cyan]{calendar_uid}[/] not found.")
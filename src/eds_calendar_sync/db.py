@@ -9,6 +9,26 @@ from pathlib import Path
 
 from eds_calendar_sync.models import CalendarSyncError
 
+# UIDs bound per "IN (...)" statement; the two calendar-ID parameters keep the
+# total under SQLite's historical 999-variable limit.
+_MAX_IN_PARAMS = 500
+
+# Upsert shared by insert_bidirectional() and insert_bidirectional_many().
+_UPSERT_SQL = (
+    "INSERT INTO sync_state "
+    "(work_calendar_id, personal_calendar_id, "
+    " source_uid, target_uid, source_hash, target_hash, "
+    " origin, created_at, last_sync_at, sanitizer_hash) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(work_calendar_id, personal_calendar_id, source_uid) "
+    "DO UPDATE SET "
+    "    target_uid      = excluded.target_uid, "
+    "    source_hash     = excluded.source_hash, "
+    "    target_hash     = excluded.target_hash, "
+    "    sanitizer_hash  = excluded.sanitizer_hash, "
+    "    last_sync_at    = excluded.last_sync_at"
+)
+
 
 class StateDatabase:
     """Manages SQLite state database for sync tracking."""
@@ -33,6 +53,13 @@ class StateDatabase:
         except sqlite3.Error as e:
             raise CalendarSyncError(f"State database error ({self.db_path}): {e}") from e
 
+    def _executemany(self, sql: str, seq_of_params):
+        """executemany() counterpart of _execute()."""
+        try:
+            return self.conn.executemany(sql, seq_of_params)
+        except sqlite3.Error as e:
+            raise CalendarSyncError(f"State database error ({self.db_path}): {e}") from e
+
     def _commit(self):
         """Commit, converting sqlite3 errors to CalendarSyncError."""
         try:
@@ -46,6 +73,11 @@ class StateDatabase:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self.conn = sqlite3.connect(str(self.db_path))
             self.conn.row_factory = sqlite3.Row  # Enable column access by name
+            # WAL + synchronous=NORMAL: a commit appends to the WAL without an
+            # fsync, and the database stays consistent after a crash (the last
+            # few commits may roll back, which the next sync reconciles).
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         except (OSError, sqlite3.Error) as e:
             raise CalendarSyncError(f"Cannot open state database {self.db_path}: {e}") from e
         self._init_schema()
@@ -78,6 +110,19 @@ class StateDatabase:
         if "sanitizer_hash" not in col_names:
             self._execute("ALTER TABLE sync_state ADD COLUMN sanitizer_hash TEXT")
             self._commit()
+        # Calendar revisions seen by the last two-way run that found nothing to
+        # do, one row per calendar pair (see get_idle_revisions).
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS sync_revisions (
+                work_calendar_id TEXT NOT NULL,
+                personal_calendar_id TEXT NOT NULL,
+                work_revision TEXT NOT NULL,
+                personal_revision TEXT NOT NULL,
+                settings_hash TEXT NOT NULL,
+                PRIMARY KEY(work_calendar_id, personal_calendar_id)
+            )
+        """)
+        self._commit()
 
     def migrate_if_needed(self, is_refresh_or_clear: bool):
         """
@@ -200,7 +245,9 @@ class StateDatabase:
         """Retrieve work→personal sync records for this calendar pair.
 
         Returns records with origin='source' only (work-originated events).
-        Keyed by source_uid (work event UID).
+        Keyed by source_uid (work event UID).  Rows are streamed from the
+        cursor into the dict rather than materialized as a list first, so peak
+        memory is one copy of the state rather than two.
         """
         cursor = self._execute(
             "SELECT source_uid, target_uid, source_hash, sanitizer_hash FROM sync_state "
@@ -209,7 +256,7 @@ class StateDatabase:
         )
         return {
             row[0]: {"target_uid": row[1], "hash": row[2], "sanitizer_hash": row[3]}
-            for row in cursor.fetchall()
+            for row in cursor
         }
 
     def get_all_state_by_target(self) -> dict[str, dict[str, str]]:
@@ -223,7 +270,7 @@ class StateDatabase:
             "WHERE work_calendar_id = ? AND personal_calendar_id = ? AND origin = 'target'",
             (self.work_calendar_id, self.personal_calendar_id),
         )
-        return {row[1]: {"source_uid": row[0], "hash": row[2]} for row in cursor.fetchall()}
+        return {row[1]: {"source_uid": row[0], "hash": row[2]} for row in cursor}
 
     def get_all_state_bidirectional(self) -> list:
         """Retrieve all sync state records for this calendar pair."""
@@ -235,6 +282,23 @@ class StateDatabase:
         )
         return cursor.fetchall()
 
+    def get_tracked_uids(self) -> set[str]:
+        """Return every source and target UID recorded for this calendar pair.
+
+        Lets a caller test many UIDs for a state record with set membership
+        instead of one get_by_*_uid() query each.
+        """
+        cursor = self._execute(
+            "SELECT source_uid, target_uid FROM sync_state "
+            "WHERE work_calendar_id = ? AND personal_calendar_id = ?",
+            (self.work_calendar_id, self.personal_calendar_id),
+        )
+        tracked: set[str] = set()
+        for source_uid, target_uid in cursor:
+            tracked.add(source_uid)
+            tracked.add(target_uid)
+        return tracked
+
     def get_by_source_uid(self, source_uid: str) -> sqlite3.Row | None:
         """Get state record by source UID for this calendar pair."""
         cursor = self._execute(
@@ -301,18 +365,7 @@ class StateDatabase:
         """
         timestamp = int(time.time())
         self._execute(
-            "INSERT INTO sync_state "
-            "(work_calendar_id, personal_calendar_id, "
-            " source_uid, target_uid, source_hash, target_hash, "
-            " origin, created_at, last_sync_at, sanitizer_hash) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
-            "ON CONFLICT(work_calendar_id, personal_calendar_id, source_uid) "
-            "DO UPDATE SET "
-            "    target_uid      = excluded.target_uid, "
-            "    source_hash     = excluded.source_hash, "
-            "    target_hash     = excluded.target_hash, "
-            "    sanitizer_hash  = excluded.sanitizer_hash, "
-            "    last_sync_at    = excluded.last_sync_at",
+            _UPSERT_SQL,
             (
                 self.work_calendar_id,
                 self.personal_calendar_id,
@@ -327,6 +380,26 @@ class StateDatabase:
             ),
         )
 
+    def insert_bidirectional_many(
+        self,
+        rows: list[tuple[str, str, str, str]],
+        origin: str,
+        sanitizer_hash: str | None = None,
+    ):
+        """Apply insert_bidirectional() to many pairs in one executemany() statement.
+
+        rows holds (source_uid, target_uid, source_hash, target_hash); origin
+        and sanitizer_hash are shared by every row.
+        """
+        if not rows:
+            return
+        timestamp = int(time.time())
+        pair = (self.work_calendar_id, self.personal_calendar_id)
+        self._executemany(
+            _UPSERT_SQL,
+            [(*pair, *row, origin, timestamp, timestamp, sanitizer_hash) for row in rows],
+        )
+
     def update_hash(self, source_uid: str, content_hash: str):
         """Update the hash for an existing record (one-way compatibility)."""
         self._execute(
@@ -390,6 +463,44 @@ class StateDatabase:
                 ),
             )
 
+    def update_hashes_many(
+        self,
+        rows: list[tuple[str, str, str, str]],
+        sanitizer_hash: str | None = None,
+    ):
+        """Apply update_hashes() to many pairs in one executemany() statement.
+
+        rows holds (source_uid, target_uid, source_hash, target_hash).  When
+        sanitizer_hash is provided it is stored on every row, as in
+        update_hashes().
+        """
+        if not rows:
+            return
+        now = int(time.time())
+        pair = (self.work_calendar_id, self.personal_calendar_id)
+        if sanitizer_hash is not None:
+            self._executemany(
+                "UPDATE sync_state "
+                "SET source_hash = ?, target_hash = ?, sanitizer_hash = ?, last_sync_at = ? "
+                "WHERE work_calendar_id = ? AND personal_calendar_id = ? "
+                "AND source_uid = ? AND target_uid = ?",
+                [
+                    (source_hash, target_hash, sanitizer_hash, now, *pair, source_uid, target_uid)
+                    for source_uid, target_uid, source_hash, target_hash in rows
+                ],
+            )
+        else:
+            self._executemany(
+                "UPDATE sync_state "
+                "SET source_hash = ?, target_hash = ?, last_sync_at = ? "
+                "WHERE work_calendar_id = ? AND personal_calendar_id = ? "
+                "AND source_uid = ? AND target_uid = ?",
+                [
+                    (source_hash, target_hash, now, *pair, source_uid, target_uid)
+                    for source_uid, target_uid, source_hash, target_hash in rows
+                ],
+            )
+
     def delete(self, source_uid: str):
         """Delete a sync state record by source UID for this calendar pair."""
         self._execute(
@@ -407,12 +518,79 @@ class StateDatabase:
             (self.work_calendar_id, self.personal_calendar_id, source_uid, target_uid),
         )
 
+    def delete_by_source_uids(self, source_uids: list[str]):
+        """Delete every record whose source_uid is in source_uids."""
+        self._delete_where_in("source_uid", source_uids)
+
+    def delete_by_target_uids(self, target_uids: list[str]):
+        """Delete every record whose target_uid is in target_uids."""
+        self._delete_where_in("target_uid", target_uids)
+
+    def _delete_where_in(self, column: str, uids: list[str]):
+        """Delete records whose column value is in uids, one IN (...) statement per chunk.
+
+        column is always a literal from this class, never caller input.
+        """
+        for start in range(0, len(uids), _MAX_IN_PARAMS):
+            chunk = uids[start : start + _MAX_IN_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            self._execute(
+                "DELETE FROM sync_state "
+                "WHERE work_calendar_id = ? AND personal_calendar_id = ? "
+                f"AND {column} IN ({placeholders})",
+                (self.work_calendar_id, self.personal_calendar_id, *chunk),
+            )
+
     def clear_all(self):
         """Remove all state records for this calendar pair (for refresh/clear)."""
         self._execute(
             "DELETE FROM sync_state WHERE work_calendar_id = ? AND personal_calendar_id = ?",
             (self.work_calendar_id, self.personal_calendar_id),
         )
+        self.clear_idle_revisions()
+
+    # ------------------------------------------------------------------ #
+    # Idle revisions — lets two-way sync skip runs with nothing to do     #
+    # ------------------------------------------------------------------ #
+
+    def get_idle_revisions(self) -> tuple[str, str, str] | None:
+        """Return (work_revision, personal_revision, settings_hash) of the last idle run.
+
+        An idle run is a two-way sync that found nothing to write.  If both
+        calendars still report these revisions and the settings are the same,
+        the next run would find nothing to write either.
+        """
+        row = self._execute(
+            "SELECT work_revision, personal_revision, settings_hash FROM sync_revisions "
+            "WHERE work_calendar_id = ? AND personal_calendar_id = ?",
+            (self.work_calendar_id, self.personal_calendar_id),
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def set_idle_revisions(self, work_revision: str, personal_revision: str, settings_hash: str):
+        """Record the calendar revisions seen by an idle two-way run."""
+        self._execute(
+            "INSERT INTO sync_revisions (work_calendar_id, personal_calendar_id, "
+            "work_revision, personal_revision, settings_hash) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(work_calendar_id, personal_calendar_id) DO UPDATE SET "
+            "work_revision = excluded.work_revision, "
+            "personal_revision = excluded.personal_revision, "
+            "settings_hash = excluded.settings_hash",
+            (
+                self.work_calendar_id,
+                self.personal_calendar_id,
+                work_revision,
+                personal_revision,
+                settings_hash,
+            ),
+        )
+
+    def clear_idle_revisions(self):
+        """Forget the idle revisions, so the next two-way run does a full pass."""
+        self._execute(
+            "DELETE FROM sync_revisions WHERE work_calendar_id = ? AND personal_calendar_id = ?",
+            (self.work_calendar_id, self.personal_calendar_id),
+        )
 
     def commit(self):
         """Commit pending transactions."""
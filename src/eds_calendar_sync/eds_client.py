@@ -2,6 +2,8 @@
 Evolution Data Server calendar connectivity wrapper.
 """
 
+import functools
+
 import gi
 
 gi.require_version("EDataServer", "1.2")
@@ -13,6 +15,27 @@ from gi.repository import GLib
 from gi.repository import ICalGLib
 
 from eds_calendar_sync.models import CalendarSyncError
+from eds_calendar_sync.sanitizer import MANAGED_CATEGORY
+from eds_calendar_sync.sanitizer import EventSanitizer
+
+# EClient backend property holding the calendar's change token
+# (E_CLIENT_BACKEND_PROPERTY_REVISION): it changes whenever any event does.
+_REVISION_BACKEND_PROP = "revision"
+
+_RRULE_PROP = ICalGLib.PropertyKind.RRULE_PROPERTY
+_RECURRENCEID_PROP = ICalGLib.PropertyKind.RECURRENCEID_PROPERTY
+
+
+@functools.cache
+def get_source_registry() -> EDataServer.SourceRegistry:
+    """Return the process-wide EDS source registry, creating it on first use.
+
+    SourceRegistry.new_sync() enumerates every configured source over D-Bus,
+    so a single sync run (preflight, display-name lookups, the synchronizer
+    itself) shares one instance instead of building a fresh one each time.
+    A failed construction raises and is not cached, so callers may retry.
+    """
+    return EDataServer.SourceRegistry.new_sync(None)
 
 
 def get_calendar_display_info(calendar_uid: str) -> tuple[str, str, str]:
@@ -23,7 +46,7 @@ def get_calendar_display_info(calendar_uid: str) -> tuple[str, str, str]:
         Tuple of (display_name, account_name, uid)
     """
     try:
-        registry = EDataServer.SourceRegistry.new_sync(None)
+        registry = get_source_registry()
         source = registry.ref_source(calendar_uid)
 
         if not source:
@@ -47,6 +70,11 @@ def get_calendar_display_info(calendar_uid: str) -> tuple[str, str, str]:
         return (f"Error: {e}", "", calendar_uid)
 
 
+def _sexp_quote(value: str) -> str:
+    """Escape value for use inside a double-quoted EDS sexp string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
 class EDSCalendarClient:
     """Wrapper for Evolution Data Server calendar operations."""
 
@@ -84,6 +112,48 @@ class EDSCalendarClient:
         except GLib.Error as e:
             raise CalendarSyncError(f"Failed to fetch events: {e.message}") from e
 
+    def get_managed_events(self) -> list:
+        """Retrieve only the events carrying our managed marker category.
+
+        The filter runs inside EDS via a has-categories? sexp, so only managed
+        components are sent over D-Bus and turned into ICalGLib objects, instead
+        of the whole calendar being fetched and checked in Python.
+        """
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
+
+        sexp = f'(has-categories? "{MANAGED_CATEGORY}")'
+        try:
+            _, objects = self.client.get_object_list_sync(sexp, None)
+            return objects
+        except GLib.Error as e:
+            raise CalendarSyncError(f"Failed to query managed events: {e.message}") from e
+
+    def get_unmanaged_events(self) -> list:
+        """Retrieve only the events that do not carry our managed marker category.
+
+        The one-way passes skip managed events in their source calendar anyway;
+        filtering in EDS means those mirrors are never sent over D-Bus or
+        parsed.  Callers still check is_managed_event() locally as a safety net.
+        """
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
+
+        sexp = f'(not (has-categories? "{MANAGED_CATEGORY}"))'
+        try:
+            _, objects = self.client.get_object_list_sync(sexp, None)
+            return objects
+        except GLib.Error as e:
+            raise CalendarSyncError(f"Failed to fetch events: {e.message}") from e
+
+    def query_managed_uids(self) -> list[str]:
+        """Return the UIDs of events carrying our managed marker category.
+
+        Refresh and clear delete every UID returned here, so the server-side
+        filter is backed by a local is_managed_event() check.
+        """
+        return EventSanitizer.managed_uids(self.get_managed_events())
+
     def create_event(self, component: ICalGLib.Component) -> str | None:
         """Create a new event in the calendar."""
         if not self.client:
@@ -94,33 +164,136 @@ class EDSCalendarClient:
             raise CalendarSyncError("Failed to create event")
         return out_uid
 
-    def modify_event(self, component: ICalGLib.Component):
-        """Modify an existing event in the calendar."""
+    def create_events(
+        self, components: list[ICalGLib.Component], batch_size: int = 100
+    ) -> list[str | Exception]:
+        """Create many events using one create_objects_sync() call per batch.
+
+        Creation is not idempotent and a backend may store part of a batch
+        before failing, so after a failed batch the managed events are looked
+        up by source fingerprint (the server may have rewritten UIDs) and only
+        the components that did not land are retried one at a time.
+
+        Returns:
+            One entry per component, in order: the UID the event was stored
+            under, or the exception that prevented its creation.
+        """
         if not self.client:
             raise CalendarSyncError("Client not connected")
 
-        # Determine if we should modify the whole series or just this instance.
-        # For master recurring events (have RRULE and no RECURRENCE-ID),
-        # use ObjModType.ALL to ensure the series definition is updated.
-        mod_type = ECal.ObjModType.THIS
-        check = component
+        results: list[str | Exception] = []
+        for start in range(0, len(components), batch_size):
+            batch = components[start : start + batch_size]
+            try:
+                success, out_uids = self.client.create_objects_sync(
+                    batch, ECal.OperationFlags.NONE, None
+                )
+            except GLib.Error:
+                success, out_uids = False, None
+            if success and out_uids and len(out_uids) == len(batch):
+                results.extend(out_uids)
+                continue
+
+            stored = self._managed_uids_by_fingerprint()
+            for comp in batch:
+                existing_uid = stored.get(EventSanitizer.get_source_fingerprint(comp) or "")
+                if existing_uid:
+                    results.append(existing_uid)
+                    continue
+                try:
+                    results.append(self.create_event(comp) or comp.get_uid())
+                except (GLib.Error, CalendarSyncError) as e:
+                    results.append(e)
+        return results
+
+    def _managed_uids_by_fingerprint(self) -> dict[str, str]:
+        """Map source fingerprint → UID for the managed events currently stored."""
+        uids: dict[str, str] = {}
+        for obj in self.get_managed_events():
+            if isinstance(obj, str):
+                obj = ICalGLib.Component.new_from_string(obj)
+            fingerprint = EventSanitizer.get_source_fingerprint(obj)
+            if fingerprint and obj.get_uid():
+                uids.setdefault(fingerprint, obj.get_uid())
+        return uids
+
+    @staticmethod
+    def _event_of(component: ICalGLib.Component) -> ICalGLib.Component | None:
+        """Return the VEVENT itself, or the first VEVENT of a VCALENDAR."""
         if component.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
-            check = component.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
+            return component.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
+        return component
 
-        if check:
-            has_rrule = check.get_first_property(ICalGLib.PropertyKind.RRULE_PROPERTY) is not None
-            has_rid = (
-                check.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY) is not None
-            )
-            if has_rrule and not has_rid:
-                mod_type = ECal.ObjModType.ALL
+    @classmethod
+    def _mod_type(cls, component: ICalGLib.Component) -> ECal.ObjModType:
+        """Pick the modification scope for component.
+
+        For master recurring events (have RRULE and no RECURRENCE-ID),
+        ObjModType.ALL ensures the series definition is updated; everything
+        else modifies just this instance.
+        """
+        check = cls._event_of(component)
+        # RECURRENCE-ID is only probed for events that recur at all, so a
+        # one-off event costs a single property lookup.
+        if (
+            check
+            and check.get_first_property(_RRULE_PROP) is not None
+            and check.get_first_property(_RECURRENCEID_PROP) is None
+        ):
+            return ECal.ObjModType.ALL
+        return ECal.ObjModType.THIS
+
+    def modify_event(self, component: ICalGLib.Component):
+        """Modify an existing event in the calendar."""
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
 
         success = self.client.modify_object_sync(
-            component, mod_type, ECal.OperationFlags.NONE, None
+            component, self._mod_type(component), ECal.OperationFlags.NONE, None
         )
         if not success:
             raise CalendarSyncError("Failed to modify event")
 
+    def modify_events(
+        self, components: list[ICalGLib.Component], batch_size: int = 100
+    ) -> dict[str, Exception]:
+        """Modify many events using one modify_objects_sync() call per batch.
+
+        A single call takes one modification scope, so components are grouped
+        by _mod_type() first.  Modifying is idempotent, so when a batch fails
+        it is retried one event at a time to find out which ones actually failed.
+
+        Returns:
+            Mapping of UID → exception for every modification that failed
+            (empty on full success).
+        """
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
+
+        groups: dict[ECal.ObjModType, list[ICalGLib.Component]] = {}
+        for component in components:
+            groups.setdefault(self._mod_type(component), []).append(component)
+
+        failures: dict[str, Exception] = {}
+        for mod_type, group in groups.items():
+            for start in range(0, len(group), batch_size):
+                batch = group[start : start + batch_size]
+                try:
+                    success = self.client.modify_objects_sync(
+                        batch, mod_type, ECal.OperationFlags.NONE, None
+                    )
+                except GLib.Error:
+                    success = False
+                if success:
+                    continue
+                for component in batch:
+                    try:
+                        self.modify_event(component)
+                    except (GLib.Error, CalendarSyncError) as e:
+                        event = self._event_of(component)
+                        failures[event.get_uid() if event else ""] = e
+        return failures
+
     def remove_event(self, uid: str):
         """Remove an event from the calendar."""
         if not self.client:
@@ -136,6 +309,38 @@ class EDSCalendarClient:
         if not success:
             raise CalendarSyncError(f"Failed to remove event {uid}")
 
+    def remove_events(self, uids: list[str], batch_size: int = 500) -> dict[str, Exception]:
+        """Remove many events using one remove_objects_sync() call per batch.
+
+        EDS reports a single error for a whole batch, so when a batch fails it
+        is retried one UID at a time to find out which removals actually failed.
+
+        Returns:
+            Mapping of UID → exception for every removal that failed (empty on
+            full success).
+        """
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
+
+        failures: dict[str, Exception] = {}
+        for start in range(0, len(uids), batch_size):
+            batch = uids[start : start + batch_size]
+            ids = [ECal.ComponentId.new(uid, None) for uid in batch]
+            try:
+                success = self.client.remove_objects_sync(
+                    ids, ECal.ObjModType.THIS, ECal.OperationFlags.NONE, None
+                )
+            except GLib.Error:
+                success = False
+            if success:
+                continue
+            for uid in batch:
+                try:
+                    self.remove_event(uid)
+                except (GLib.Error, CalendarSyncError) as e:
+                    failures[uid] = e
+        return failures
+
     def get_account_email(self) -> str | None:
         """Return the authenticated user email for this calendar, or None.
 
@@ -159,6 +364,48 @@ class EDSCalendarClient:
             pass
         return None
 
+    def get_revision(self) -> str | None:
+        """Return the backend's collection revision (change token), or None.
+
+        The revision changes whenever any event in the calendar is created,
+        modified or removed, so an unchanged value means the calendar content
+        is unchanged.  Backends that do not report one return None.
+        """
+        if not self.client:
+            return None
+        try:
+            ok, revision = self.client.get_backend_property_sync(_REVISION_BACKEND_PROP, None)
+        except GLib.Error:
+            return None
+        return revision if ok and revision else None
+
+    def get_events(self, uids: list[str], batch_size: int = 100) -> dict[str, ICalGLib.Component]:
+        """Retrieve many events by UID with one get_object_list_sync() call per batch.
+
+        Used for post-write readbacks, which would otherwise cost one
+        get_object_sync() D-Bus round trip per event.  UIDs that are not found
+        are simply absent from the result; if a detached instance shares its
+        master's UID, the first component returned for it is kept.
+        """
+        if not self.client:
+            raise CalendarSyncError("Client not connected")
+
+        found: dict[str, ICalGLib.Component] = {}
+        for start in range(0, len(uids), batch_size):
+            batch = uids[start : start + batch_size]
+            terms = " ".join(f'(uid? "{_sexp_quote(uid)}")' for uid in batch)
+            try:
+                _, objects = self.client.get_object_list_sync(f"(or {terms})", None)
+            except GLib.Error as e:
+                raise CalendarSyncError(f"Failed to fetch events: {e.message}") from e
+            for obj in objects:
+                if isinstance(obj, str):
+                    obj = ICalGLib.Component.new_from_string(obj)
+                uid = obj.get_uid()
+                if uid:
+                    found.setdefault(uid, obj)
+        return found
+
     def get_event(self, uid: str) -> ICalGLib.Component | None:
         """Retrieve a single event by UID."""
         if not self.client:
@@ -33,16 +33,16 @@ def run_preflight_checks(cfg: SyncConfig, console: Console) -> bool:
     import gi
 
     gi.require_version("ECal", "2.0")
-    gi.require_version("EDataServer", "1.2")
     from gi.repository import ECal
-    from gi.repository import EDataServer
     from gi.repository import GLib
 
+    from eds_calendar_sync.eds_client import get_source_registry
+
     issues: list[tuple[str, str, str]] = []  # (label, detail, hint)
 
     # 1. EDS registry reachable
     try:
-        registry = EDataServer.SourceRegistry.new_sync(None)
+        registry = get_source_registry()
     except Exception as e:
         logger.error("EDS registry unreachable: %s", e)
         issues.append(
@@ -77,8 +77,11 @@ def run_preflight_checks(cfg: SyncConfig, console: Console) -> bool:
         except GLib.Error as e:
             msg = e.message or str(e)
             logger.error("Cannot connect to %s calendar (%s): %s", label, uid, msg)
-            if any(kw in msg.lower() for kw in _OFFLINE_KEYWORDS):
-                # Try to find the parent account name for a better hint
+            msg_lower = msg.lower()
+            if any(kw in msg_lower for kw in _OFFLINE_KEYWORDS):
+                # Try to find the parent account name for a better hint.  This
+                # registry lookup feeds the user-facing panel only — it is not
+                # part of the log record, so it runs only on the offline path.
                 account_name = _get_parent_display_name(registry, source)
                 if account_name:
                     hint = f"Account '{account_name}' appears offline — check GNOME Online Accounts"
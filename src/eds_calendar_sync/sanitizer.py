@@ -25,6 +25,37 @@ _EXDATE_DATE_RE = re.compile(r"^EXDATE[^:\n]*:(\d{8})", re.MULTILINE)
 # a version bump forces a one-time re-sync of all existing events.
 SANITIZER_VERSION = 1
 
+# CATEGORIES value stamped on every event this tool creates.  A category (not
+# an X-property) because Microsoft 365 strips X-properties and COMMENT.
+MANAGED_CATEGORY = "CALENDAR-SYNC-MANAGED"
+
+# Component kinds hoisted to module scope so sanitize() compares against
+# cached enum values instead of resolving them through GI on every call.
+_VCALENDAR_KIND = ICalGLib.ComponentKind.VCALENDAR_COMPONENT
+_VEVENT_KIND = ICalGLib.ComponentKind.VEVENT_COMPONENT
+# Walked once per fetched event by is_managed_event(), so hoisted the same way.
+_CATEGORIES_PROP = ICalGLib.PropertyKind.CATEGORIES_PROPERTY
+
+
+def _date_key(t: ICalGLib.Time) -> str:
+    """Return t's calendar date as YYYYMMDD (same format as sync.utils.ical_date_key)."""
+    return t.as_ical_string()[:8]
+
+
+def _new_time(dt: datetime.datetime, utc: bool) -> ICalGLib.Time:
+    """Build a date-time ICalGLib.Time from a naive datetime without string parsing.
+
+    When ``utc`` is True the time is pinned to the UTC zone so it serialises
+    with a trailing ``Z``; otherwise it is floating (used with a TZID param).
+    """
+    t = ICalGLib.Time.new_null_time()
+    t.set_date(dt.year, dt.month, dt.day)
+    t.set_time(dt.hour, dt.minute, dt.second)
+    t.set_is_date(False)
+    if utc:
+        t.set_timezone(ICalGLib.Timezone.get_utc_timezone())
+    return t
+
 
 class EventSanitizer:
     """Handles sanitization of calendar events per privacy spec."""
@@ -34,41 +65,72 @@ class EventSanitizer:
         """Check if an event was created by our sync tool."""
         # Check CATEGORIES property for our marker
         # (X-properties and COMMENT are stripped by Microsoft 365, so we use CATEGORIES)
-        prop = component.get_first_property(ICalGLib.PropertyKind.CATEGORIES_PROPERTY)
+        prop = component.get_first_property(_CATEGORIES_PROP)
         while prop:
             categories = prop.get_categories()
-            if categories and "CALENDAR-SYNC-MANAGED" in categories:
+            if categories and MANAGED_CATEGORY in categories:
                 return True
-            prop = component.get_next_property(ICalGLib.PropertyKind.CATEGORIES_PROPERTY)
+            prop = component.get_next_property(_CATEGORIES_PROP)
         return False
 
     @staticmethod
     def _remove_all_properties(component: ICalGLib.Component, prop_kind: ICalGLib.PropertyKind):
-        """Remove all instances of a specific property from a component."""
+        """Remove all instances of a specific property from a component.
+
+        Collects the matching properties in a single walk and removes them
+        afterwards, rather than restarting the scan with get_first_property()
+        after every removal (quadratic in the number of properties).
+        """
+        victims = []
         prop = component.get_first_property(prop_kind)
         while prop:
+            victims.append(prop)
+            prop = component.get_next_property(prop_kind)
+        for prop in victims:
             component.remove_property(prop)
-            prop = component.get_first_property(prop_kind)
 
     @staticmethod
     def _remove_all_components(component: ICalGLib.Component, comp_kind: ICalGLib.ComponentKind):
-        """Remove all sub-components of a specific kind."""
+        """Remove all sub-components of a specific kind (collect first, then remove)."""
+        victims = []
         subcomp = component.get_first_component(comp_kind)
         while subcomp:
+            victims.append(subcomp)
+            subcomp = component.get_next_component(comp_kind)
+        for subcomp in victims:
             component.remove_component(subcomp)
-            subcomp = component.get_first_component(comp_kind)
 
     @staticmethod
     def get_source_fingerprint(component: ICalGLib.Component) -> str | None:
         """Extract the 16-char source fingerprint from CALENDAR-SYNC-SRC-* categories, or None."""
-        prop = component.get_first_property(ICalGLib.PropertyKind.CATEGORIES_PROPERTY)
+        prop = component.get_first_property(_CATEGORIES_PROP)
         while prop:
             categories = prop.get_categories() or ""
             if categories.startswith("CALENDAR-SYNC-SRC-"):
                 return categories[len("CALENDAR-SYNC-SRC-") :]
-            prop = component.get_next_property(ICalGLib.PropertyKind.CATEGORIES_PROPERTY)
+            prop = component.get_next_property(_CATEGORIES_PROP)
         return None
 
+    @staticmethod
+    def managed_uids(objects: list) -> list[str]:
+        """Return the UIDs of the managed events among objects (strings or components).
+
+        Each object is re-checked with is_managed_event(), so a backend that
+        ignores a has-categories? filter can never put an unmanaged event up for
+        deletion.  Detached instances share their master's UID, so the result
+        is de-duplicated (order preserved).
+        """
+        uids: dict[str, None] = {}
+        for obj in objects:
+            if isinstance(obj, str):
+                obj = ICalGLib.Component.new_from_string(obj)
+            if not EventSanitizer.is_managed_event(obj):
+                continue
+            uid = obj.get_uid()
+            if uid:
+                uids[uid] = None
+        return list(uids)
+
     @classmethod
     def sanitize(
         cls,
@@ -101,6 +163,11 @@ class EventSanitizer:
 
         Returns:
             Sanitized ICalGLib.Component ready for target calendar
+
+        Callers skip managed events (is_managed_event) before sanitizing, so
+        there is deliberately no "already sanitized" fast path here: the
+        CALENDAR-SYNC-MANAGED marker is a plain category anyone can add, and
+        trusting it would let an arbitrary event bypass the privacy strip.
         """
         comp = ICalGLib.Component.new_from_string(ical_string)
 
@@ -174,20 +241,23 @@ class EventSanitizer:
             _rrule_prop = event.get_first_property(ICalGLib.PropertyKind.RRULE_PROPERTY)
             if _dts_prop and _rrule_prop:
                 _exdates: set[str] = set()
+                _unreadable_exdate = False
                 _ed_p = event.get_first_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
                 while _ed_p:
                     try:
                         _et = _ed_p.get_exdate()
                         if _et and not _et.is_null_time():
-                            _exdates.add(
-                                f"{_et.get_year():04d}{_et.get_month():02d}{_et.get_day():02d}"
-                            )
+                            _exdates.add(_date_key(_et))
+                        else:
+                            _unreadable_exdate = True
                     except Exception:
-                        pass
+                        _unreadable_exdate = True
                     _ed_p = event.get_next_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
                 # Fallback: VALUE=DATE EXDATEs return null_time via get_exdate()
                 # in some libical-glib builds; parse them from the iCal string.
-                if not _exdates:
+                # Skipped when there are no EXDATE properties at all, so plain
+                # recurring series are not re-serialized for nothing.
+                if not _exdates and _unreadable_exdate:
                     try:
                         for _em in _EXDATE_DATE_RE.finditer(event.as_ical_string() or ""):
                             _exdates.add(_em.group(1))
@@ -195,7 +265,7 @@ class EventSanitizer:
                         pass
                 if _exdates:
                     _dts = _dts_prop.get_dtstart()
-                    _dts_date = f"{_dts.get_year():04d}{_dts.get_month():02d}{_dts.get_day():02d}"
+                    _dts_date = _date_key(_dts)
                     if _dts_date in _exdates:
                         try:
                             # Compute event duration so DTEND can be shifted by the
@@ -259,76 +329,69 @@ class EventSanitizer:
                                 )
                             except Exception:
                                 _dts_fl = _dts
+                            # Compare candidates as (y, m, d) int tuples so the
+                            # loop formats no strings; the EXDATE / UNTIL keys are
+                            # converted once up front.  A datetime is built only
+                            # for the accepted occurrence.
+                            _ex_keys = {(int(d[:4]), int(d[4:6]), int(d[6:8])) for d in _exdates}
+                            _until_key = (
+                                (
+                                    int(_adv_until_str[:4]),
+                                    int(_adv_until_str[4:6]),
+                                    int(_adv_until_str[6:8]),
+                                )
+                                if _adv_until_str
+                                else None
+                            )
                             _it = ICalGLib.RecurIterator.new(_rule, _dts_fl)
                             for _ in range(500):
                                 _occ = _it.next()
                                 if _occ is None or _occ.is_null_time():
                                     break
-                                _occ_date = (
-                                    f"{_occ.get_year():04d}"
-                                    f"{_occ.get_month():02d}"
-                                    f"{_occ.get_day():02d}"
-                                )
-                                if _adv_until_str and _occ_date > _adv_until_str:
+                                _occ_key = (_occ.get_year(), _occ.get_month(), _occ.get_day())
+                                if _until_key and _occ_key > _until_key:
                                     break  # Don't advance DTSTART past UNTIL
-                                if _occ_date not in _exdates:
-                                    # Build new DTSTART / DTEND strings, preserving TZID.
+                                if _occ_key not in _ex_keys:
+                                    # Build new DTSTART / DTEND, preserving TZID.
                                     _tzid_param = _dts_prop.get_first_parameter(
                                         ICalGLib.ParameterKind.TZID_PARAMETER
                                     )
                                     _occ_py = datetime.datetime(
-                                        _occ.get_year(),
-                                        _occ.get_month(),
-                                        _occ.get_day(),
+                                        *_occ_key,
                                         _occ.get_hour(),
                                         _occ.get_minute(),
                                         _occ.get_second(),
                                     )
                                     _new_dte_py = _occ_py + _dur
-                                    if _tzid_param:
-                                        _tz = _tzid_param.get_tzid()
-                                        _new_dts_str = (
-                                            f"DTSTART;TZID={_tz}:"
-                                            f"{_occ_py.year:04d}{_occ_py.month:02d}"
-                                            f"{_occ_py.day:02d}"
-                                            f"T{_occ_py.hour:02d}{_occ_py.minute:02d}"
-                                            f"{_occ_py.second:02d}"
-                                        )
-                                        _new_dte_str = (
-                                            f"DTEND;TZID={_tz}:"
-                                            f"{_new_dte_py.year:04d}{_new_dte_py.month:02d}"
-                                            f"{_new_dte_py.day:02d}"
-                                            f"T{_new_dte_py.hour:02d}{_new_dte_py.minute:02d}"
-                                            f"{_new_dte_py.second:02d}"
-                                        )
-                                    else:
-                                        _new_dts_str = (
-                                            f"DTSTART:"
-                                            f"{_occ_py.year:04d}{_occ_py.month:02d}"
-                                            f"{_occ_py.day:02d}"
-                                            f"T{_occ_py.hour:02d}{_occ_py.minute:02d}"
-                                            f"{_occ_py.second:02d}Z"
-                                        )
-                                        _new_dte_str = (
-                                            f"DTEND:"
-                                            f"{_new_dte_py.year:04d}{_new_dte_py.month:02d}"
-                                            f"{_new_dte_py.day:02d}"
-                                            f"T{_new_dte_py.hour:02d}{_new_dte_py.minute:02d}"
-                                            f"{_new_dte_py.second:02d}Z"
+                                    # Build the properties from ICalGLib.Time values
+                                    # directly — no iCal text round-trip through
+                                    # Property.new_from_string().  With a TZID the
+                                    # time stays floating and carries the parameter;
+                                    # without one it is written as UTC (trailing Z).
+                                    _tz = _tzid_param.get_tzid() if _tzid_param else None
+                                    _new_dts_prop = ICalGLib.Property.new_dtstart(
+                                        _new_time(_occ_py, utc=_tz is None)
+                                    )
+                                    if _tz:
+                                        _new_dts_prop.add_parameter(
+                                            ICalGLib.Parameter.new_tzid(_tz)
                                         )
                                     cls._remove_all_properties(
                                         event, ICalGLib.PropertyKind.DTSTART_PROPERTY
                                     )
-                                    event.add_property(
-                                        ICalGLib.Property.new_from_string(_new_dts_str)
-                                    )
+                                    event.add_property(_new_dts_prop)
                                     if _dte_prop:
+                                        _new_dte_prop = ICalGLib.Property.new_dtend(
+                                            _new_time(_new_dte_py, utc=_tz is None)
+                                        )
+                                        if _tz:
+                                            _new_dte_prop.add_parameter(
+                                                ICalGLib.Parameter.new_tzid(_tz)
+                                            )
                                         cls._remove_all_properties(
                                             event, ICalGLib.PropertyKind.DTEND_PROPERTY
                                         )
-                                        event.add_property(
-                                            ICalGLib.Property.new_from_string(_new_dte_str)
-                                        )
+                                        event.add_property(_new_dte_prop)
                                     break
                         except Exception:
                             pass  # On any error, leave DTSTART unchanged
@@ -347,41 +410,45 @@ class EventSanitizer:
                     _tz_norm = _tz_norm_p.get_tzid()
                     _dts_norm = _cur_dts_prop.get_dtstart()
                     _hms_norm = (
-                        f"T{_dts_norm.get_hour():02d}"
-                        f"{_dts_norm.get_minute():02d}"
-                        f"{_dts_norm.get_second():02d}"
+                        _dts_norm.get_hour(),
+                        _dts_norm.get_minute(),
+                        _dts_norm.get_second(),
                     )
-                    _date_exdates: set[str] = set()
+                    # Collect date-only EXDATEs in one walk, then remove them
+                    # (no get_first_property() restart after each removal).
+                    _date_exdates: set[tuple[int, int, int]] = set()
+                    _date_props = []
                     _ed_n = event.get_first_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
                     while _ed_n:
                         try:
                             _ed_t = _ed_n.get_exdate()
                             if _ed_t and not _ed_t.is_null_time() and _ed_t.is_date():
                                 _date_exdates.add(
-                                    f"{_ed_t.get_year():04d}"
-                                    f"{_ed_t.get_month():02d}"
-                                    f"{_ed_t.get_day():02d}"
-                                )
-                                event.remove_property(_ed_n)
-                                _ed_n = event.get_first_property(
-                                    ICalGLib.PropertyKind.EXDATE_PROPERTY
+                                    (_ed_t.get_year(), _ed_t.get_month(), _ed_t.get_day())
                                 )
-                                continue
+                                _date_props.append(_ed_n)
                         except Exception:
                             pass
                         _ed_n = event.get_next_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
-                    for _d in sorted(_date_exdates):
-                        event.add_property(
-                            ICalGLib.Property.new_from_string(
-                                f"EXDATE;TZID={_tz_norm}:{_d}{_hms_norm}"
-                            )
+                    for _ed_n in _date_props:
+                        event.remove_property(_ed_n)
+                    # One EXDATE property per date, built from ICalGLib.Time
+                    # rather than parsed from text.  A single comma-joined
+                    # multi-value line is not an option: libical splits it
+                    # on parse and Property.new_from_string() would keep only
+                    # the first date.
+                    for _ymd in sorted(_date_exdates):
+                        _ex_prop = ICalGLib.Property.new_exdate(
+                            _new_time(datetime.datetime(*_ymd, *_hms_norm), utc=False)
                         )
+                        _ex_prop.add_parameter(ICalGLib.Parameter.new_tzid(_tz_norm))
+                        event.add_property(_ex_prop)
 
             # Add metadata to identify this as a managed event
             # Use CATEGORIES property (X-properties and COMMENT are stripped by Microsoft 365)
             # First remove any existing CATEGORIES to avoid duplicates
             cls._remove_all_properties(event, ICalGLib.PropertyKind.CATEGORIES_PROPERTY)
-            categories_prop = ICalGLib.Property.new_categories("CALENDAR-SYNC-MANAGED")
+            categories_prop = ICalGLib.Property.new_categories(MANAGED_CATEGORY)
             event.add_property(categories_prop)
 
             # Embed source UID fingerprint for orphan recovery after a crash.
@@ -399,8 +466,9 @@ class EventSanitizer:
             cls._remove_all_properties(event, ICalGLib.PropertyKind.CLASS_PROPERTY)
             event.add_property(ICalGLib.Property.new_from_string("CLASS:PRIVATE"))
 
-        # Check if comp is a VCALENDAR or a VEVENT directly
-        if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
+        # Check if comp is a VCALENDAR or a VEVENT directly (single isa() call)
+        kind = comp.isa()
+        if kind == _VCALENDAR_KIND:
             # Strip the METHOD property from the VCALENDAR wrapper.
             # METHOD:CANCEL or METHOD:REQUEST causes Exchange to treat the
             # create request as a meeting response and attempt to look up the
@@ -409,11 +477,11 @@ class EventSanitizer:
             cls._remove_all_properties(comp, ICalGLib.PropertyKind.METHOD_PROPERTY)
 
             # Process all VEVENT components inside VCALENDAR
-            event = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
+            event = comp.get_first_component(_VEVENT_KIND)
             while event:
                 sanitize_vevent(event)
-                event = comp.get_next_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
-        elif comp.isa() == ICalGLib.ComponentKind.VEVENT_COMPONENT:
+                event = comp.get_next_component(_VEVENT_KIND)
+        elif kind == _VEVENT_KIND:
             # It's already a VEVENT, sanitize it directly
             sanitize_vevent(comp)
 
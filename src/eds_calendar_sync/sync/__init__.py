@@ -4,13 +4,9 @@ CalendarSynchronizer — thin orchestrator that delegates to sync submodules.
 
 import logging
 
-import gi
-
-gi.require_version("EDataServer", "1.2")
-from gi.repository import EDataServer
-
 from eds_calendar_sync.db import StateDatabase
 from eds_calendar_sync.eds_client import EDSCalendarClient
+from eds_calendar_sync.eds_client import get_source_registry
 from eds_calendar_sync.models import SyncConfig
 from eds_calendar_sync.models import SyncStats
 from eds_calendar_sync.sync.refresh import perform_clear
@@ -30,7 +26,7 @@ class CalendarSynchronizer:
     def run(self) -> SyncStats:
         """Execute the synchronization process."""
         self.logger.info("Connecting to Evolution Data Server...")
-        registry = EDataServer.SourceRegistry.new_sync(None)
+        registry = get_source_registry()
 
         work_client = EDSCalendarClient(registry, self.config.work_calendar_id)
         personal_client = EDSCalendarClient(registry, self.config.personal_calendar_id)
@@ -54,6 +50,10 @@ class CalendarSynchronizer:
             state_db.migrate_if_needed(self.config.refresh or self.config.clear)
 
             args = (self.config, self.stats, self.logger, work_client, personal_client, state_db)
+            if self.config.clear or self.config.sync_direction != "both":
+                # Only two-way runs keep the idle revisions current; any other
+                # run may change the state without the next two-way run noticing.
+                state_db.clear_idle_revisions()
 
             if self.config.clear:
                 perform_clear(*args)
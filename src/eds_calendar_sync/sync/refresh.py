@@ -2,18 +2,43 @@
 Refresh and clear operations — remove synced events from calendars.
 """
 
-import gi
-
-gi.require_version("GLib", "2.0")
-from gi.repository import GLib
-
 from eds_calendar_sync.db import StateDatabase
 from eds_calendar_sync.eds_client import EDSCalendarClient
-from eds_calendar_sync.models import CalendarSyncError
 from eds_calendar_sync.models import SyncConfig
 from eds_calendar_sync.models import SyncStats
-from eds_calendar_sync.sanitizer import EventSanitizer
-from eds_calendar_sync.sync.utils import parse_component
+from eds_calendar_sync.sync.utils import log_uid_batch
+
+# Events removed (and state rows forgotten) per commit. Keeps each SQLite write
+# transaction small and means a crash mid-refresh only repeats the last chunk.
+_DELETE_CHUNK_SIZE = 200
+
+
+def _remove_in_chunks(
+    logger,
+    client: EDSCalendarClient,
+    uids: list[str],
+    state_db: StateDatabase,
+    forget,
+) -> dict[str, Exception]:
+    """Remove uids chunk by chunk, committing the matching state deletions after each chunk.
+
+    forget is the StateDatabase method that drops rows for the UIDs in this
+    calendar (delete_by_source_uids or delete_by_target_uids). Rows for UIDs
+    whose removal failed are left for the caller's final clear_all().
+
+    Returns:
+        Mapping of UID → exception for every removal that failed.
+    """
+    failures: dict[str, Exception] = {}
+    for start in range(0, len(uids), _DELETE_CHUNK_SIZE):
+        chunk = uids[start : start + _DELETE_CHUNK_SIZE]
+        chunk_failures = client.remove_events(chunk)
+        failures.update(chunk_failures)
+        removed = [uid for uid in chunk if uid not in chunk_failures]
+        log_uid_batch(logger, "Deleted", removed)
+        forget(removed)
+        state_db.commit()
+    return failures
 
 
 def perform_refresh(
@@ -33,38 +58,35 @@ def perform_refresh(
     # If state DB is empty, fall back to metadata scanning
     if len(personal_uids_to_delete) == 0:
         logger.info("State database empty, scanning personal calendar for managed events...")
-        personal_events = personal_client.get_all_events()
-        for obj in personal_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                personal_uids_to_delete.append(comp.get_uid())
+        personal_uids_to_delete.extend(personal_client.query_managed_uids())
 
         if len(personal_uids_to_delete) > 0:
             logger.info(f"Found {len(personal_uids_to_delete)} managed events via metadata scan")
         else:
             logger.info("No managed events found - calendars are clean")
 
+    # A corrupt state DB can map several rows to one UID; removing it twice
+    # costs a D-Bus round trip and a spurious failure, so dedupe (order kept).
+    personal_uids_to_delete = list(dict.fromkeys(personal_uids_to_delete))
+
     if config.dry_run:
         logger.info(
             f"[DRY RUN] Would delete {len(personal_uids_to_delete)} synced events "
             f"from personal calendar"
         )
         logger.info("[DRY RUN] Would clear state database")
-        for uid in personal_uids_to_delete:
-            logger.debug(f"[DRY RUN] Would delete: {uid}")
+        log_uid_batch(logger, "[DRY RUN] Would delete", personal_uids_to_delete)
         return
 
-    # Remove only events WE created (in state DB)
-    deleted_count = 0
-    for personal_uid in personal_uids_to_delete:
-        try:
-            personal_client.remove_event(personal_uid)
-            deleted_count += 1
-            logger.debug(f"Deleted synced event: {personal_uid}")
-        except (GLib.Error, CalendarSyncError) as e:
-            logger.debug(f"Failed to remove {personal_uid}: {e}")
-
-    # Clear state database
+    # Remove only events WE created (in state DB), committing state per chunk
+    failures = _remove_in_chunks(
+        logger, personal_client, personal_uids_to_delete, state_db, state_db.delete_by_target_uids
+    )
+    for personal_uid, e in failures.items():
+        logger.debug(f"Failed to remove {personal_uid}: {e}")
+    deleted_count = len(personal_uids_to_delete) - len(failures)
+
+    # Clear whatever state is left (rows for removals that failed)
     state_db.clear_all()
     state_db.commit()
 
@@ -103,18 +125,10 @@ def perform_refresh_two_way(
         logger.info("State database empty, scanning calendars for managed events...")
 
         # Scan work calendar
-        work_events = work_client.get_all_events()
-        for obj in work_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                work_uids_to_delete.append(comp.get_uid())
+        work_uids_to_delete.extend(work_client.query_managed_uids())
 
         # Scan personal calendar
-        personal_events = personal_client.get_all_events()
-        for obj in personal_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                personal_uids_to_delete.append(comp.get_uid())
+        personal_uids_to_delete.extend(personal_client.query_managed_uids())
 
         if len(work_uids_to_delete) > 0 or len(personal_uids_to_delete) > 0:
             logger.info(
@@ -124,6 +138,10 @@ def perform_refresh_two_way(
         else:
             logger.info("No managed events found - calendars are clean")
 
+    # Dedupe (order kept) so a UID tracked by several rows is removed only once
+    work_uids_to_delete = list(dict.fromkeys(work_uids_to_delete))
+    personal_uids_to_delete = list(dict.fromkeys(personal_uids_to_delete))
+
     if config.dry_run:
         logger.info(
             f"[DRY RUN] Would delete {len(work_uids_to_delete)} synced events from work calendar"
@@ -136,26 +154,22 @@ def perform_refresh_two_way(
         return
 
     # Remove events WE created in work calendar
-    work_deleted = 0
-    for work_uid in work_uids_to_delete:
-        try:
-            work_client.remove_event(work_uid)
-            work_deleted += 1
-            logger.debug(f"Deleted synced event from work: {work_uid}")
-        except (GLib.Error, CalendarSyncError) as e:
-            logger.debug(f"Failed to remove work event {work_uid}: {e}")
+    work_failures = _remove_in_chunks(
+        logger, work_client, work_uids_to_delete, state_db, state_db.delete_by_source_uids
+    )
+    for work_uid, e in work_failures.items():
+        logger.debug(f"Failed to remove work event {work_uid}: {e}")
+    work_deleted = len(work_uids_to_delete) - len(work_failures)
 
     # Remove events WE created in personal calendar
-    personal_deleted = 0
-    for personal_uid in personal_uids_to_delete:
-        try:
-            personal_client.remove_event(personal_uid)
-            personal_deleted += 1
-            logger.debug(f"Deleted synced event from personal: {personal_uid}")
-        except (GLib.Error, CalendarSyncError) as e:
-            logger.debug(f"Failed to remove personal event {personal_uid}: {e}")
-
-    # Clear state database
+    personal_failures = _remove_in_chunks(
+        logger, personal_client, personal_uids_to_delete, state_db, state_db.delete_by_target_uids
+    )
+    for personal_uid, e in personal_failures.items():
+        logger.debug(f"Failed to remove personal event {personal_uid}: {e}")
+    personal_deleted = len(personal_uids_to_delete) - len(personal_failures)
+
+    # Clear whatever state is left (rows for removals that failed)
     state_db.clear_all()
     state_db.commit()
 
@@ -182,37 +196,33 @@ def perform_refresh_to_work(
     # If state DB is empty, fall back to metadata scanning
     if len(work_uids_to_delete) == 0:
         logger.info("State database empty, scanning work calendar for managed events...")
-        work_events = work_client.get_all_events()
-        for obj in work_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                work_uids_to_delete.append(comp.get_uid())
+        work_uids_to_delete.extend(work_client.query_managed_uids())
 
         if len(work_uids_to_delete) > 0:
             logger.info(f"Found {len(work_uids_to_delete)} managed events via metadata scan")
         else:
             logger.info("No managed events found - work calendar is clean")
 
+    # Dedupe (order kept) so a UID tracked by several rows is removed only once
+    work_uids_to_delete = list(dict.fromkeys(work_uids_to_delete))
+
     if config.dry_run:
         logger.info(
             f"[DRY RUN] Would delete {len(work_uids_to_delete)} synced events from work calendar"
         )
         logger.info("[DRY RUN] Would clear state database")
-        for uid in work_uids_to_delete:
-            logger.debug(f"[DRY RUN] Would delete: {uid}")
+        log_uid_batch(logger, "[DRY RUN] Would delete", work_uids_to_delete)
         return
 
-    # Remove only events WE created (in state DB)
-    deleted_count = 0
-    for work_uid in work_uids_to_delete:
-        try:
-            work_client.remove_event(work_uid)
-            deleted_count += 1
-            logger.debug(f"Deleted synced event from work: {work_uid}")
-        except (GLib.Error, CalendarSyncError) as e:
-            logger.debug(f"Failed to remove {work_uid}: {e}")
-
-    # Clear state database
+    # Remove only events WE created (in state DB), committing state per chunk
+    failures = _remove_in_chunks(
+        logger, work_client, work_uids_to_delete, state_db, state_db.delete_by_source_uids
+    )
+    for work_uid, e in failures.items():
+        logger.debug(f"Failed to remove {work_uid}: {e}")
+    deleted_count = len(work_uids_to_delete) - len(failures)
+
+    # Clear whatever state is left (rows for removals that failed)
     state_db.clear_all()
     state_db.commit()
 
@@ -237,20 +247,12 @@ def perform_clear(
     if config.sync_direction in ("both", "to-work"):
         # We create events in work calendar when syncing to work
         logger.info("Scanning work calendar for managed events...")
-        work_events = work_client.get_all_events()
-        for obj in work_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                work_managed.append(comp.get_uid())
+        work_managed = work_client.query_managed_uids()
 
     if config.sync_direction in ("both", "to-personal"):
         # We create events in personal calendar when syncing to personal
         logger.info("Scanning personal calendar for managed events...")
-        personal_events = personal_client.get_all_events()
-        for obj in personal_events:
-            comp = parse_component(obj)
-            if EventSanitizer.is_managed_event(comp):
-                personal_managed.append(comp.get_uid())
+        personal_managed = personal_client.query_managed_uids()
 
     total_to_delete = len(work_managed) + len(personal_managed)
 
@@ -268,38 +270,33 @@ def perform_clear(
     if config.dry_run:
         logger.info(f"[DRY RUN] Would delete {total_to_delete} total managed events")
         logger.info("[DRY RUN] Would clear state database")
-        if config.verbose:
-            for uid in work_managed:
-                logger.debug(f"[DRY RUN] Would delete work event: {uid}")
-            for uid in personal_managed:
-                logger.debug(f"[DRY RUN] Would delete personal event: {uid}")
+        log_uid_batch(logger, "[DRY RUN] Would delete work", work_managed)
+        log_uid_batch(logger, "[DRY RUN] Would delete personal", personal_managed)
         return
 
     # Delete managed events from work calendar (if applicable)
     work_deleted = 0
     if config.sync_direction in ("both", "to-work"):
-        for uid in work_managed:
-            try:
-                work_client.remove_event(uid)
-                work_deleted += 1
-                logger.debug(f"Deleted work event: {uid}")
-            except (GLib.Error, CalendarSyncError) as e:
-                logger.error(f"Failed to delete work event {uid}: {e}")
-                stats.errors += 1
+        failures = _remove_in_chunks(
+            logger, work_client, work_managed, state_db, state_db.delete_by_source_uids
+        )
+        for uid, e in failures.items():
+            logger.error(f"Failed to delete work event {uid}: {e}")
+            stats.errors += 1
+        work_deleted = len(work_managed) - len(failures)
 
     # Delete managed events from personal calendar (if applicable)
     personal_deleted = 0
     if config.sync_direction in ("both", "to-personal"):
-        for uid in personal_managed:
-            try:
-                personal_client.remove_event(uid)
-                personal_deleted += 1
-                logger.debug(f"Deleted personal event: {uid}")
-            except (GLib.Error, CalendarSyncError) as e:
-                logger.error(f"Failed to delete personal event {uid}: {e}")
-                stats.errors += 1
-
-    # Clear state database
+        failures = _remove_in_chunks(
+            logger, personal_client, personal_managed, state_db, state_db.delete_by_target_uids
+        )
+        for uid, e in failures.items():
+            logger.error(f"Failed to delete personal event {uid}: {e}")
+            stats.errors += 1
+        personal_deleted = len(personal_managed) - len(failures)
+
+    # Clear whatever state is left (rows for removals that failed)
     state_db.clear_all()
     state_db.commit()
 
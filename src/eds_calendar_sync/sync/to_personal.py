@@ -18,17 +18,43 @@ from eds_calendar_sync.models import SyncConfig
 from eds_calendar_sync.models import SyncStats
 from eds_calendar_sync.sanitizer import EventSanitizer
 from eds_calendar_sync.sync.refresh import perform_refresh
+from eds_calendar_sync.sync.utils import COMMIT_BATCH_SIZE
 from eds_calendar_sync.sync.utils import build_orphan_index
-from eds_calendar_sync.sync.utils import compute_hash
+from eds_calendar_sync.sync.utils import compute_component_hash
 from eds_calendar_sync.sync.utils import compute_sanitizer_hash
 from eds_calendar_sync.sync.utils import compute_source_fingerprint
 from eds_calendar_sync.sync.utils import has_valid_occurrences
+from eds_calendar_sync.sync.utils import ical_date_key
+from eds_calendar_sync.sync.utils import ical_datetime_tuple
 from eds_calendar_sync.sync.utils import is_declined_by_user
 from eds_calendar_sync.sync.utils import is_event_cancelled
 from eds_calendar_sync.sync.utils import is_free_time
 from eds_calendar_sync.sync.utils import is_not_found_error
+from eds_calendar_sync.sync.utils import log_uid_batch
 from eds_calendar_sync.sync.utils import parse_component
-from eds_calendar_sync.sync.utils import strip_exdates_for_dates
+from eds_calendar_sync.sync.utils import remove_exdates_for_dates
+
+# Property kinds used in the per-event loops, hoisted to module scope so each
+# lookup is a plain global read instead of a GI attribute resolution.
+_RECURRENCEID_PROP = ICalGLib.PropertyKind.RECURRENCEID_PROPERTY
+_DTSTART_PROP = ICalGLib.PropertyKind.DTSTART_PROPERTY
+
+
+def _sanitize(
+    config: SyncConfig, ical_str: str, personal_uid: str, work_uid: str
+) -> ICalGLib.Component:
+    """Sanitize a work event for the personal calendar under personal_uid.
+
+    Binds the config-derived sanitizer options in one place, so the create,
+    update and recreate paths cannot drift apart.
+    """
+    return EventSanitizer.sanitize(
+        ical_str,
+        personal_uid,
+        keep_reminders=config.keep_reminders,
+        source_uid=work_uid,
+        private_work_sync=config.private_work_sync,
+    )
 
 
 def _process_creates(
@@ -38,12 +64,16 @@ def _process_creates(
     work_uid: str,
     ical_str: str,
     obj_hash: str,
-    personal_client: EDSCalendarClient,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
     state_db: StateDatabase,
-    orphan_index: dict[str, str] | None = None,
+    orphan_index: dict[str, ICalGLib.Component] | None = None,
     sanitizer_hash: str | None = None,
 ):
-    """Handle creation of new events in personal calendar."""
+    """Handle creation of new events in personal calendar.
+
+    The sanitized event is queued on pending_creates as (work_uid, work_hash,
+    component); _flush_creates() sends the queue to EDS in one batch.
+    """
     personal_uid = str(uuid.uuid4())
 
     if config.dry_run:
@@ -51,22 +81,18 @@ def _process_creates(
         stats.added += 1
         return
 
-    sanitized = None
-
     # Check orphan index: a previous crash may have created this event in the
     # target calendar without committing the DB record.  Recover by registering
-    # the existing event instead of creating a duplicate.
-    if orphan_index is not None:
+    # the existing event instead of creating a duplicate.  The index is empty
+    # on almost every run, and then no fingerprint is computed at all.
+    if orphan_index:
         fingerprint = compute_source_fingerprint(work_uid)
         if fingerprint in orphan_index:
-            existing_uid = orphan_index[fingerprint]
+            recovered = orphan_index[fingerprint]
+            existing_uid = recovered.get_uid()
             logger.info(f"Recovering orphan: {work_uid} → {existing_uid}")
-            work_hash = compute_hash(ical_str)
-            recovered = personal_client.get_event(existing_uid)
-            if recovered:
-                personal_hash = compute_hash(recovered.as_ical_string())
-            else:
-                personal_hash = work_hash
+            work_hash = obj_hash
+            personal_hash = compute_component_hash(recovered)
             state_db.insert_bidirectional(
                 work_uid,
                 existing_uid,
@@ -75,60 +101,67 @@ def _process_creates(
                 "source",
                 sanitizer_hash=sanitizer_hash,
             )
-            state_db.commit()
             stats.added += 1
             return
 
     try:
-        sanitized = EventSanitizer.sanitize(
-            ical_str,
-            personal_uid,
-            keep_reminders=config.keep_reminders,
-            source_uid=work_uid,
-            private_work_sync=config.private_work_sync,
-        )
+        sanitized = _sanitize(config, ical_str, personal_uid, work_uid)
+    except (GLib.Error, CalendarSyncError) as e:
+        logger.error(f"Failed to create event {work_uid}: {e}")
+        stats.errors += 1
+        return
 
-        # Debug: Show sanitized output
-        if config.verbose:
-            sanitized_str = sanitized.as_ical_string()
-            logger.debug(f"Sanitized iCal:\n{sanitized_str}")
-
-        # Create event and get the ACTUAL UID assigned by the server
-        # (Microsoft 365 will rewrite the UID, so we must use what's returned)
-        actual_personal_uid = personal_client.create_event(sanitized)
-
-        # Use the actual UID if returned, otherwise fall back to our generated one
-        if actual_personal_uid:
-            personal_uid = actual_personal_uid
-            logger.debug(f"Server assigned UID: {personal_uid}")
-
-        # Fetch the event back to get the actual stored version and compute both hashes
-        work_hash = compute_hash(ical_str)
-        created_personal = personal_client.get_event(personal_uid)
-        if created_personal:
-            personal_hash = compute_hash(created_personal.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            personal_hash = compute_hash(sanitized.as_ical_string())
+    # Debug: Show sanitized output
+    if config.verbose:
+        sanitized_str = sanitized.as_ical_string()
+        logger.debug(f"Sanitized iCal:\n{sanitized_str}")
 
-        state_db.insert_bidirectional(
-            work_uid,
-            personal_uid,
-            work_hash,
-            personal_hash,
-            "source",
-            sanitizer_hash=sanitizer_hash,
-        )
-        state_db.commit()
-        stats.added += 1
-        logger.debug(f"Created event {work_uid} as {personal_uid}")
-    except (GLib.Error, CalendarSyncError) as e:
-        if sanitized is not None:
+    pending_creates.append((work_uid, obj_hash, sanitized))
+
+
+def _flush_creates(
+    config: SyncConfig,
+    stats: SyncStats,
+    logger,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
+    personal_client: EDSCalendarClient,
+    state_db: StateDatabase,
+    sanitizer_hash: str | None = None,
+):
+    """Create every queued personal event with one batched EDS call, then record state.
+
+    Replaces a synchronous create_event() D-Bus round trip per event.  The
+    queue is emptied; callers flush it right before each state commit so an
+    interrupted run leaves at most one batch for the orphan index to re-link.
+    """
+    if not pending_creates:
+        return
+
+    # Create events and get the ACTUAL UIDs assigned by the server
+    # (Microsoft 365 will rewrite the UID, so we must use what's returned)
+    results = personal_client.create_events([sanitized for _, _, sanitized in pending_creates])
+
+    rows: list[tuple[str, str, str, str]] = []
+    for (work_uid, work_hash, sanitized), result in zip(pending_creates, results, strict=True):
+        if isinstance(result, Exception):
             logger.warning(
                 f"Sanitized iCal for failed event {work_uid}:\n{sanitized.as_ical_string()}"
             )
-        logger.error(f"Failed to create event {work_uid}: {e}")
-        stats.errors += 1
+            logger.error(f"Failed to create event {work_uid}: {result}")
+            stats.errors += 1
+            continue
+
+        personal_uid = result
+        # One-way work→personal sync never compares the personal hash, so the
+        # sent copy is hashed rather than fetched back (no D-Bus round trip).
+        # If the server rewrote the event, a later two-way run sees one
+        # spurious "personal edited" mismatch and re-syncs it once.
+        personal_hash = compute_component_hash(sanitized)
+        rows.append((work_uid, personal_uid, work_hash, personal_hash))
+        stats.added += 1
+        logger.debug(f"Created event {work_uid} as {personal_uid}")
+    state_db.insert_bidirectional_many(rows, "source", sanitizer_hash=sanitizer_hash)
+    pending_creates.clear()
 
 
 def _process_updates(
@@ -150,23 +183,11 @@ def _process_updates(
         return
 
     try:
-        sanitized = EventSanitizer.sanitize(
-            ical_str,
-            personal_uid,
-            keep_reminders=config.keep_reminders,
-            source_uid=work_uid,
-            private_work_sync=config.private_work_sync,
-        )
+        sanitized = _sanitize(config, ical_str, personal_uid, work_uid)
         personal_client.modify_event(sanitized)
 
-        # Fetch the event back to get the actual stored version
-        work_hash = compute_hash(ical_str)
-        updated_personal = personal_client.get_event(personal_uid)
-        if updated_personal:
-            personal_hash = compute_hash(updated_personal.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            personal_hash = compute_hash(sanitized.as_ical_string())
+        work_hash = obj_hash
+        personal_hash = compute_component_hash(sanitized)
 
         state_db.update_hashes(
             work_uid,
@@ -175,7 +196,6 @@ def _process_updates(
             personal_hash,
             sanitizer_hash=sanitizer_hash,
         )
-        state_db.commit()
         stats.modified += 1
         logger.debug(f"Updated event {work_uid}")
     except (GLib.Error, CalendarSyncError) as e:
@@ -202,28 +222,19 @@ def _process_updates(
 
             # Create new with fresh UUID (will be rewritten by server)
             new_uid = str(uuid.uuid4())
-            sanitized = EventSanitizer.sanitize(
-                ical_str,
-                new_uid,
-                keep_reminders=config.keep_reminders,
-                source_uid=work_uid,
-                private_work_sync=config.private_work_sync,
-            )
+            sanitized = _sanitize(config, ical_str, new_uid, work_uid)
             actual_uid = personal_client.create_event(sanitized)
 
             # Update state with new UID if returned
             if actual_uid:
                 new_uid = actual_uid
 
-            # Fetch back and compute both hashes
-            work_hash = compute_hash(ical_str)
-            created_personal = personal_client.get_event(new_uid)
-            if created_personal:
-                personal_hash = compute_hash(created_personal.as_ical_string())
-            else:
-                personal_hash = compute_hash(sanitized.as_ical_string())
+            work_hash = obj_hash
+            personal_hash = compute_component_hash(sanitized)
 
-            # Update state DB with new personal UID
+            # Update state DB with new personal UID.  Committed immediately
+            # (not batched): the update path has no orphan recovery, so losing
+            # this row would leave the recreated event untracked.
             state_db.delete(work_uid)
             state_db.insert_bidirectional(
                 work_uid,
@@ -251,34 +262,48 @@ def _process_deletions(
     state_db: StateDatabase,
 ):
     """Handle deletion of events removed from work calendar."""
-    for work_uid in list(state.keys()):
-        if work_uid not in work_uids_seen:
+    # state is already in memory, so the stale set is a C-level set difference
+    # rather than a per-key Python membership test or another DB round trip.
+    stale_uids = sorted(state.keys() - work_uids_seen)
+    if not stale_uids:
+        return
+
+    if config.dry_run:
+        for work_uid in stale_uids:
             personal_uid = state[work_uid]["target_uid"]
+            logger.info(f"[DRY RUN] Would DELETE event: {work_uid} (personal: {personal_uid})")
+        stats.deleted += len(stale_uids)
+        return
 
-            if config.dry_run:
-                logger.info(f"[DRY RUN] Would DELETE event: {work_uid} (personal: {personal_uid})")
-                stats.deleted += 1
-                continue
+    # One batched EDS call per chunk instead of a D-Bus round trip per event.
+    personal_uids = [state[work_uid]["target_uid"] for work_uid in stale_uids]
+    logger.debug(f"Removing {len(personal_uids)} personal events")
+    failures = personal_client.remove_events(personal_uids)
 
-            logger.debug(f"Attempting to delete personal event with UID: {personal_uid}")
-            try:
-                personal_client.remove_event(personal_uid)
-                logger.debug(f"Successfully deleted event {work_uid} (personal: {personal_uid})")
-            except (GLib.Error, CalendarSyncError) as e:
-                if is_not_found_error(e):
-                    # Already gone externally — state DB cleanup still needed
-                    logger.debug(
-                        f"Personal event {personal_uid} already gone (externally deleted);"
-                        f" cleaning up state for work event {work_uid}"
-                    )
-                else:
-                    logger.error(f"Failed to delete {personal_uid}: {e}")
-                    stats.errors += 1
-                    continue
+    forgotten: list[str] = []
+    for work_uid, personal_uid in zip(stale_uids, personal_uids, strict=True):
+        e = failures.get(personal_uid)
+        if e is not None and is_not_found_error(e):
+            # Already gone externally — state DB cleanup still needed
+            logger.debug(
+                f"Personal event {personal_uid} already gone (externally deleted);"
+                f" cleaning up state for work event {work_uid}"
+            )
+        elif e is not None:
+            logger.error(f"Failed to delete {personal_uid}: {e}")
+            stats.errors += 1
+            continue
 
-            state_db.delete(work_uid)
-            state_db.commit()
-            stats.deleted += 1
+        forgotten.append(work_uid)
+        stats.deleted += 1
+
+    log_uid_batch(logger, "Removed personal mirrors for", forgotten)
+
+    # Drop all the state rows in one statement.  If the run dies before this,
+    # the next run retries the removals, gets "not found" and cleans up then.
+    if forgotten:
+        state_db.delete_by_source_uids(forgotten)
+        state_db.commit()
 
 
 def run_one_way_to_personal(
@@ -304,21 +329,12 @@ def run_one_way_to_personal(
         logger.info("Scanning personal calendar for orphaned managed events...")
         orphan_index = build_orphan_index(personal_client, state_db, logger)
 
-        # Fetch work events
+        # Fetch work events.  Managed "Busy" blocks (synced from personal) are
+        # filtered out inside EDS, so they are never transferred or parsed.
         logger.info("Fetching work events...")
-        work_events_list = work_client.get_all_events()
+        work_events_list = work_client.get_unmanaged_events()
         work_events: dict[str, ICalGLib.Component] = {}
 
-        # First pass: collect master VEVENTs
-        for _obj in work_events_list:
-            _comp = parse_component(_obj)
-            if _comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY):
-                continue
-            _uid = _comp.get_uid()
-            if _uid:
-                work_events[_uid] = _comp
-
-        # Second pass: analysis of exception VEVENTs.
         # Build a map from work UID → set of YYYYMMDD dates that have a valid
         # (non-managed, non-cancelled, non-free) exception VEVENT.  Exchange
         # stores every explicitly-defined recurring occurrence as both an EXDATE
@@ -326,11 +342,28 @@ def run_one_way_to_personal(
         # Those "phantom" EXDATEs suppress GNOME Calendar display even though the
         # occurrences are real meetings.  We strip them when writing to personal.
         work_valid_exception_dates: dict[str, set[str]] = {}
+        # Single pass: each object is parsed and probed for RECURRENCE-ID once;
+        # masters go straight into work_events, exceptions are analysed inline.
         for _obj in work_events_list:
             _comp = parse_component(_obj)
-            _rid_prop = _comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY)
+            _rid_prop = _comp.get_first_property(_RECURRENCEID_PROP)
+            _uid = _comp.get_uid()
             if not _rid_prop:
-                continue  # master VEVENT — handled above
+                # Masters are classified here, once: the main loop below only
+                # ever sees syncable events.  Managed "Busy" blocks are already
+                # excluded by EDS; the local check stays as a safety net against
+                # duplicates and UNIQUE constraint violations.
+                if not _uid:
+                    continue
+                if EventSanitizer.is_managed_event(_comp):
+                    logger.debug(f"Skipping managed event: {_uid}")
+                elif is_event_cancelled(_comp):
+                    logger.debug(f"Skipping cancelled event: {_uid}")
+                elif is_free_time(_comp):
+                    logger.debug(f"Skipping transparent (free-time) event: {_uid}")
+                else:
+                    work_events[_uid] = _comp
+                continue
             if EventSanitizer.is_managed_event(_comp):
                 continue
             if is_event_cancelled(_comp):
@@ -340,25 +373,20 @@ def run_one_way_to_personal(
             # Exchange doesn't set TRANSP:TRANSPARENT on declined exception VEVENTs.
             # Detect via PARTSTAT=DECLINED on the owner's ATTENDEE entry.
             if config.work_account_email and is_declined_by_user(_comp, config.work_account_email):
-                logger.debug("Skipping declined exception VEVENT uid=%s", _comp.get_uid())
+                logger.debug("Skipping declined exception VEVENT uid=%s", _uid)
                 continue
-            _uid = _comp.get_uid()
             if not _uid:
                 continue
             try:
                 _rid_t = _rid_prop.get_recurrenceid()
-                _rid_date = f"{_rid_t.get_year():04d}{_rid_t.get_month():02d}{_rid_t.get_day():02d}"
+                _rid_date = ical_date_key(_rid_t)
                 # Detect rescheduled occurrences: DTSTART ≠ RECURRENCE-ID by date or time.
-                _dts_prop = _comp.get_first_property(ICalGLib.PropertyKind.DTSTART_PROPERTY)
+                _dts_prop = _comp.get_first_property(_DTSTART_PROP)
                 _is_rescheduled = False
                 if _dts_prop:
-                    _dts = _dts_prop.get_dtstart()
-                    _dts_date = f"{_dts.get_year():04d}{_dts.get_month():02d}{_dts.get_day():02d}"
-                    _h, _m, _s = _rid_t.get_hour(), _rid_t.get_minute(), _rid_t.get_second()
-                    _rid_time = f"T{_h:02d}{_m:02d}{_s:02d}"
-                    _h, _m, _s = _dts.get_hour(), _dts.get_minute(), _dts.get_second()
-                    _dts_time = f"T{_h:02d}{_m:02d}{_s:02d}"
-                    _is_rescheduled = (_dts_date != _rid_date) or (_dts_time != _rid_time)
+                    _is_rescheduled = ical_datetime_tuple(
+                        _dts_prop.get_dtstart()
+                    ) != ical_datetime_tuple(_rid_t)
                 if _is_rescheduled:
                     # Rescheduled: treat as a standalone event keyed by compound UID.
                     _rid_str = _rid_t.as_ical_string()
@@ -378,58 +406,51 @@ def run_one_way_to_personal(
         # Process each work event
         logger.info(f"Processing {len(work_events)} work events...")
         work_uids_seen: set[str] = set()
+        pending_writes = 0
+        pending_creates: list[tuple[str, str, ICalGLib.Component]] = []
 
         for work_uid, comp in work_events.items():
-            base_uid = comp.get_uid()
-
-            # Skip events we created ourselves (managed events in the work
-            # calendar are "Busy" blocks synced from personal by --only-to-work
-            # or --both).  Re-syncing them to personal would create circular
-            # duplicates and trigger a UNIQUE constraint violation.
-            if EventSanitizer.is_managed_event(comp):
-                logger.debug(f"Skipping managed event: {base_uid}")
-                continue
-
-            # Skip cancelled events entirely.
-            if is_event_cancelled(comp):
-                logger.debug(f"Skipping cancelled event: {base_uid}")
-                continue
-
-            # Skip transparent (free-time) events.
-            if is_free_time(comp):
-                logger.debug(f"Skipping transparent (free-time) event: {base_uid}")
-                continue
+            # Managed, cancelled and free-time masters were dropped while
+            # parsing; only the RRULE expansion in has_valid_occurrences is
+            # left, and it runs after EXDATE stripping below.
 
             # Skip recurring events where every occurrence is excluded by EXDATE.
-            # Check against the stripped iCal so that series whose EXDATEs
+            # Check against the stripped event so that series whose EXDATEs
             # are all "phantom" (covered by valid exception VEVENTs) are
             # not incorrectly skipped.
-            _valid_ex_dates = work_valid_exception_dates.get(work_uid, set())
+            # The phantom EXDATEs are removed from a clone of the parsed
+            # component rather than by serializing, editing the text and
+            # parsing it back; the clone is also what gets hashed and synced.
+            _valid_ex_dates = work_valid_exception_dates.get(work_uid)
             if _valid_ex_dates:
-                _stripped = ICalGLib.Component.new_from_string(
-                    strip_exdates_for_dates(comp.as_ical_string(), _valid_ex_dates)
-                )
-                _has_valid = has_valid_occurrences(_stripped)
+                _hash_comp = remove_exdates_for_dates(comp.clone(), _valid_ex_dates)
             else:
-                _has_valid = has_valid_occurrences(comp)
+                _hash_comp = comp
+            _has_valid = has_valid_occurrences(_hash_comp)
 
             if not _has_valid:
                 logger.debug(
                     f"Skipping empty recurring series "
-                    f"(all occurrences excluded by EXDATE): {base_uid}"
+                    f"(all occurrences excluded by EXDATE): {work_uid}"
                 )
                 continue
 
             work_uids_seen.add(work_uid)
 
-            ical_str = comp.as_ical_string()
-            # Strip phantom EXDATEs before hashing and syncing.
-            if work_uid in work_valid_exception_dates:
-                ical_str = strip_exdates_for_dates(ical_str, work_valid_exception_dates[work_uid])
+            # Hash the component checked above: the original or the stripped
+            # clone.  It is serialized only if it has to be created or updated.
+            obj_hash = compute_component_hash(_hash_comp)
+
+            _record = state.get(work_uid)
+            if _record is not None and (
+                obj_hash == _record["hash"]
+                and current_sanitizer_hash == (_record.get("sanitizer_hash") or "")
+            ):
+                continue  # Unchanged since the last sync
 
-            obj_hash = compute_hash(ical_str)
+            ical_str = _hash_comp.as_ical_string()
 
-            if work_uid not in state:
+            if _record is None:
                 # CREATE
                 _process_creates(
                     config,
@@ -438,14 +459,12 @@ def run_one_way_to_personal(
                     work_uid,
                     ical_str,
                     obj_hash,
-                    personal_client,
+                    pending_creates,
                     state_db,
                     orphan_index=orphan_index,
                     sanitizer_hash=current_sanitizer_hash,
                 )
-            elif obj_hash != state[work_uid]["hash"] or current_sanitizer_hash != (
-                state[work_uid].get("sanitizer_hash") or ""
-            ):
+            else:
                 # UPDATE (work event changed OR sanitizer parameters changed)
                 _process_updates(
                     config,
@@ -454,11 +473,35 @@ def run_one_way_to_personal(
                     work_uid,
                     ical_str,
                     obj_hash,
-                    state[work_uid]["target_uid"],
+                    _record["target_uid"],
+                    personal_client,
+                    state_db,
+                    sanitizer_hash=current_sanitizer_hash,
+                )
+
+            pending_writes += 1
+            if pending_writes >= COMMIT_BATCH_SIZE and not config.dry_run:
+                _flush_creates(
+                    config,
+                    stats,
+                    logger,
+                    pending_creates,
                     personal_client,
                     state_db,
                     sanitizer_hash=current_sanitizer_hash,
                 )
+                state_db.commit()
+                pending_writes = 0
+
+        _flush_creates(
+            config,
+            stats,
+            logger,
+            pending_creates,
+            personal_client,
+            state_db,
+            sanitizer_hash=current_sanitizer_hash,
+        )
 
         # Process deletions
         logger.info("Checking for deletions...")
@@ -6,8 +6,10 @@ import uuid
 
 import gi
 
+gi.require_version("ICalGLib", "3.0")
 gi.require_version("GLib", "2.0")
 from gi.repository import GLib
+from gi.repository import ICalGLib
 
 from eds_calendar_sync.db import StateDatabase
 from eds_calendar_sync.eds_client import EDSCalendarClient
@@ -16,13 +18,32 @@ from eds_calendar_sync.models import SyncConfig
 from eds_calendar_sync.models import SyncStats
 from eds_calendar_sync.sanitizer import EventSanitizer
 from eds_calendar_sync.sync.refresh import perform_refresh_to_work
+from eds_calendar_sync.sync.utils import COMMIT_BATCH_SIZE
 from eds_calendar_sync.sync.utils import build_orphan_index
-from eds_calendar_sync.sync.utils import compute_hash
+from eds_calendar_sync.sync.utils import compute_component_hash
 from eds_calendar_sync.sync.utils import compute_source_fingerprint
 from eds_calendar_sync.sync.utils import is_not_found_error
+from eds_calendar_sync.sync.utils import log_uid_batch
 from eds_calendar_sync.sync.utils import parse_component
 
 
+def _sanitize_busy(
+    config: SyncConfig, ical_str: str, work_uid: str, personal_uid: str
+) -> ICalGLib.Component:
+    """Sanitize a personal event into a work "Busy" block under work_uid.
+
+    Binds the busy mode and config-derived sanitizer options in one place, so
+    the create, update and recreate paths cannot drift apart.
+    """
+    return EventSanitizer.sanitize(
+        ical_str,
+        work_uid,
+        mode="busy",
+        keep_reminders=config.keep_reminders,
+        source_uid=personal_uid,
+    )
+
+
 def _process_creates_to_work(
     config: SyncConfig,
     stats: SyncStats,
@@ -30,11 +51,16 @@ def _process_creates_to_work(
     personal_uid: str,
     ical_str: str,
     obj_hash: str,
-    work_client: EDSCalendarClient,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
     state_db: StateDatabase,
-    orphan_index: dict[str, str] | None = None,
+    orphan_index: dict[str, ICalGLib.Component] | None = None,
 ):
-    """Handle creation of new events in work calendar from personal."""
+    """Handle creation of new events in work calendar from personal.
+
+    The sanitized event is queued on pending_creates as (personal_uid,
+    personal_hash, component); _flush_creates_to_work() sends the queue to
+    EDS in one batch.
+    """
     work_uid = str(uuid.uuid4())
 
     if config.dry_run:
@@ -45,63 +71,72 @@ def _process_creates_to_work(
     # Check orphan index: a previous crash may have created this event in the
     # target calendar without committing the DB record.  Recover by registering
     # the existing event instead of creating a duplicate.
-    if orphan_index is not None:
+    if orphan_index:
         fingerprint = compute_source_fingerprint(personal_uid)
         if fingerprint in orphan_index:
-            existing_uid = orphan_index[fingerprint]
+            recovered = orphan_index[fingerprint]
+            existing_uid = recovered.get_uid()
             logger.info(f"Recovering orphan: {personal_uid} → {existing_uid}")
-            personal_hash = compute_hash(ical_str)
-            recovered = work_client.get_event(existing_uid)
-            if recovered:
-                work_hash = compute_hash(recovered.as_ical_string())
-            else:
-                work_hash = personal_hash
+            personal_hash = obj_hash
+            work_hash = compute_component_hash(recovered)
             state_db.insert_bidirectional(
                 existing_uid, personal_uid, work_hash, personal_hash, "target"
             )
-            state_db.commit()
             stats.added += 1
             return
 
     try:
-        # Use 'busy' mode sanitization for personal → work
-        sanitized = EventSanitizer.sanitize(
-            ical_str,
-            work_uid,
-            mode="busy",
-            keep_reminders=config.keep_reminders,
-            source_uid=personal_uid,
-        )
+        sanitized = _sanitize_busy(config, ical_str, work_uid, personal_uid)
+    except (GLib.Error, CalendarSyncError) as e:
+        logger.error(f"Failed to create event {personal_uid}: {e}")
+        stats.errors += 1
+        return
 
-        if config.verbose:
-            sanitized_str = sanitized.as_ical_string()
-            logger.debug(f"Sanitized iCal:\n{sanitized_str}")
+    if config.verbose:
+        sanitized_str = sanitized.as_ical_string()
+        logger.debug(f"Sanitized iCal:\n{sanitized_str}")
 
-        # Create event and get the ACTUAL UID assigned by the server
-        actual_work_uid = work_client.create_event(sanitized)
+    pending_creates.append((personal_uid, obj_hash, sanitized))
 
-        # Use the actual UID if returned, otherwise fall back to our generated one
-        if actual_work_uid:
-            work_uid = actual_work_uid
-            logger.debug(f"Server assigned UID: {work_uid}")
 
-        # Fetch the event back to get the actual stored version and compute both hashes
-        personal_hash = compute_hash(ical_str)
-        created_work = work_client.get_event(work_uid)
-        if created_work:
-            work_hash = compute_hash(created_work.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            work_hash = compute_hash(sanitized.as_ical_string())
+def _flush_creates_to_work(
+    config: SyncConfig,
+    stats: SyncStats,
+    logger,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
+    work_client: EDSCalendarClient,
+    state_db: StateDatabase,
+):
+    """Create every queued work event with one batched EDS call, then record state.
 
-        # source=work, target=personal, origin='target' (event originated from personal calendar)
-        state_db.insert_bidirectional(work_uid, personal_uid, work_hash, personal_hash, "target")
-        state_db.commit()
+    Counterpart of to_personal._flush_creates.  The queue is emptied; callers
+    flush it right before each state commit.
+    """
+    if not pending_creates:
+        return
+
+    # Create events and get the ACTUAL UIDs assigned by the server
+    results = work_client.create_events([sanitized for _, _, sanitized in pending_creates])
+
+    rows: list[tuple[str, str, str, str]] = []
+    for (personal_uid, personal_hash, sanitized), result in zip(
+        pending_creates, results, strict=True
+    ):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to create event {personal_uid}: {result}")
+            stats.errors += 1
+            continue
+
+        work_uid = result
+        # One-way personal→work sync never compares the work hash, so the
+        # sent copy is hashed rather than fetched back (no D-Bus round trip).
+        work_hash = compute_component_hash(sanitized)
+        rows.append((work_uid, personal_uid, work_hash, personal_hash))
         stats.added += 1
         logger.debug(f"Created event {personal_uid} as {work_uid} in work calendar")
-    except (GLib.Error, CalendarSyncError) as e:
-        logger.error(f"Failed to create event {personal_uid}: {e}")
-        stats.errors += 1
+    # source=work, target=personal, origin='target' (event originated from personal calendar)
+    state_db.insert_bidirectional_many(rows, "target")
+    pending_creates.clear()
 
 
 def _process_updates_to_work(
@@ -122,27 +157,13 @@ def _process_updates_to_work(
         return
 
     try:
-        # Use 'busy' mode sanitization for personal → work
-        sanitized = EventSanitizer.sanitize(
-            ical_str,
-            work_uid,
-            mode="busy",
-            keep_reminders=config.keep_reminders,
-            source_uid=personal_uid,
-        )
+        sanitized = _sanitize_busy(config, ical_str, work_uid, personal_uid)
         work_client.modify_event(sanitized)
 
-        # Fetch the event back to get the actual stored version
-        personal_hash = compute_hash(ical_str)
-        updated_work = work_client.get_event(work_uid)
-        if updated_work:
-            work_hash = compute_hash(updated_work.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            work_hash = compute_hash(sanitized.as_ical_string())
+        personal_hash = obj_hash
+        work_hash = compute_component_hash(sanitized)
 
         state_db.update_hashes(work_uid, personal_uid, work_hash, personal_hash)
-        state_db.commit()
         stats.modified += 1
         logger.debug(f"Updated event {personal_uid} in work calendar")
     except (GLib.Error, CalendarSyncError) as e:
@@ -169,28 +190,18 @@ def _process_updates_to_work(
 
             # Create new with fresh UUID (will be rewritten by server)
             new_uid = str(uuid.uuid4())
-            sanitized = EventSanitizer.sanitize(
-                ical_str,
-                new_uid,
-                mode="busy",
-                keep_reminders=config.keep_reminders,
-                source_uid=personal_uid,
-            )
+            sanitized = _sanitize_busy(config, ical_str, new_uid, personal_uid)
             actual_uid = work_client.create_event(sanitized)
 
             # Update state with new UID if returned
             if actual_uid:
                 new_uid = actual_uid
 
-            # Fetch back and compute both hashes
-            personal_hash = compute_hash(ical_str)
-            created_work = work_client.get_event(new_uid)
-            if created_work:
-                work_hash = compute_hash(created_work.as_ical_string())
-            else:
-                work_hash = compute_hash(sanitized.as_ical_string())
+            personal_hash = obj_hash
+            work_hash = compute_component_hash(sanitized)
 
-            # Update state DB with new work UID (source=work, target=personal, origin='target')
+            # Update state DB with new work UID (source=work, target=personal, origin='target').
+            # Committed immediately, not batched: updates have no orphan lookup.
             state_db.delete_by_pair(work_uid, personal_uid)
             state_db.insert_bidirectional(new_uid, personal_uid, work_hash, personal_hash, "target")
             state_db.commit()
@@ -211,34 +222,44 @@ def _process_deletions_to_work(
     state_db: StateDatabase,
 ):
     """Handle deletion of events removed from personal calendar."""
-    for personal_uid in list(state.keys()):
-        if personal_uid not in personal_uids_seen:
+    stale_uids = sorted(state.keys() - personal_uids_seen)
+    if not stale_uids:
+        return
+
+    if config.dry_run:
+        for personal_uid in stale_uids:
             work_uid = state[personal_uid]["source_uid"]
+            logger.info(f"[DRY RUN] Would DELETE event: {personal_uid} (work: {work_uid})")
+        stats.deleted += len(stale_uids)
+        return
 
-            if config.dry_run:
-                logger.info(f"[DRY RUN] Would DELETE event: {personal_uid} (work: {work_uid})")
-                stats.deleted += 1
-                continue
+    # One batched EDS call per chunk instead of a D-Bus round trip per event.
+    work_uids = [state[personal_uid]["source_uid"] for personal_uid in stale_uids]
+    logger.debug(f"Removing {len(work_uids)} work events")
+    failures = work_client.remove_events(work_uids)
+
+    forgotten: list[str] = []
+    for personal_uid, work_uid in zip(stale_uids, work_uids, strict=True):
+        e = failures.get(work_uid)
+        if e is not None and is_not_found_error(e):
+            # Already gone externally — state DB cleanup still needed
+            logger.debug(
+                f"Work event {work_uid} already gone (externally deleted);"
+                f" cleaning up state for personal event {personal_uid}"
+            )
+        elif e is not None:
+            logger.error(f"Failed to delete {work_uid}: {e}")
+            stats.errors += 1
+            continue
 
-            logger.debug(f"Attempting to delete work event with UID: {work_uid}")
-            try:
-                work_client.remove_event(work_uid)
-                logger.debug(f"Successfully deleted event {personal_uid} (work: {work_uid})")
-            except (GLib.Error, CalendarSyncError) as e:
-                if is_not_found_error(e):
-                    # Already gone externally — state DB cleanup still needed
-                    logger.debug(
-                        f"Work event {work_uid} already gone (externally deleted);"
-                        f" cleaning up state for personal event {personal_uid}"
-                    )
-                else:
-                    logger.error(f"Failed to delete {work_uid}: {e}")
-                    stats.errors += 1
-                    continue
+        forgotten.append(personal_uid)
+        stats.deleted += 1
 
-            state_db.delete_by_pair(work_uid, personal_uid)
-            state_db.commit()
-            stats.deleted += 1
+    log_uid_batch(logger, "Removed work mirrors for", forgotten)
+
+    if forgotten:
+        state_db.delete_by_target_uids(forgotten)
+        state_db.commit()
 
 
 def run_one_way_to_work(
@@ -264,10 +285,13 @@ def run_one_way_to_work(
         logger.info("Scanning work calendar for orphaned managed events...")
         orphan_index = build_orphan_index(work_client, state_db, logger)
 
-        # Fetch personal events (source)
+        # Fetch personal events (source).  Managed mirrors of work events are
+        # filtered out inside EDS, so they are never transferred or parsed.
         logger.info("Fetching personal events...")
-        personal_events = personal_client.get_all_events()
+        personal_events = personal_client.get_unmanaged_events()
         personal_uids_seen: set[str] = set()
+        pending_creates: list[tuple[str, str, ICalGLib.Component]] = []
+        pending_writes = 0
 
         # Process each personal event
         logger.info(f"Processing {len(personal_events)} personal events...")
@@ -284,8 +308,9 @@ def run_one_way_to_work(
 
             personal_uids_seen.add(personal_uid)
 
-            ical_str = comp.as_ical_string()
-            obj_hash = compute_hash(ical_str)
+            # Hash the parsed component directly; the iCal string is only
+            # serialized for events that are actually created or updated.
+            obj_hash = compute_component_hash(comp)
 
             if personal_uid not in state:
                 # CREATE in work calendar
@@ -294,9 +319,9 @@ def run_one_way_to_work(
                     stats,
                     logger,
                     personal_uid,
-                    ical_str,
+                    comp.as_ical_string(),
                     obj_hash,
-                    work_client,
+                    pending_creates,
                     state_db,
                     orphan_index=orphan_index,
                 )
@@ -307,12 +332,24 @@ def run_one_way_to_work(
                     stats,
                     logger,
                     personal_uid,
-                    ical_str,
+                    comp.as_ical_string(),
                     obj_hash,
                     state[personal_uid]["source_uid"],
                     work_client,
                     state_db,
                 )
+            else:
+                continue
+
+            pending_writes += 1
+            if pending_writes >= COMMIT_BATCH_SIZE and not config.dry_run:
+                _flush_creates_to_work(
+                    config, stats, logger, pending_creates, work_client, state_db
+                )
+                state_db.commit()
+                pending_writes = 0
+
+        _flush_creates_to_work(config, stats, logger, pending_creates, work_client, state_db)
 
         # Process deletions
         logger.info("Checking for deletions...")
@@ -18,16 +18,26 @@ from eds_calendar_sync.models import SyncConfig
 from eds_calendar_sync.models import SyncStats
 from eds_calendar_sync.sanitizer import EventSanitizer
 from eds_calendar_sync.sync.refresh import perform_refresh_two_way
+from eds_calendar_sync.sync.utils import COMMIT_BATCH_SIZE
 from eds_calendar_sync.sync.utils import build_orphan_index
-from eds_calendar_sync.sync.utils import compute_hash
+from eds_calendar_sync.sync.utils import compute_component_hash
 from eds_calendar_sync.sync.utils import compute_sanitizer_hash
 from eds_calendar_sync.sync.utils import compute_source_fingerprint
 from eds_calendar_sync.sync.utils import has_valid_occurrences
+from eds_calendar_sync.sync.utils import ical_date_key
+from eds_calendar_sync.sync.utils import ical_datetime_tuple
 from eds_calendar_sync.sync.utils import is_declined_by_user
 from eds_calendar_sync.sync.utils import is_event_cancelled
 from eds_calendar_sync.sync.utils import is_free_time
+from eds_calendar_sync.sync.utils import is_not_found_error
+from eds_calendar_sync.sync.utils import log_uid_batch
 from eds_calendar_sync.sync.utils import parse_component
-from eds_calendar_sync.sync.utils import strip_exdates_for_dates
+from eds_calendar_sync.sync.utils import remove_exdates_for_dates
+
+# Property kinds used in the per-event loops, hoisted to module scope so each
+# lookup is a plain global read instead of a GI attribute resolution.
+_RECURRENCEID_PROP = ICalGLib.PropertyKind.RECURRENCEID_PROPERTY
+_DTSTART_PROP = ICalGLib.PropertyKind.DTSTART_PROPERTY
 
 
 def _process_new_work_event(
@@ -36,39 +46,46 @@ def _process_new_work_event(
     logger,
     work_uid: str,
     work_comp: ICalGLib.Component,
-    personal_client: EDSCalendarClient,
     state_db: StateDatabase,
-    orphan_index: dict[str, str] | None = None,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
+    orphan_index: dict[str, ICalGLib.Component] | None = None,
     valid_exception_dates: set[str] | None = None,
     sanitizer_hash: str | None = None,
+    work_sync_comp: ICalGLib.Component | None = None,
 ):
-    """Handle creation of new event in personal calendar from work."""
-    personal_uid = str(uuid.uuid4())
-    work_ical = work_comp.as_ical_string()
-    # Strip phantom EXDATEs — Exchange adds every explicitly-defined occurrence
-    # to the master's EXDATE list even when the occurrence is a real meeting
-    # (represented by an exception VEVENT with RECURRENCE-ID).  Keeping those
-    # EXDATEs in the personal calendar suppresses GNOME Calendar display.
-    work_ical = strip_exdates_for_dates(work_ical, valid_exception_dates or set())
+    """Plan the creation of a personal event from a new work event.
 
+    The sanitized event is queued on pending_creates as (work_uid, work_hash,
+    component); _create_mirrors() sends the queue to EDS in one batch.
+    work_sync_comp, when given, is work_comp with its phantom EXDATEs already
+    stripped (the caller needed it for its own checks), so it is not rebuilt.
+    """
+    personal_uid = str(uuid.uuid4())
     if config.dry_run:
         logger.info(f"[DRY RUN] [WORK→PERSONAL] Would CREATE: {work_uid} -> {personal_uid}")
         stats.added += 1
         return
 
+    if work_sync_comp is None:
+        # Strip phantom EXDATEs — Exchange adds every explicitly-defined occurrence
+        # to the master's EXDATE list even when the occurrence is a real meeting
+        # (represented by an exception VEVENT with RECURRENCE-ID).  Keeping those
+        # EXDATEs in the personal calendar suppresses GNOME Calendar display.
+        work_sync_comp = work_comp
+        if valid_exception_dates:
+            work_sync_comp = remove_exdates_for_dates(work_comp.clone(), valid_exception_dates)
+    # Hashed as a component: no serialize-and-reparse just for the hash.
+    work_hash = compute_component_hash(work_sync_comp)
+
     # Check orphan index: a previous crash may have created this event in the
     # personal calendar without committing the DB record.
-    if orphan_index is not None:
+    if orphan_index:
         fingerprint = compute_source_fingerprint(work_uid)
         if fingerprint in orphan_index:
-            existing_uid = orphan_index[fingerprint]
+            recovered = orphan_index[fingerprint]
+            existing_uid = recovered.get_uid()
             logger.info(f"Recovering orphan: {work_uid} → {existing_uid}")
-            work_hash = compute_hash(work_ical)
-            recovered = personal_client.get_event(existing_uid)
-            if recovered:
-                personal_hash = compute_hash(recovered.as_ical_string())
-            else:
-                personal_hash = work_hash
+            personal_hash = compute_component_hash(recovered)
             state_db.insert_bidirectional(
                 work_uid,
                 existing_uid,
@@ -77,52 +94,26 @@ def _process_new_work_event(
                 "source",
                 sanitizer_hash=sanitizer_hash,
             )
-            state_db.commit()
             stats.added += 1
             return
 
     try:
         sanitized = EventSanitizer.sanitize(
-            work_ical,
+            work_sync_comp.as_ical_string(),
             personal_uid,
             mode="normal",
             keep_reminders=config.keep_reminders,
             source_uid=work_uid,
             private_work_sync=config.private_work_sync,
         )
-
-        if config.verbose:
-            logger.debug(f"Sanitized iCal:\n{sanitized.as_ical_string()}")
-
-        # Create event and get actual UID
-        actual_personal_uid = personal_client.create_event(sanitized)
-        if actual_personal_uid:
-            personal_uid = actual_personal_uid
-            logger.debug(f"Server assigned UID: {personal_uid}")
-
-        # Fetch the event back to get the actual stored version
-        work_hash = compute_hash(work_ical)
-        created_personal = personal_client.get_event(personal_uid)
-        if created_personal:
-            personal_hash = compute_hash(created_personal.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            personal_hash = compute_hash(sanitized.as_ical_string())
-
-        state_db.insert_bidirectional(
-            work_uid,
-            personal_uid,
-            work_hash,
-            personal_hash,
-            "source",
-            sanitizer_hash=sanitizer_hash,
-        )
-        state_db.commit()
-        stats.added += 1
-        logger.debug(f"Created personal event {personal_uid} from work {work_uid}")
     except (GLib.Error, CalendarSyncError) as e:
         logger.error(f"Failed to create personal event from {work_uid}: {e}")
         stats.errors += 1
+        return
+
+    if config.verbose:
+        logger.debug("Sanitized iCal:\n%s", sanitized.as_ical_string())
+    pending_creates.append((work_uid, work_hash, sanitized))
 
 
 def _process_new_personal_event(
@@ -131,73 +122,123 @@ def _process_new_personal_event(
     logger,
     personal_uid: str,
     personal_comp: ICalGLib.Component,
-    work_client: EDSCalendarClient,
     state_db: StateDatabase,
-    orphan_index: dict[str, str] | None = None,
+    pending_creates: list[tuple[str, str, ICalGLib.Component]],
+    orphan_index: dict[str, ICalGLib.Component] | None = None,
 ):
-    """Handle creation of new event in work calendar from personal."""
+    """Plan the creation of a work event from a new personal event.
+
+    The sanitized busy block is queued on pending_creates as (personal_uid,
+    personal_hash, component); _create_mirrors() sends the queue to EDS.
+    """
     work_uid = str(uuid.uuid4())
-    personal_ical = personal_comp.as_ical_string()
 
     if config.dry_run:
         logger.info(f"[DRY RUN] [PERSONAL→WORK] Would CREATE: {personal_uid} -> {work_uid}")
         stats.added += 1
         return
 
+    personal_hash = compute_component_hash(personal_comp)
+
     # Check orphan index: a previous crash may have created this event in the
     # work calendar without committing the DB record.
-    if orphan_index is not None:
+    if orphan_index:
         fingerprint = compute_source_fingerprint(personal_uid)
         if fingerprint in orphan_index:
-            existing_uid = orphan_index[fingerprint]
+            recovered = orphan_index[fingerprint]
+            existing_uid = recovered.get_uid()
             logger.info(f"Recovering orphan: {personal_uid} → {existing_uid}")
-            personal_hash = compute_hash(personal_ical)
-            recovered = work_client.get_event(existing_uid)
-            if recovered:
-                work_hash = compute_hash(recovered.as_ical_string())
-            else:
-                work_hash = personal_hash
+            work_hash = compute_component_hash(recovered)
             state_db.insert_bidirectional(
                 existing_uid, personal_uid, work_hash, personal_hash, "target"
             )
-            state_db.commit()
             stats.added += 1
             return
 
     try:
         sanitized = EventSanitizer.sanitize(
-            personal_ical,
+            personal_comp.as_ical_string(),
             work_uid,
             mode="busy",
             keep_reminders=config.keep_reminders,
             source_uid=personal_uid,
         )
+    except (GLib.Error, CalendarSyncError) as e:
+        logger.error(f"Failed to create work event from {personal_uid}: {e}")
+        stats.errors += 1
+        return
 
-        if config.verbose:
-            logger.debug(f"Sanitized iCal (busy mode):\n{sanitized.as_ical_string()}")
+    if config.verbose:
+        logger.debug("Sanitized iCal (busy mode):\n%s", sanitized.as_ical_string())
+    pending_creates.append((personal_uid, personal_hash, sanitized))
 
-        # Create event and get actual UID
-        actual_work_uid = work_client.create_event(sanitized)
-        if actual_work_uid:
-            work_uid = actual_work_uid
-            logger.debug(f"Server assigned UID: {work_uid}")
 
-        # Fetch the event back to get the actual stored version
-        personal_hash = compute_hash(personal_ical)
-        created_work = work_client.get_event(work_uid)
-        if created_work:
-            work_hash = compute_hash(created_work.as_ical_string())
-        else:
-            # Fallback if fetch fails
-            work_hash = compute_hash(sanitized.as_ical_string())
+def _send_creates(
+    logger,
+    client: EDSCalendarClient,
+    components: list[ICalGLib.Component],
+    mirror_side: str,
+) -> tuple[list[str | Exception], dict[str, ICalGLib.Component]]:
+    """Create components in client and read the stored copies back."""
+    # Microsoft 365 rewrites UIDs, so the state must use the returned ones
+    results = client.create_events(components)
+    created = [r for r in results if not isinstance(r, Exception)]
+    try:
+        stored = client.get_events(created)
+    except CalendarSyncError as e:
+        logger.warning(f"Readback of created {mirror_side} events failed: {e}")
+        stored = {}
+    return results, stored
 
-        state_db.insert_bidirectional(work_uid, personal_uid, work_hash, personal_hash, "target")
-        state_db.commit()
-        stats.added += 1
-        logger.debug(f"Created work event {work_uid} from personal {personal_uid}")
-    except (GLib.Error, CalendarSyncError) as e:
-        logger.error(f"Failed to create work event from {personal_uid}: {e}")
-        stats.errors += 1
+
+def _create_mirrors(
+    stats: SyncStats,
+    logger,
+    work_client: EDSCalendarClient,
+    personal_client: EDSCalendarClient,
+    new_personal: list[tuple[str, str, ICalGLib.Component]],
+    new_work: list[tuple[str, str, ICalGLib.Component]],
+    state_db: StateDatabase,
+    sanitizer_hash: str | None = None,
+):
+    """Create the queued mirrors in both calendars, then record state.
+
+    new_personal holds (work_uid, work_hash, sanitized) for mirrors to create
+    in personal_client; new_work holds (personal_uid, personal_hash,
+    sanitized) for busy blocks to create in work_client.  The two batches are
+    sent one after the other on this thread: the EDS calls serialize and
+    parse ICalGLib components, and libical's process-global state is not safe
+    to hit from several threads.  Both lists are emptied.
+    """
+    jobs = [
+        (personal_client, new_personal, "personal"),
+        (work_client, new_work, "work"),
+    ]
+    for client, pending, mirror_side in jobs:
+        if not pending:
+            continue
+        results, stored = _send_creates(logger, client, [s for _, _, s in pending], mirror_side)
+        created: list[str] = []
+        rows: list[tuple[str, str, str, str]] = []
+        for (source_uid, source_hash, sanitized), result in zip(pending, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to create {mirror_side} event from {source_uid}: {result}")
+                stats.errors += 1
+                continue
+            mirror_hash = compute_component_hash(stored.get(result) or sanitized)
+            if mirror_side == "personal":
+                rows.append((source_uid, result, source_hash, mirror_hash))
+            else:
+                rows.append((result, source_uid, mirror_hash, source_hash))
+            created.append(result)
+            stats.added += 1
+        # One executemany() per calendar instead of an upsert per created mirror
+        if mirror_side == "personal":
+            state_db.insert_bidirectional_many(rows, "source", sanitizer_hash=sanitizer_hash)
+        else:
+            state_db.insert_bidirectional_many(rows, "target")
+        log_uid_batch(logger, f"Created {mirror_side}", created)
+        pending.clear()
 
 
 def _process_sync_pair(
@@ -205,34 +246,47 @@ def _process_sync_pair(
     stats: SyncStats,
     logger,
     state_record,
-    work_events: dict[str, ICalGLib.Component],
-    personal_events: dict[str, ICalGLib.Component],
+    work_comp: ICalGLib.Component | None,
+    personal_comp: ICalGLib.Component | None,
     work_client: EDSCalendarClient,
     personal_client: EDSCalendarClient,
     state_db: StateDatabase,
+    personal_removals: list[tuple[str, str]],
+    work_removals: list[tuple[str, str]],
+    vanished_work_uids: list[str],
+    personal_updates: list[tuple[str, str, ICalGLib.Component, str]],
+    work_updates: list[tuple[str, str, ICalGLib.Component, str]],
     work_valid_exception_dates: dict[str, set[str]] | None = None,
     current_sanitizer_hash: str = "",
 ):
-    """Process an existing sync pair (check for changes/deletions)."""
+    """Process an existing sync pair (check for changes/deletions).
+
+    Mirrors whose authoritative event was deleted are not removed here: the
+    (work_uid, personal_uid) pair is appended to personal_removals or
+    work_removals and the caller removes them in bulk (_remove_mirrors).
+    Pairs with both events gone add their work UID to vanished_work_uids so
+    the caller drops all those state rows in one statement.  Changed pairs
+    are sanitized here and queued on personal_updates or work_updates; the
+    caller writes them in bulk (_apply_mirror_updates).
+
+    work_comp and personal_comp are the record's events as already looked up
+    by the caller; None means the event no longer exists in that calendar.
+    """
     work_uid = state_record["source_uid"]  # DB uses 'source' for work
     personal_uid = state_record["target_uid"]  # DB uses 'target' for personal
     origin = state_record["origin"]
     stored_work_hash = state_record["source_hash"]
     stored_personal_hash = state_record["target_hash"]
 
-    work_exists = work_uid in work_events
-    personal_exists = personal_uid in personal_events
-
     # Handle deletions
-    if not work_exists and not personal_exists:
+    if work_comp is None and personal_comp is None:
         # Both deleted, just clean up state
-        logger.debug(f"Both events deleted: {work_uid} <-> {personal_uid}")
+        logger.debug("Both events deleted: %s <-> %s", work_uid, personal_uid)
         if not config.dry_run:
-            state_db.delete_by_pair(work_uid, personal_uid)
-            state_db.commit()
+            vanished_work_uids.append(work_uid)
         return
 
-    if not work_exists:
+    if work_comp is None:
         # Work event deleted
         if origin == "source":
             # Work was authoritative → delete the personal mirror
@@ -242,17 +296,7 @@ def _process_sync_pair(
                 )
                 stats.deleted += 1
             else:
-                try:
-                    personal_client.remove_event(personal_uid)
-                    logger.debug(f"Deleted personal event {personal_uid} (work deleted)")
-                    stats.deleted += 1
-                except (GLib.Error, CalendarSyncError) as e:
-                    logger.error(f"Failed to delete personal {personal_uid}: {e}")
-                    stats.errors += 1
-            # Clean up state
-            if not config.dry_run:
-                state_db.delete_by_pair(work_uid, personal_uid)
-                state_db.commit()
+                personal_removals.append((work_uid, personal_uid))
         else:
             # Personal was authoritative → work was deleted externally; recreate it.
             # (work_uid is already in work_uids_processed after this call returns,
@@ -265,18 +309,19 @@ def _process_sync_pair(
             else:
                 state_db.delete_by_pair(work_uid, personal_uid)
                 state_db.commit()
+                recreated: list[tuple[str, str, ICalGLib.Component]] = []
                 _process_new_personal_event(
-                    config,
-                    stats,
-                    logger,
-                    personal_uid,
-                    personal_events[personal_uid],
-                    work_client,
-                    state_db,
+                    config, stats, logger, personal_uid, personal_comp, state_db, recreated
+                )
+                _create_mirrors(
+                    stats, logger, work_client, personal_client, [], recreated, state_db
                 )
+                # Committed immediately (not batched): the recreate path does
+                # no orphan lookup, so losing this row would duplicate the event.
+                state_db.commit()
         return
 
-    if not personal_exists:
+    if personal_comp is None:
         # Personal event deleted
         if origin == "target":
             # Personal was authoritative → delete the work mirror
@@ -286,17 +331,7 @@ def _process_sync_pair(
                 )
                 stats.deleted += 1
             else:
-                try:
-                    work_client.remove_event(work_uid)
-                    logger.debug(f"Deleted work event {work_uid} (personal deleted)")
-                    stats.deleted += 1
-                except (GLib.Error, CalendarSyncError) as e:
-                    logger.error(f"Failed to delete work {work_uid}: {e}")
-                    stats.errors += 1
-            # Clean up state
-            if not config.dry_run:
-                state_db.delete_by_pair(work_uid, personal_uid)
-                state_db.commit()
+                work_removals.append((work_uid, personal_uid))
         else:
             # Work was authoritative → personal was deleted externally; recreate it.
             # (personal_uid is already in personal_uids_processed after this call
@@ -311,169 +346,256 @@ def _process_sync_pair(
             else:
                 state_db.delete_by_pair(work_uid, personal_uid)
                 state_db.commit()
+                recreated = []
                 _process_new_work_event(
                     config,
                     stats,
                     logger,
                     work_uid,
-                    work_events[work_uid],
-                    personal_client,
+                    work_comp,
                     state_db,
+                    recreated,
                     valid_exception_dates=(work_valid_exception_dates or {}).get(work_uid, set()),
                     sanitizer_hash=current_sanitizer_hash or None,
                 )
+                _create_mirrors(
+                    stats,
+                    logger,
+                    work_client,
+                    personal_client,
+                    recreated,
+                    [],
+                    state_db,
+                    sanitizer_hash=current_sanitizer_hash or None,
+                )
+                # Committed immediately, as for the work recreate above.
+                state_db.commit()
         return
 
     # Both events exist - check for updates
-    work_comp = work_events[work_uid]
-    personal_comp = personal_events[personal_uid]
-
-    work_ical = work_comp.as_ical_string()
-    personal_ical = personal_comp.as_ical_string()
-
     # Strip phantom EXDATEs before hashing and syncing.  Exchange adds every
     # explicitly-defined occurrence to the master's EXDATE list even when the
     # occurrence is a real meeting (exception VEVENT with RECURRENCE-ID).
     # We strip those dates so the personal calendar shows the correct occurrences.
-    # Using the stripped iCal for the work hash ensures a one-time re-sync on the
+    # Using the stripped event for the work hash ensures a one-time re-sync on the
     # first run after this fix (old hash was based on the unstripped iCal).
-    work_ical = strip_exdates_for_dates(
-        work_ical, (work_valid_exception_dates or {}).get(work_uid, set())
-    )
+    # The strip works on a clone of the parsed component, and nothing is
+    # serialized unless the pair actually has to be synced.
+    _valid_ex_dates = (work_valid_exception_dates or {}).get(work_uid)
+    if _valid_ex_dates:
+        work_sync_comp = remove_exdates_for_dates(work_comp.clone(), _valid_ex_dates)
+    else:
+        work_sync_comp = work_comp
 
-    current_work_hash = compute_hash(work_ical)
-    current_personal_hash = compute_hash(personal_ical)
+    current_work_hash = compute_component_hash(work_sync_comp)
+    current_personal_hash = compute_component_hash(personal_comp)
 
     # Debug: Log hash mismatches
     if config.verbose:
         if current_work_hash != stored_work_hash:
-            logger.debug(f"Work hash mismatch for {work_uid}")
-            logger.debug(f"  Stored: {stored_work_hash}")
-            logger.debug(f"  Current: {current_work_hash}")
+            logger.debug("Work hash mismatch for %s", work_uid)
+            logger.debug("  Stored: %s", stored_work_hash)
+            logger.debug("  Current: %s", current_work_hash)
         if current_personal_hash != stored_personal_hash:
-            logger.debug(f"Personal hash mismatch for {personal_uid}")
-            logger.debug(f"  Stored: {stored_personal_hash}")
-            logger.debug(f"  Current: {current_personal_hash}")
+            logger.debug("Personal hash mismatch for %s", personal_uid)
+            logger.debug("  Stored: %s", stored_personal_hash)
+            logger.debug("  Current: %s", current_personal_hash)
 
     if origin == "source":  # DB uses 'source' for work origin
         # Work is authoritative - sync work→personal if EITHER changed,
         # or if the sanitizer parameters have changed since the last sync.
-        work_changed = current_work_hash != stored_work_hash
-        personal_changed = current_personal_hash != stored_personal_hash
         stored_sanitizer_hash = state_record["sanitizer_hash"] or ""
         sanitizer_changed = current_sanitizer_hash != stored_sanitizer_hash
 
         if config.verbose and sanitizer_changed:
-            logger.debug(f"Sanitizer hash changed for {work_uid}, forcing update")
-
-        if work_changed or personal_changed or sanitizer_changed:
-            reason = []
-            if work_changed:
-                reason.append("work changed")
-            if personal_changed:
-                reason.append("personal manually edited")
-            if sanitizer_changed:
-                reason.append("sanitizer updated")
-            reason_str = ", ".join(reason)
-
-            if config.dry_run:
-                logger.info(
-                    f"[DRY RUN] [WORK→PERSONAL] Would UPDATE: "
-                    f"{work_uid} -> {personal_uid} ({reason_str})"
-                )
-                stats.modified += 1
-            else:
-                try:
-                    sanitized = EventSanitizer.sanitize(
-                        work_ical,
-                        personal_uid,
-                        mode="normal",
-                        keep_reminders=config.keep_reminders,
-                        source_uid=work_uid,
-                        private_work_sync=config.private_work_sync,
-                    )
-                    personal_client.modify_event(sanitized)
-
-                    # Fetch the event back to get the actual stored version
-                    # (server may have added/modified properties)
-                    updated_personal = personal_client.get_event(personal_uid)
-                    if updated_personal:
-                        new_personal_ical = updated_personal.as_ical_string()
-                        new_personal_hash = compute_hash(new_personal_ical)
-                    else:
-                        # Fallback if fetch fails
-                        new_personal_ical = sanitized.as_ical_string()
-                        new_personal_hash = compute_hash(new_personal_ical)
-
-                    state_db.update_hashes(
-                        work_uid,
-                        personal_uid,
-                        current_work_hash,
-                        new_personal_hash,
-                        sanitizer_hash=current_sanitizer_hash,
-                    )
-                    state_db.commit()
-                    stats.modified += 1
-                    logger.debug(
-                        f"Updated personal {personal_uid} from work {work_uid} ({reason_str})"
-                    )
-                except (GLib.Error, CalendarSyncError) as e:
-                    logger.error(f"Failed to update personal {personal_uid}: {e}")
-                    stats.errors += 1
+            logger.debug("Sanitizer hash changed for %s, forcing update", work_uid)
+
+        reasons = [
+            reason
+            for reason, hit in (
+                ("work changed", current_work_hash != stored_work_hash),
+                ("personal manually edited", current_personal_hash != stored_personal_hash),
+                ("sanitizer updated", sanitizer_changed),
+            )
+            if hit
+        ]
+        _queue_mirror_update(
+            config,
+            stats,
+            logger,
+            reasons,
+            "personal",
+            work_uid,
+            personal_uid,
+            work_sync_comp,
+            current_work_hash,
+            personal_updates,
+        )
 
     elif origin == "target":  # DB uses 'target' for personal origin
         # Personal is authoritative - sync personal→work if EITHER changed
         # This ensures manual edits to work are overwritten
-        personal_changed = current_personal_hash != stored_personal_hash
-        work_changed = current_work_hash != stored_work_hash
+        reasons = [
+            reason
+            for reason, hit in (
+                ("personal changed", current_personal_hash != stored_personal_hash),
+                ("work manually edited", current_work_hash != stored_work_hash),
+            )
+            if hit
+        ]
+        _queue_mirror_update(
+            config,
+            stats,
+            logger,
+            reasons,
+            "work",
+            work_uid,
+            personal_uid,
+            personal_comp,
+            current_personal_hash,
+            work_updates,
+        )
 
-        if personal_changed or work_changed:
-            reason = []
-            if personal_changed:
-                reason.append("personal changed")
-            if work_changed:
-                reason.append("work manually edited")
-            reason_str = ", ".join(reason)
 
-            if config.dry_run:
-                logger.info(
-                    f"[DRY RUN] [PERSONAL→WORK] Would UPDATE: "
-                    f"{personal_uid} -> {work_uid} ({reason_str})"
-                )
-                stats.modified += 1
-            else:
-                try:
-                    sanitized = EventSanitizer.sanitize(
-                        personal_ical,
-                        work_uid,
-                        mode="busy",
-                        keep_reminders=config.keep_reminders,
-                        source_uid=personal_uid,
-                    )
-                    work_client.modify_event(sanitized)
-
-                    # Fetch the event back to get the actual stored version
-                    # (server may have added/modified properties)
-                    updated_work = work_client.get_event(work_uid)
-                    if updated_work:
-                        new_work_ical = updated_work.as_ical_string()
-                        new_work_hash = compute_hash(new_work_ical)
-                    else:
-                        # Fallback if fetch fails
-                        new_work_ical = sanitized.as_ical_string()
-                        new_work_hash = compute_hash(new_work_ical)
-
-                    state_db.update_hashes(
-                        work_uid, personal_uid, new_work_hash, current_personal_hash
-                    )
-                    state_db.commit()
-                    stats.modified += 1
-                    logger.debug(
-                        f"Updated work {work_uid} from personal {personal_uid} ({reason_str})"
-                    )
-                except (GLib.Error, CalendarSyncError) as e:
-                    logger.error(f"Failed to update work {work_uid}: {e}")
-                    stats.errors += 1
+def _queue_mirror_update(
+    config: SyncConfig,
+    stats: SyncStats,
+    logger,
+    reasons: list[str],
+    mirror_side: str,
+    work_uid: str,
+    personal_uid: str,
+    source_comp: ICalGLib.Component,
+    source_hash: str,
+    updates: list[tuple[str, str, ICalGLib.Component, str]],
+):
+    """Sanitize the authoritative event and queue its mirror for update.
+
+    Shared by both origins of _process_sync_pair: mirror_side ("personal" or
+    "work") selects the direction, and with it the sanitizer mode.  Nothing
+    happens when reasons is empty (the pair is unchanged).
+    """
+    if not reasons:
+        return
+    to_personal = mirror_side == "personal"
+    source_side = "work" if to_personal else "personal"
+    source_uid, mirror_uid = (work_uid, personal_uid) if to_personal else (personal_uid, work_uid)
+    reason_str = ", ".join(reasons)
+
+    if config.dry_run:
+        logger.info(
+            f"[DRY RUN] [{source_side.upper()}→{mirror_side.upper()}] Would UPDATE: "
+            f"{source_uid} -> {mirror_uid} ({reason_str})"
+        )
+        stats.modified += 1
+        return
+
+    try:
+        sanitized = EventSanitizer.sanitize(
+            source_comp.as_ical_string(),
+            mirror_uid,
+            mode="normal" if to_personal else "busy",
+            keep_reminders=config.keep_reminders,
+            source_uid=source_uid,
+            private_work_sync=to_personal and config.private_work_sync,
+        )
+    except (GLib.Error, CalendarSyncError) as e:
+        logger.error(f"Failed to update {mirror_side} {mirror_uid}: {e}")
+        stats.errors += 1
+        return
+    logger.debug(
+        "Updating %s %s from %s %s (%s)",
+        mirror_side,
+        mirror_uid,
+        source_side,
+        source_uid,
+        reason_str,
+    )
+    updates.append((work_uid, personal_uid, sanitized, source_hash))
+
+
+def _apply_mirror_updates(
+    stats: SyncStats,
+    logger,
+    client: EDSCalendarClient,
+    updates: list[tuple[str, str, ICalGLib.Component, str]],
+    mirror_side: str,
+    state_db: StateDatabase,
+    sanitizer_hash: str | None = None,
+):
+    """Write the mirror updates planned in Phase 1 with batched EDS calls.
+
+    updates holds (work_uid, personal_uid, sanitized, source_hash), where
+    source_hash is the current hash of the authoritative side; mirror_side
+    ("work" or "personal") says which of the two UIDs is the mirror living in
+    client.  The stored versions are read back in one query so the state keeps
+    the server's rendering of each mirror, falling back to the sent copy.
+    The new hashes are written with one executemany() statement.  The list is
+    emptied; callers flush it right before each state commit.
+    """
+    if not updates:
+        return
+    mirror_uids = [w if mirror_side == "work" else p for w, p, _, _ in updates]
+    failures = client.modify_events([sanitized for _, _, sanitized, _ in updates])
+    try:
+        stored = client.get_events([uid for uid in mirror_uids if uid not in failures])
+    except CalendarSyncError as e:
+        logger.warning(f"Readback of updated {mirror_side} events failed: {e}")
+        stored = {}
+
+    updated: list[str] = []
+    hash_rows: list[tuple[str, str, str, str]] = []
+    for (work_uid, personal_uid, sanitized, source_hash), mirror_uid in zip(
+        updates, mirror_uids, strict=True
+    ):
+        e = failures.get(mirror_uid)
+        if e is not None:
+            logger.error(f"Failed to update {mirror_side} {mirror_uid}: {e}")
+            stats.errors += 1
+            continue
+        mirror_hash = compute_component_hash(stored.get(mirror_uid) or sanitized)
+        if mirror_side == "personal":
+            hash_rows.append((work_uid, personal_uid, source_hash, mirror_hash))
+        else:
+            hash_rows.append((work_uid, personal_uid, mirror_hash, source_hash))
+        updated.append(mirror_uid)
+        stats.modified += 1
+    state_db.update_hashes_many(hash_rows, sanitizer_hash=sanitizer_hash)
+    log_uid_batch(logger, f"Updated {mirror_side}", updated)
+    updates.clear()
+
+
+def _remove_mirrors(
+    stats: SyncStats,
+    logger,
+    client: EDSCalendarClient,
+    pairs: list[tuple[str, str]],
+    mirror_side: str,
+    state_db: StateDatabase,
+):
+    """Remove mirrors whose authoritative event was deleted, in one batched call.
+
+    pairs holds (work_uid, personal_uid); mirror_side ("work" or "personal")
+    says which of the two is the mirror living in client.  A mirror that is
+    already gone counts as deleted.  State rows are dropped for every pair,
+    including failed removals, as the per-pair path always did.
+    """
+    if not pairs:
+        return
+    mirror_uids = [w if mirror_side == "work" else p for w, p in pairs]
+    failures = client.remove_events(mirror_uids)
+    deleted: list[str] = []
+    for mirror_uid in mirror_uids:
+        e = failures.get(mirror_uid)
+        if e is None or is_not_found_error(e):
+            deleted.append(mirror_uid)
+        else:
+            logger.error(f"Failed to delete {mirror_side} {mirror_uid}: {e}")
+            stats.errors += 1
+    stats.deleted += len(deleted)
+    log_uid_batch(logger, f"Deleted {mirror_side} (source deleted)", deleted)
+    # Committed with the rest of the run; source_uid is unique per pair.
+    state_db.delete_by_source_uids([w for w, _ in pairs])
 
 
 def run_two_way(
@@ -490,29 +612,63 @@ def run_two_way(
         if config.refresh:
             perform_refresh_two_way(config, stats, logger, work_client, personal_client, state_db)
 
+        # Compute the sanitizer hash once for this run.  A mismatch with the
+        # stored value triggers a force-update of the personal event even when
+        # neither the work nor personal event content has changed.
+        current_sanitizer_hash = compute_sanitizer_hash(config)
+
+        # Skip the whole run when neither calendar changed since a run that
+        # had nothing to do.  The revisions are read before anything is
+        # fetched, so a change that lands during this run is seen by the next.
+        work_revision = work_client.get_revision()
+        personal_revision = personal_client.get_revision()
+        settings_hash = f"{current_sanitizer_hash}:{config.work_account_email or ''}"
+        if (
+            work_revision
+            and personal_revision
+            and state_db.get_idle_revisions() == (work_revision, personal_revision, settings_hash)
+        ):
+            logger.info("Neither calendar changed since the last sync; nothing to do")
+            return
+        counts_before = (stats.added, stats.modified, stats.deleted, stats.errors)
+
         logger.info("Loading sync state...")
         state_records = state_db.get_all_state_bidirectional()
 
+        # Fetch all events from both calendars, one after the other: each
+        # get_object_list_sync() builds ICalGLib components as it returns, and
+        # libical keeps process-global state (the lazily filled builtin
+        # timezone cache) that is not safe to hit from several threads.
+        logger.info("Fetching work and personal events...")
+        work_events_list = [parse_component(obj) for obj in work_client.get_all_events()]
+        personal_events_list = [parse_component(obj) for obj in personal_client.get_all_events()]
+
+        # Every event named by a state record is handled by Phase 1, so the
+        # UIDs Phases 2 and 3 must skip are known before Phase 1 starts.
+        # ('source' maps to 'work' and 'target' to 'personal' in the DB.)
+        work_uids_processed = {r["source_uid"] for r in state_records}
+        personal_uids_processed = {r["target_uid"] for r in state_records}
+        tracked_uids = work_uids_processed | personal_uids_processed
+
         # Pre-sync orphan scans: find managed events in each calendar that
         # lack a DB record (created by a previous run that crashed before commit).
+        # The full listings above already contain every managed event, and the
+        # state records loaded above already name every tracked UID, so the
+        # scans need neither a second fetch nor a second state query.
         logger.info("Scanning personal calendar for orphaned managed events...")
-        personal_orphan_index = build_orphan_index(personal_client, state_db, logger)
+        personal_orphan_index = build_orphan_index(
+            personal_client,
+            state_db,
+            logger,
+            events=personal_events_list,
+            tracked_uids=tracked_uids,
+        )
         logger.info("Scanning work calendar for orphaned managed events...")
-        work_orphan_index = build_orphan_index(work_client, state_db, logger)
+        work_orphan_index = build_orphan_index(
+            work_client, state_db, logger, events=work_events_list, tracked_uids=tracked_uids
+        )
 
-        # Fetch all events from both calendars
-        logger.info("Fetching work events...")
-        work_events_list = work_client.get_all_events()
         work_events: dict[str, ICalGLib.Component] = {}
-        for obj in work_events_list:
-            comp = parse_component(obj)
-            # Keep only master VEVENTs (no RECURRENCE-ID).  Exception VEVENTs
-            # share the same UID as the master and would overwrite it.  Their
-            # contribution is captured via work_valid_exception_dates below.
-            if comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY):
-                continue
-            work_events[comp.get_uid()] = comp
-
         # Build a map from work UID → set of YYYYMMDD dates that have a valid
         # (non-managed, non-cancelled, non-free) exception VEVENT.  Exchange
         # stores every explicitly-defined recurring occurrence as both an EXDATE
@@ -520,11 +676,17 @@ def run_two_way(
         # Those "phantom" EXDATEs suppress GNOME Calendar display even though the
         # occurrences are real meetings.  We strip them when writing to personal.
         work_valid_exception_dates: dict[str, set[str]] = {}
-        for _obj in work_events_list:
-            _comp = parse_component(_obj)
-            _rid_prop = _comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY)
+        _rescheduled_count = 0
+        # Single pass: each object is parsed and probed for RECURRENCE-ID once.
+        # Only master VEVENTs (no RECURRENCE-ID) go into work_events under
+        # their UID; exceptions share the master's UID and would overwrite it,
+        # so they are analysed inline instead.
+        for _comp in work_events_list:
+            _rid_prop = _comp.get_first_property(_RECURRENCEID_PROP)
+            _uid = _comp.get_uid()
             if not _rid_prop:
-                continue  # master VEVENT — handled above
+                work_events[_uid] = _comp
+                continue
             if EventSanitizer.is_managed_event(_comp):
                 continue
             if is_event_cancelled(_comp):
@@ -534,25 +696,20 @@ def run_two_way(
             # Exchange doesn't set TRANSP:TRANSPARENT on declined exception VEVENTs.
             # Detect via PARTSTAT=DECLINED on the owner's ATTENDEE entry.
             if config.work_account_email and is_declined_by_user(_comp, config.work_account_email):
-                logger.debug("Skipping declined exception VEVENT uid=%s", _comp.get_uid())
+                logger.debug("Skipping declined exception VEVENT uid=%s", _uid)
                 continue
-            _uid = _comp.get_uid()
             if not _uid:
                 continue
             try:
                 _rid_t = _rid_prop.get_recurrenceid()
-                _rid_date = f"{_rid_t.get_year():04d}{_rid_t.get_month():02d}{_rid_t.get_day():02d}"
+                _rid_date = ical_date_key(_rid_t)
                 # Detect rescheduled occurrences: DTSTART ≠ RECURRENCE-ID by date or time.
-                _dts_prop = _comp.get_first_property(ICalGLib.PropertyKind.DTSTART_PROPERTY)
+                _dts_prop = _comp.get_first_property(_DTSTART_PROP)
                 _is_rescheduled = False
                 if _dts_prop:
-                    _dts = _dts_prop.get_dtstart()
-                    _dts_date = f"{_dts.get_year():04d}{_dts.get_month():02d}{_dts.get_day():02d}"
-                    _h, _m, _s = _rid_t.get_hour(), _rid_t.get_minute(), _rid_t.get_second()
-                    _rid_time = f"T{_h:02d}{_m:02d}{_s:02d}"
-                    _h, _m, _s = _dts.get_hour(), _dts.get_minute(), _dts.get_second()
-                    _dts_time = f"T{_h:02d}{_m:02d}{_s:02d}"
-                    _is_rescheduled = (_dts_date != _rid_date) or (_dts_time != _rid_time)
+                    _is_rescheduled = ical_datetime_tuple(
+                        _dts_prop.get_dtstart()
+                    ) != ical_datetime_tuple(_rid_t)
                 if _is_rescheduled:
                     # Rescheduled: sync as a standalone personal event so it appears at the
                     # new time.  Do NOT strip the master EXDATE for the original slot — it
@@ -560,25 +717,27 @@ def run_two_way(
                     _rid_str = _rid_t.as_ical_string()
                     _compound_uid = f"{_uid}::RID::{_rid_str}"
                     work_events[_compound_uid] = _comp
+                    _rescheduled_count += 1
                 else:
                     # Non-rescheduled: strip the phantom EXDATE so RRULE shows the occurrence.
                     work_valid_exception_dates.setdefault(_uid, set()).add(_rid_date)
             except Exception:
                 pass
-        if work_valid_exception_dates or any("::RID::" in k for k in work_events):
+        if work_valid_exception_dates or _rescheduled_count:
             logger.debug(
-                f"Exception analysis: {len(work_valid_exception_dates)} UIDs with phantom EXDATEs, "
-                f"{sum(1 for k in work_events if '::RID::' in k)} rescheduled exception(s) to sync"
+                "Exception analysis: %d UIDs with phantom EXDATEs, "
+                "%d rescheduled exception(s) to sync",
+                len(work_valid_exception_dates),
+                _rescheduled_count,
             )
 
-        logger.info("Fetching personal events...")
-        personal_events_list = personal_client.get_all_events()
-        personal_events: dict[str, ICalGLib.Component] = {}
-        for obj in personal_events_list:
-            comp = parse_component(obj)
-            if comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY):
-                continue
-            personal_events[comp.get_uid()] = comp
+        # Personal exception VEVENTs share their master's UID and are not
+        # synced on their own; only masters are indexed.
+        personal_events: dict[str, ICalGLib.Component] = {
+            comp.get_uid(): comp
+            for comp in personal_events_list
+            if not comp.get_first_property(_RECURRENCEID_PROP)
+        }
 
         logger.info(
             f"Processing {len(work_events)} work events, "
@@ -586,106 +745,175 @@ def run_two_way(
             f"{len(state_records)} sync pairs..."
         )
 
-        # Track which events we've processed
-        work_uids_processed = set()
-        personal_uids_processed = set()
-
-        # Compute the sanitizer hash once for this run.  A mismatch with the
-        # stored value triggers a force-update of the personal event even when
-        # neither the work nor personal event content has changed.
-        current_sanitizer_hash = compute_sanitizer_hash(config)
-
         # Phase 1: Process existing sync pairs
+        personal_removals: list[tuple[str, str]] = []
+        work_removals: list[tuple[str, str]] = []
+        vanished_work_uids: list[str] = []
+        personal_updates: list[tuple[str, str, ICalGLib.Component, str]] = []
+        work_updates: list[tuple[str, str, ICalGLib.Component, str]] = []
+        # State writes are committed every COMMIT_BATCH_SIZE events rather than
+        # once per event.  After an interrupted run, uncommitted creates are
+        # re-linked via the orphan indexes and uncommitted updates show up as
+        # a hash mismatch and are simply re-applied.
+        pending_writes = 0
         for state_record in state_records:
-            work_uid = state_record["source_uid"]  # 'source' maps to 'work' in DB
-            personal_uid = state_record["target_uid"]  # 'target' maps to 'personal' in DB
-
             _process_sync_pair(
                 config,
                 stats,
                 logger,
                 state_record,
-                work_events,
-                personal_events,
+                work_events.get(state_record["source_uid"]),
+                personal_events.get(state_record["target_uid"]),
                 work_client,
                 personal_client,
                 state_db,
+                personal_removals,
+                work_removals,
+                vanished_work_uids,
+                personal_updates,
+                work_updates,
                 work_valid_exception_dates=work_valid_exception_dates,
                 current_sanitizer_hash=current_sanitizer_hash,
             )
 
-            work_uids_processed.add(work_uid)
-            personal_uids_processed.add(personal_uid)
-
-        # Phase 2: Process new work events (not yet synced)
-        for work_uid, work_comp in work_events.items():
-            if work_uid not in work_uids_processed:
-                # Skip managed events — they are "Busy" blocks we created in
-                # work from personal events.  Syncing them back to personal
-                # would produce circular duplicates.
-                if EventSanitizer.is_managed_event(work_comp):
-                    logger.debug(f"Skipping managed work event: {work_uid}")
-                    continue
-                # Skip cancelled events — Exchange rejects creating them.
-                if is_event_cancelled(work_comp):
-                    logger.debug(f"Skipping cancelled work event: {work_uid}")
-                    continue
-                # Skip transparent (free-time) events — they don't block time
-                # and should not appear as busy in the personal calendar.
-                if is_free_time(work_comp):
-                    logger.debug(f"Skipping transparent work event: {work_uid}")
-                    continue
-                # Skip recurring series where every occurrence is excluded
-                # by EXDATE — Exchange rejects creating empty series.
-                # Check against the stripped iCal so that series whose EXDATEs
-                # are all "phantom" (covered by valid exception VEVENTs) are
-                # not incorrectly skipped.
-                _valid_ex_dates = work_valid_exception_dates.get(work_uid, set())
-                if _valid_ex_dates:
-                    _stripped = ICalGLib.Component.new_from_string(
-                        strip_exdates_for_dates(work_comp.as_ical_string(), _valid_ex_dates)
-                    )
-                    _has_valid = has_valid_occurrences(_stripped)
-                else:
-                    _has_valid = has_valid_occurrences(work_comp)
-                if not _has_valid:
-                    logger.debug(f"Skipping empty recurring work event: {work_uid}")
-                    continue
-                _process_new_work_event(
-                    config,
+            pending_writes += 1
+            if pending_writes >= COMMIT_BATCH_SIZE and not config.dry_run:
+                _apply_mirror_updates(
                     stats,
                     logger,
-                    work_uid,
-                    work_comp,
                     personal_client,
+                    personal_updates,
+                    "personal",
                     state_db,
-                    orphan_index=personal_orphan_index,
-                    valid_exception_dates=_valid_ex_dates,
                     sanitizer_hash=current_sanitizer_hash,
                 )
+                _apply_mirror_updates(stats, logger, work_client, work_updates, "work", state_db)
+                state_db.commit()
+                pending_writes = 0
+
+        # Changed pairs queued since the last commit: one batched modify (and
+        # one readback query) per calendar instead of two round trips per pair.
+        _apply_mirror_updates(
+            stats,
+            logger,
+            personal_client,
+            personal_updates,
+            "personal",
+            state_db,
+            sanitizer_hash=current_sanitizer_hash,
+        )
+        _apply_mirror_updates(stats, logger, work_client, work_updates, "work", state_db)
+
+        # Mirrors of deleted events, collected in Phase 1: one batched EDS call
+        # per calendar instead of a D-Bus round trip per mirror.
+        _remove_mirrors(stats, logger, personal_client, personal_removals, "personal", state_db)
+        _remove_mirrors(stats, logger, work_client, work_removals, "work", state_db)
+
+        # Pairs whose events are both gone: one IN (...) delete, committed with
+        # the rest of the run.  If the run dies first, the next one finds both
+        # sides gone again and repeats the cleanup.
+        if vanished_work_uids:
+            state_db.delete_by_source_uids(vanished_work_uids)
+
+        # Phases 2 and 3 only plan creates (skip checks, orphan recovery,
+        # sanitizing); the EDS writes happen afterwards in _create_mirrors.
+        new_personal_mirrors: list[tuple[str, str, ICalGLib.Component]] = []
+        new_work_mirrors: list[tuple[str, str, ICalGLib.Component]] = []
+
+        # Phase 2: Process new work events (not yet synced).  The unsynced
+        # UIDs are a C-level set difference; sorting keeps the order stable.
+        for work_uid in sorted(work_events.keys() - work_uids_processed):
+            work_comp = work_events[work_uid]
+            # Skip managed events — they are "Busy" blocks we created in
+            # work from personal events.  Syncing them back to personal
+            # would produce circular duplicates.
+            if EventSanitizer.is_managed_event(work_comp):
+                logger.debug("Skipping managed work event: %s", work_uid)
+                continue
+            # Skip cancelled events — Exchange rejects creating them.
+            if is_event_cancelled(work_comp):
+                logger.debug("Skipping cancelled work event: %s", work_uid)
+                continue
+            # Skip transparent (free-time) events — they don't block time
+            # and should not appear as busy in the personal calendar.
+            if is_free_time(work_comp):
+                logger.debug("Skipping transparent work event: %s", work_uid)
+                continue
+            # Skip recurring series where every occurrence is excluded
+            # by EXDATE — Exchange rejects creating empty series.
+            # Check against the stripped iCal so that series whose EXDATEs
+            # are all "phantom" (covered by valid exception VEVENTs) are
+            # not incorrectly skipped.
+            # The EXDATEs are removed from a clone of the parsed component,
+            # which _process_new_work_event then hashes and sanitizes as is.
+            _valid_ex_dates = work_valid_exception_dates.get(work_uid, set())
+            _stripped = work_comp
+            if _valid_ex_dates:
+                _stripped = remove_exdates_for_dates(work_comp.clone(), _valid_ex_dates)
+            if not has_valid_occurrences(_stripped):
+                logger.debug("Skipping empty recurring work event: %s", work_uid)
+                continue
+            _process_new_work_event(
+                config,
+                stats,
+                logger,
+                work_uid,
+                work_comp,
+                state_db,
+                new_personal_mirrors,
+                orphan_index=personal_orphan_index,
+                valid_exception_dates=_valid_ex_dates,
+                sanitizer_hash=current_sanitizer_hash,
+                work_sync_comp=_stripped,
+            )
 
         # Phase 3: Process new personal events (not yet synced)
-        for personal_uid, personal_comp in personal_events.items():
-            if personal_uid not in personal_uids_processed:
-                # Skip managed events — they are copies we created in personal
-                # from work events.  Syncing them back to work would produce
-                # circular duplicates.
-                if EventSanitizer.is_managed_event(personal_comp):
-                    logger.debug(f"Skipping managed personal event: {personal_uid}")
-                    continue
-                _process_new_personal_event(
-                    config,
-                    stats,
-                    logger,
-                    personal_uid,
-                    personal_comp,
-                    work_client,
-                    state_db,
-                    orphan_index=work_orphan_index,
-                )
+        for personal_uid in sorted(personal_events.keys() - personal_uids_processed):
+            personal_comp = personal_events[personal_uid]
+            # Skip managed events — they are copies we created in personal
+            # from work events.  Syncing them back to work would produce
+            # circular duplicates.
+            if EventSanitizer.is_managed_event(personal_comp):
+                logger.debug("Skipping managed personal event: %s", personal_uid)
+                continue
+            _process_new_personal_event(
+                config,
+                stats,
+                logger,
+                personal_uid,
+                personal_comp,
+                state_db,
+                new_work_mirrors,
+                orphan_index=work_orphan_index,
+            )
+
+        # Send the planned creates, COMMIT_BATCH_SIZE per calendar at a time.
+        # Each round writes to both calendars (one after the other) and is committed
+        # before the next, so an interrupted run leaves at most one round for
+        # the orphan indexes to re-link.
+        rounds = max(len(new_personal_mirrors), len(new_work_mirrors))
+        for start in range(0, rounds, COMMIT_BATCH_SIZE):
+            _create_mirrors(
+                stats,
+                logger,
+                work_client,
+                personal_client,
+                new_personal_mirrors[start : start + COMMIT_BATCH_SIZE],
+                new_work_mirrors[start : start + COMMIT_BATCH_SIZE],
+                state_db,
+                sanitizer_hash=current_sanitizer_hash,
+            )
+            state_db.commit()
 
-        # Commit changes
+        # Commit changes.  A run that wrote nothing records the revisions it
+        # started from; any write (ours included) changes a revision, so
+        # after a busy run the next one always does a full pass.
         if not config.dry_run:
+            idle = counts_before == (stats.added, stats.modified, stats.deleted, stats.errors)
+            if idle and work_revision and personal_revision:
+                state_db.set_idle_revisions(work_revision, personal_revision, settings_hash)
+            else:
+                state_db.clear_idle_revisions()
             state_db.commit()
 
     except CalendarSyncError as e:
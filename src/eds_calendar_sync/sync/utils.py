@@ -61,26 +61,78 @@ def is_not_found_error(e: Exception) -> bool:
     return "object not found" in str(e).lower()
 
 
-def compute_hash(ical_string: str) -> str:
-    """
-    Generate SHA256 hash of iCal content for change detection.
+# One-way creates/updates are committed in batches of this size rather than one
+# fsync per event.  An interrupted run loses at most one batch of state writes,
+# which the next run repairs: uncommitted creates are re-linked via the orphan
+# index (source fingerprint) and uncommitted updates are simply re-applied.
+COMMIT_BATCH_SIZE = 100
+
+# Number of UIDs shown in a batch debug line before it is truncated with "...".
+_UID_PREVIEW_COUNT = 10
 
-    Normalizes the content by removing volatile server-added properties
-    to prevent false change detection.
-    """
-    comp = ICalGLib.Component.new_from_string(ical_string)
 
-    # Properties that servers often add/modify and should be ignored for change detection
-    volatile_props = [
-        ICalGLib.PropertyKind.DTSTAMP_PROPERTY,  # Timestamp when event was created/modified
-        ICalGLib.PropertyKind.LASTMODIFIED_PROPERTY,  # Last modification time
-        ICalGLib.PropertyKind.CREATED_PROPERTY,  # Creation time
-        ICalGLib.PropertyKind.SEQUENCE_PROPERTY,  # Sequence number for updates
-    ]
+def log_uid_batch(logger: logging.Logger, action: str, uids: list[str]) -> None:
+    """Log a whole batch of UIDs as a single DEBUG line.
+
+    Bulk deletions used to emit one debug call per UID; on a large calendar
+    that is thousands of logger dispatches even with DEBUG disabled.  The
+    level check happens once here, and only the first few UIDs are listed.
+    """
+    if not uids or not logger.isEnabledFor(logging.DEBUG):
+        return
+    preview = ", ".join(uids[:_UID_PREVIEW_COUNT])
+    if len(uids) > _UID_PREVIEW_COUNT:
+        preview += ", ..."
+    logger.debug("%s %d events: %s", action, len(uids), preview)
+
+
+# Property kinds walked in per-property loops, hoisted so each iteration reads a
+# module global instead of resolving the enum through GI.
+_EXDATE_PROP = ICalGLib.PropertyKind.EXDATE_PROPERTY
+_ATTENDEE_PROP = ICalGLib.PropertyKind.ATTENDEE_PROPERTY
+_RECURRENCEID_PROP = ICalGLib.PropertyKind.RECURRENCEID_PROPERTY
+
+# Kinds and values read by the per-event predicates (is_event_cancelled,
+# is_free_time, has_valid_occurrences, ...), hoisted for the same reason: the
+# Phase 2 filters run them on every unpaired work event.
+_VCALENDAR_KIND = ICalGLib.ComponentKind.VCALENDAR_COMPONENT
+_VEVENT_KIND = ICalGLib.ComponentKind.VEVENT_COMPONENT
+_RRULE_PROP = ICalGLib.PropertyKind.RRULE_PROPERTY
+_STATUS_PROP = ICalGLib.PropertyKind.STATUS_PROPERTY
+_TRANSP_PROP = ICalGLib.PropertyKind.TRANSP_PROPERTY
+_STATUS_CANCELLED = ICalGLib.PropertyStatus.CANCELLED
+_TRANSP_TRANSPARENT = ICalGLib.PropertyTransp.TRANSPARENT
+
+
+def _as_vevent(comp: ICalGLib.Component) -> ICalGLib.Component | None:
+    """Return comp itself, or its first VEVENT when comp is a VCALENDAR wrapper."""
+    if comp.isa() == _VCALENDAR_KIND:
+        return comp.get_first_component(_VEVENT_KIND)
+    return comp
+
+
+# Digest used for stored content hashes.  It is deliberately not swapped for a
+# faster one (BLAKE2/BLAKE3): every state row holds a digest produced by this
+# function, so a new algorithm would make every event look changed on the next
+# run (a full rewrite one-way, a both-sides-edited conflict in two-way mode).
+# Hashing a VEVENT costs microseconds next to libical serialization and D-Bus.
+_CONTENT_DIGEST = hashlib.sha256
+
+# Properties that servers often add/modify and should be ignored for change detection
+_VOLATILE_PROPS = (
+    ICalGLib.PropertyKind.DTSTAMP_PROPERTY,  # Timestamp when event was created/modified
+    ICalGLib.PropertyKind.LASTMODIFIED_PROPERTY,  # Last modification time
+    ICalGLib.PropertyKind.CREATED_PROPERTY,  # Creation time
+    ICalGLib.PropertyKind.SEQUENCE_PROPERTY,  # Sequence number for updates
+)
+
+
+def _hash_normalized(comp: ICalGLib.Component) -> str:
+    """Strip volatile properties from comp (in place) and hash its serialization."""
 
     def normalize_vevent(event):
         """Remove volatile properties from a VEVENT."""
-        for prop_kind in volatile_props:
+        for prop_kind in _VOLATILE_PROPS:
             prop = event.get_first_property(prop_kind)
             while prop:
                 event.remove_property(prop)
@@ -96,7 +148,19 @@ def compute_hash(ical_string: str) -> str:
         normalize_vevent(comp)
 
     normalized_ical = comp.as_ical_string()
-    return hashlib.sha256(normalized_ical.encode("utf-8")).hexdigest()
+    return _CONTENT_DIGEST(normalized_ical.encode("utf-8")).hexdigest()
+
+
+def compute_component_hash(comp: ICalGLib.Component) -> str:
+    """
+    Generate SHA256 hash of an event component for change detection.
+
+    Normalizes a clone of comp by removing volatile server-added properties
+    to prevent false change detection; comp itself is left untouched.  The
+    digest is that of the normalized iCal text, the same value earlier
+    releases stored by hashing the event's string form.
+    """
+    return _hash_normalized(comp.clone())
 
 
 def compute_sanitizer_hash(config: "SyncConfig") -> str:
@@ -115,6 +179,27 @@ def compute_sanitizer_hash(config: "SyncConfig") -> str:
     return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
 
 
+def ical_date_key(t: ICalGLib.Time) -> str:
+    """Return t's calendar date as YYYYMMDD, the key used for EXDATE/RID date sets.
+
+    Sliced from t's iCal form (YYYYMMDD or YYYYMMDDTHHMMSS[Z]): one GI call
+    instead of three getters.
+    """
+    return t.as_ical_string()[:8]
+
+
+def ical_datetime_tuple(t: ICalGLib.Time) -> tuple[int, int, int, int, int, int]:
+    """Return t's (year, month, day, hour, minute, second) for cheap equality checks."""
+    return (
+        t.get_year(),
+        t.get_month(),
+        t.get_day(),
+        t.get_hour(),
+        t.get_minute(),
+        t.get_second(),
+    )
+
+
 def parse_component(obj) -> ICalGLib.Component:
     """Handle both string and native Component objects from EDS API."""
     if isinstance(obj, str):
@@ -131,33 +216,49 @@ def has_valid_occurrences(comp: ICalGLib.Component) -> bool:
 
     Returns True for non-recurring events and on any API error (safe fallback).
     """
-    check = comp
-    if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
-        check = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
-        if not check:
-            return True
+    check = _as_vevent(comp)
+    if not check:
+        return True
 
-    rrule_prop = check.get_first_property(ICalGLib.PropertyKind.RRULE_PROPERTY)
+    rrule_prop = check.get_first_property(_RRULE_PROP)
     if not rrule_prop:
         return True  # Non-recurring event always has a valid "occurrence"
 
+    # An open-ended RRULE (no COUNT, no UNTIL) yields dates without end, so a
+    # finite EXDATE set can never exclude them all.  Answer before walking the
+    # EXDATEs, the string fallback and the expansion.  Decided from the RRULE
+    # text: get_until() may silently fail in some libical-glib builds (see
+    # _RRULE_UNTIL_RE), which would make a bounded series look open-ended.
+    # A rule whose text cannot be read falls through to the full check below.
+    try:
+        rrule_str = (rrule_prop.get_value_as_string() or "").upper()
+    except Exception:
+        rrule_str = ""
+    if rrule_str and "UNTIL=" not in rrule_str and "COUNT=" not in rrule_str:
+        return True
+
     # Collect excluded dates as YYYYMMDD strings for quick lookup.
     # Try the ICalGLib accessor first; fall back to parsing the component's
     # iCal string directly when get_exdate() returns null_time (a known
     # silent failure for EXDATE;VALUE=DATE properties in some libical-glib
     # builds).
     exdates = set()
-    prop = check.get_first_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
+    unreadable_exdate = False
+    prop = check.get_first_property(_EXDATE_PROP)
     while prop:
         try:
             t = prop.get_exdate()
             if t and not t.is_null_time():
-                exdates.add(f"{t.get_year():04d}{t.get_month():02d}{t.get_day():02d}")
+                exdates.add(ical_date_key(t))
+            else:
+                unreadable_exdate = True
         except Exception:
-            pass
-        prop = check.get_next_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
+            unreadable_exdate = True
+        prop = check.get_next_property(_EXDATE_PROP)
 
-    if not exdates:
+    # Only re-serialize when an EXDATE property exists but could not be read;
+    # a series with no EXDATEs at all has nothing for the regex to find.
+    if not exdates and unreadable_exdate:
         # Fallback: parse the component's iCal string.  Use the top-level
         # comp (VCALENDAR when available) rather than the child VEVENT check
         # — calling as_ical_string() on a child component obtained via
@@ -220,7 +321,7 @@ def has_valid_occurrences(comp: ICalGLib.Component) -> bool:
             occ = it.next()
             if occ is None or occ.is_null_time():
                 break
-            occ_key = f"{occ.get_year():04d}{occ.get_month():02d}{occ.get_day():02d}"
+            occ_key = ical_date_key(occ)
             if until_str and occ_key > until_str:
                 break  # Past UNTIL — no further occurrences in this series
             if occ_key not in exdates:
@@ -245,16 +346,14 @@ def is_event_cancelled(comp: ICalGLib.Component) -> bool:
     (it tries to cancel an existing meeting that does not exist in the
     target calendar, returning ErrorItemNotFound).
     """
-    check = comp
-    if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
-        check = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
-        if not check:
-            return False
-    status_prop = check.get_first_property(ICalGLib.PropertyKind.STATUS_PROPERTY)
+    check = _as_vevent(comp)
+    if not check:
+        return False
+    status_prop = check.get_first_property(_STATUS_PROP)
     if not status_prop:
         return False
     try:
-        return status_prop.get_status() == ICalGLib.PropertyStatus.CANCELLED
+        return status_prop.get_status() == _STATUS_CANCELLED
     except (AttributeError, TypeError):
         val = status_prop.get_value_as_string() or ""
         return val.strip().upper() == "CANCELLED"
@@ -271,16 +370,14 @@ def is_free_time(comp: ICalGLib.Component) -> bool:
 
     The iCal default (no TRANSP property) is OPAQUE, which blocks time.
     """
-    check = comp
-    if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
-        check = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
-        if not check:
-            return False
-    transp_prop = check.get_first_property(ICalGLib.PropertyKind.TRANSP_PROPERTY)
+    check = _as_vevent(comp)
+    if not check:
+        return False
+    transp_prop = check.get_first_property(_TRANSP_PROP)
     if not transp_prop:
         return False  # Default is OPAQUE — event blocks time
     try:
-        return transp_prop.get_transp() == ICalGLib.PropertyTransp.TRANSPARENT
+        return transp_prop.get_transp() == _TRANSP_TRANSPARENT
     except (AttributeError, TypeError):
         val = transp_prop.get_value_as_string() or ""
         return val.strip().upper() == "TRANSPARENT"
@@ -295,13 +392,11 @@ def is_declined_by_user(comp: ICalGLib.Component, user_email: str) -> bool:
     """
     if not user_email:
         return False
-    check = comp
-    if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
-        check = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
-        if not check:
-            return False
+    check = _as_vevent(comp)
+    if not check:
+        return False
     email_lower = user_email.lower()
-    attendee_prop = check.get_first_property(ICalGLib.PropertyKind.ATTENDEE_PROPERTY)
+    attendee_prop = check.get_first_property(_ATTENDEE_PROP)
     while attendee_prop:
         val = attendee_prop.get_attendee() or ""
         if email_lower in val.lower():
@@ -314,7 +409,7 @@ def is_declined_by_user(comp: ICalGLib.Component, user_email: str) -> bool:
                     # as_ical_string() returns e.g. "PARTSTAT=DECLINED"
                     if "DECLINED" in (ps_p.as_ical_string() or "").upper():
                         return True
-        attendee_prop = check.get_next_property(ICalGLib.PropertyKind.ATTENDEE_PROPERTY)
+        attendee_prop = check.get_next_property(_ATTENDEE_PROP)
     return False
 
 
@@ -333,7 +428,9 @@ def strip_exdates_for_dates(ical_str: str, dates: set[str]) -> str:
         EXDATE;VALUE=DATE:20260303
         EXDATE;TZID=Europe/Berlin:20260303T110000
     """
-    if not dates:
+    # Substring test first: a body with no EXDATE at all is returned as-is
+    # without being split into lines.
+    if not dates or "EXDATE" not in ical_str:
         return ical_str
     lines = ical_str.splitlines(keepends=True)
     result = []
@@ -345,6 +442,62 @@ def strip_exdates_for_dates(ical_str: str, dates: set[str]) -> str:
     return "".join(result)
 
 
+def _exdate_key(prop: ICalGLib.Property) -> str | None:
+    """Return the YYYYMMDD date of an EXDATE property, or None when it cannot be read.
+
+    get_exdate() returns null_time for EXDATE;VALUE=DATE in some libical-glib
+    builds, and may raise on malformed values.
+    """
+    try:
+        t = prop.get_exdate()
+        if t and not t.is_null_time():
+            return ical_date_key(t)
+    except Exception:
+        pass
+    return None
+
+
+def remove_exdates_for_dates(comp: ICalGLib.Component, dates: set[str]) -> ICalGLib.Component:
+    """Component counterpart of strip_exdates_for_dates(); callers pass a clone.
+
+    Removes the EXDATEs of comp (or of each VEVENT in a VCALENDAR) whose date
+    is in ``dates`` and returns comp.  Hashing the result gives the same digest
+    as hashing the stripped string, without serializing the event and parsing
+    it back.
+
+    When any EXDATE cannot be read through get_exdate() (the VALUE=DATE
+    null_time quirk), comp is left untouched and a component re-parsed from
+    strip_exdates_for_dates(comp.as_ical_string(), dates) is returned instead,
+    so those phantom EXDATEs are removed by their text.
+    """
+    if not dates:
+        return comp
+    if comp.isa() == _VCALENDAR_KIND:
+        events = []
+        event = comp.get_first_component(_VEVENT_KIND)
+        while event:
+            events.append(event)
+            event = comp.get_next_component(_VEVENT_KIND)
+    else:
+        events = [comp]
+    # Collect first: removing a property while walking the list would
+    # invalidate libical's internal iterator.
+    doomed = []
+    for event in events:
+        prop = event.get_first_property(_EXDATE_PROP)
+        while prop:
+            key = _exdate_key(prop)
+            if key is None:
+                stripped = strip_exdates_for_dates(comp.as_ical_string(), dates)
+                return ICalGLib.Component.new_from_string(stripped)
+            if key in dates:
+                doomed.append((event, prop))
+            prop = event.get_next_property(_EXDATE_PROP)
+    for event, prop in doomed:
+        event.remove_property(prop)
+    return comp
+
+
 def compute_source_fingerprint(source_uid: str) -> str:
     """Return the 16-char hex SHA-256 fingerprint of source_uid."""
     return hashlib.sha256(source_uid.encode()).hexdigest()[:16]
@@ -354,12 +507,21 @@ def build_orphan_index(
     target_client: "EDSCalendarClient",
     state_db: "StateDatabase",
     logger,
-) -> dict[str, str]:
+    events: list | None = None,
+    tracked_uids: set[str] | None = None,
+) -> dict[str, ICalGLib.Component]:
     """Scan target calendar for managed events not recorded in the state DB.
 
-    Returns a dict mapping source_fingerprint → target_uid for orphaned
+    Returns a dict mapping source_fingerprint → component for orphaned
     managed events (events created by a previous sync run that crashed
-    before the DB record was committed).
+    before the DB record was committed).  The components are the ones the
+    scan already fetched, so recovering an orphan needs no further EDS call.
+
+    When events is given (the calendar's full listing, already fetched and
+    possibly parsed by the caller) it is scanned instead of querying EDS, so
+    a caller that needs every event anyway pays for one fetch, not two.
+    Likewise tracked_uids, when given, replaces the state DB lookup of UIDs
+    that already have a record.
 
     Events that already have a state record are excluded from the result.
     Events without a fingerprint (created before Fix 3 was deployed) are
@@ -367,15 +529,27 @@ def build_orphan_index(
     """
     from eds_calendar_sync.sanitizer import EventSanitizer
 
-    orphans: dict[str, str] = {}
-    try:
-        all_events = target_client.get_all_events()
-    except Exception as e:
-        logger.warning(f"Orphan scan: could not fetch events: {e}")
-        return orphans
-
-    for obj in all_events:
+    orphans: dict[str, ICalGLib.Component] = {}
+    if events is not None:
+        managed_events = events
+    else:
+        try:
+            # EDS filters on the marker category, so unmanaged events are never fetched
+            managed_events = target_client.get_managed_events()
+        except Exception as e:
+            logger.warning(f"Orphan scan: could not fetch events: {e}")
+            return orphans
+
+    # Every UID the state DB knows for this pair, loaded once.  Managed events
+    # in the personal calendar are stored as target_uid; managed events in the
+    # work calendar are stored as source_uid.  Check both to handle either.
+    if tracked_uids is None:
+        tracked_uids = state_db.get_tracked_uids()
+
+    for obj in managed_events:
         comp = parse_component(obj)
+        # Re-check locally: a full listing includes unmanaged events, and a
+        # filtered one must not depend on backend sexp support
         if not EventSanitizer.is_managed_event(comp):
             continue
 
@@ -384,20 +558,15 @@ def build_orphan_index(
             continue  # Pre-Fix-3 event: no fingerprint, cannot link
 
         target_uid = comp.get_uid()
-        if not target_uid:
+        if not target_uid or target_uid in tracked_uids:
             continue
 
-        # Skip if already tracked in state DB.
-        # Managed events in the personal calendar are stored as target_uid;
-        # managed events in the work calendar are stored as source_uid.
-        # Check both to handle either calendar.
-        if (
-            state_db.get_by_target_uid(target_uid) is not None
-            or state_db.get_by_source_uid(target_uid) is not None
-        ):
+        # Detached instances share the master's UID; keep the master so the
+        # recovered hash matches what get_event(uid) would have returned.
+        if fingerprint in orphans and comp.get_first_property(_RECURRENCEID_PROP):
             continue
 
-        orphans[fingerprint] = target_uid
+        orphans[fingerprint] = comp
         logger.debug(f"Orphan scan: found untracked managed event {target_uid} (fp={fingerprint})")
 
     if orphans:
@@ -9,9 +9,7 @@ from pathlib import Path
 
 import gi
 
-gi.require_version("EDataServer", "1.2")
 gi.require_version("ICalGLib", "3.0")
-from gi.repository import EDataServer
 from gi.repository import ICalGLib
 from rich.console import Console
 from rich.panel import Panel
@@ -21,13 +19,15 @@ from rich.text import Text
 from eds_calendar_sync.db import StateDatabase
 from eds_calendar_sync.eds_client import EDSCalendarClient
 from eds_calendar_sync.eds_client import get_calendar_display_info
+from eds_calendar_sync.eds_client import get_source_registry
 from eds_calendar_sync.sanitizer import EventSanitizer
-from eds_calendar_sync.sync.utils import compute_hash
+from eds_calendar_sync.sync.utils import compute_component_hash
 from eds_calendar_sync.sync.utils import has_valid_occurrences
+from eds_calendar_sync.sync.utils import ical_date_key
 from eds_calendar_sync.sync.utils import is_event_cancelled
 from eds_calendar_sync.sync.utils import is_free_time
 from eds_calendar_sync.sync.utils import parse_component
-from eds_calendar_sync.sync.utils import strip_exdates_for_dates
+from eds_calendar_sync.sync.utils import remove_exdates_for_dates
 
 _logger = logging.getLogger(__name__)
 
@@ -35,6 +35,12 @@ _logger = logging.getLogger(__name__)
 _RRULE_UNTIL_RE = re.compile(r"UNTIL=(\d{8})")
 _EXDATE_DATE_RE = re.compile(r"^EXDATE[^:\n]*:(\d{8})", re.MULTILINE)
 
+# Property kinds probed for every fetched event, hoisted so the loops read a
+# module global instead of resolving the enum through GI each time.
+_RECURRENCEID_PROP = ICalGLib.PropertyKind.RECURRENCEID_PROPERTY
+_DTSTART_PROP = ICalGLib.PropertyKind.DTSTART_PROPERTY
+_EXDATE_PROP = ICalGLib.PropertyKind.EXDATE_PROPERTY
+
 
 def _has_occurrence_in_window(
     comp: ICalGLib.Component, window_start: date, window_end: date
@@ -63,9 +69,7 @@ def _has_occurrence_in_window(
         if not rrule_prop:
             try:
                 dtstart = check.get_dtstart()
-                dtstart_str = (
-                    f"{dtstart.get_year():04d}{dtstart.get_month():02d}{dtstart.get_day():02d}"
-                )
+                dtstart_str = ical_date_key(dtstart)
                 return win_start_str <= dtstart_str <= win_end_str
             except Exception:
                 return True
@@ -74,17 +78,20 @@ def _has_occurrence_in_window(
 
         # a. Collect EXDATEs (same two-path fallback as has_valid_occurrences).
         exdates: set[str] = set()
-        prop = check.get_first_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
+        unreadable_exdate = False
+        prop = check.get_first_property(_EXDATE_PROP)
         while prop:
             try:
                 t = prop.get_exdate()
                 if t and not t.is_null_time():
-                    exdates.add(f"{t.get_year():04d}{t.get_month():02d}{t.get_day():02d}")
+                    exdates.add(ical_date_key(t))
+                else:
+                    unreadable_exdate = True
             except Exception:
-                pass
-            prop = check.get_next_property(ICalGLib.PropertyKind.EXDATE_PROPERTY)
+                unreadable_exdate = True
+            prop = check.get_next_property(_EXDATE_PROP)
 
-        if not exdates:
+        if not exdates and unreadable_exdate:
             # Fallback: parse the root component's iCal string directly.
             try:
                 for m in _EXDATE_DATE_RE.finditer(comp.as_ical_string() or ""):
@@ -123,7 +130,7 @@ def _has_occurrence_in_window(
             occ = it.next()
             if occ is None or occ.is_null_time():
                 break
-            occ_key = f"{occ.get_year():04d}{occ.get_month():02d}{occ.get_day():02d}"
+            occ_key = ical_date_key(occ)
             if until_str and occ_key > until_str:
                 break  # Past UNTIL — series has ended
             if occ_key in exdates:
@@ -159,7 +166,7 @@ def _get_date_str(comp: ICalGLib.Component) -> str:
         check = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
         if not check:
             return "?"
-    dp = check.get_first_property(ICalGLib.PropertyKind.DTSTART_PROPERTY)
+    dp = check.get_first_property(_DTSTART_PROP)
     if not dp:
         return "?"
     try:
@@ -195,7 +202,7 @@ def run_verify(
     # ------------------------------------------------------------------
     # Step 1 — Connect & fetch
     # ------------------------------------------------------------------
-    registry = EDataServer.SourceRegistry.new_sync(None)
+    registry = get_source_registry()
     work_client = EDSCalendarClient(registry, work_calendar_id)
     personal_client = EDSCalendarClient(registry, personal_calendar_id)
     work_client.connect()
@@ -222,24 +229,20 @@ def run_verify(
     # Step 2 — Build work event map (mirrors two_way.py lines 477–533)
     # ------------------------------------------------------------------
     work_events: dict[str, ICalGLib.Component] = {}
-    for obj in work_events_list:
-        comp = parse_component(obj)
-        # Keep only master VEVENTs (no RECURRENCE-ID).
-        if comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY):
-            continue
-        uid = comp.get_uid()
-        if uid:
-            work_events[uid] = comp
-
     # Build map from work UID → set of YYYYMMDD dates that have a valid
     # (non-managed, non-cancelled, non-free) exception VEVENT.
     # Also detect rescheduled exceptions and add them with compound keys.
     work_valid_exception_dates: dict[str, set[str]] = {}
+    # Single pass: master VEVENTs (no RECURRENCE-ID) go into work_events and
+    # exception VEVENTs are analysed inline, so each object is parsed once.
     for _obj in work_events_list:
         _comp = parse_component(_obj)
-        _rid_prop = _comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY)
+        _rid_prop = _comp.get_first_property(_RECURRENCEID_PROP)
         if not _rid_prop:
-            continue  # master VEVENT — handled above
+            _uid = _comp.get_uid()
+            if _uid:
+                work_events[_uid] = _comp
+            continue
         if EventSanitizer.is_managed_event(_comp):
             continue
         if is_event_cancelled(_comp):
@@ -251,12 +254,12 @@ def run_verify(
             continue
         try:
             _rid_t = _rid_prop.get_recurrenceid()
-            _rid_date = f"{_rid_t.get_year():04d}{_rid_t.get_month():02d}{_rid_t.get_day():02d}"
-            _dts_prop = _comp.get_first_property(ICalGLib.PropertyKind.DTSTART_PROPERTY)
+            _rid_date = ical_date_key(_rid_t)
+            _dts_prop = _comp.get_first_property(_DTSTART_PROP)
             _is_rescheduled = False
             if _dts_prop:
                 _dts = _dts_prop.get_dtstart()
-                _dts_date = f"{_dts.get_year():04d}{_dts.get_month():02d}{_dts.get_day():02d}"
+                _dts_date = ical_date_key(_dts)
                 _is_rescheduled = _dts_date != _rid_date
             if _is_rescheduled:
                 # Rescheduled: treat as a standalone event keyed by compound UID.
@@ -306,7 +309,7 @@ def run_verify(
     personal_events: dict[str, ICalGLib.Component] = {}
     for obj in personal_events_list:
         comp = parse_component(obj)
-        if comp.get_first_property(ICalGLib.PropertyKind.RECURRENCEID_PROPERTY):
+        if comp.get_first_property(_RECURRENCEID_PROP):
             continue
         uid = comp.get_uid()
         if uid:
@@ -364,10 +367,14 @@ def run_verify(
         # Hash check: compare current work event hash with stored source_hash.
         try:
             base_uid = uid.split("::RID::")[0] if "::RID::" in uid else uid
-            dates_to_strip = work_valid_exception_dates.get(base_uid, set())
-            current_ical = comp.as_ical_string()
-            stripped_ical = strip_exdates_for_dates(current_ical, dates_to_strip)
-            current_hash = compute_hash(stripped_ical)
+            dates_to_strip = work_valid_exception_dates.get(base_uid)
+            # Most events have no phantom EXDATEs: hash the parsed component
+            # as-is instead of serializing it and parsing the text back.
+            if dates_to_strip:
+                hash_comp = remove_exdates_for_dates(comp.clone(), dates_to_strip)
+            else:
+                hash_comp = comp
+            current_hash = compute_component_hash(hash_comp)
             if current_hash != row["source_hash"]:
                 stale.append((uid, comp, personal_uid))
                 continue
@@ -10,6 +10,8 @@ import gi
 gi.require_version("ICalGLib", "3.0")
 from gi.repository import ICalGLib
 
+from eds_calendar_sync.sanitizer import EventSanitizer
+
 
 class FakeCalendarClient:
     """In-memory stub that satisfies the EDSCalendarClient duck-type contract."""
@@ -20,6 +22,9 @@ class FakeCalendarClient:
         self.creates: list[str] = []
         self.modifies: list[str] = []
         self.removes: list[str] = []
+        self.fetches = 0
+        # Bumped on every write, like an EDS backend's revision property
+        self._revision = 0
 
     # ------------------------------------------------------------------ #
     # Internal helpers                                                      #
@@ -39,30 +44,74 @@ class FakeCalendarClient:
 
     def get_all_events(self) -> list:
         """Return all stored events as iCal strings (parse_component handles strings)."""
+        self.fetches += 1
         return list(self._events.values())
 
+    def get_managed_events(self) -> list:
+        """Return stored events carrying the managed marker category (server-side filter)."""
+        return [
+            ical_str
+            for ical_str in self._events.values()
+            if EventSanitizer.is_managed_event(ICalGLib.Component.new_from_string(ical_str))
+        ]
+
+    def get_unmanaged_events(self) -> list:
+        """Return stored events without the managed marker category (server-side filter)."""
+        return [
+            ical_str
+            for ical_str in self._events.values()
+            if not EventSanitizer.is_managed_event(ICalGLib.Component.new_from_string(ical_str))
+        ]
+
+    def query_managed_uids(self) -> list[str]:
+        """Return UIDs of managed events, filtered like EDSCalendarClient.query_managed_uids."""
+        return EventSanitizer.managed_uids(self.get_managed_events())
+
     def create_event(self, component: ICalGLib.Component) -> str | None:
         """Store component and return its UID (simulating the server-assigned UID)."""
         uid = self._uid_from_component(component)
         ical_str = component.as_ical_string()
         if uid:
             self._events[uid] = ical_str
+        self._revision += 1
         self.creates.append(uid)
         return uid
 
+    def create_events(
+        self, components: list[ICalGLib.Component], batch_size: int = 100
+    ) -> list[str | Exception]:
+        """Store every component; the fake never fails, so every entry is a UID."""
+        return [self.create_event(component) for component in components]
+
     def modify_event(self, component: ICalGLib.Component):
         """Overwrite the stored iCal for the component's UID."""
         uid = self._uid_from_component(component)
         ical_str = component.as_ical_string()
         if uid:
             self._events[uid] = ical_str
+        self._revision += 1
         self.modifies.append(uid)
 
+    def modify_events(
+        self, components: list[ICalGLib.Component], batch_size: int = 100
+    ) -> dict[str, Exception]:
+        """Modify every component; the fake never fails, so no failures are returned."""
+        for component in components:
+            self.modify_event(component)
+        return {}
+
     def remove_event(self, uid: str):
         """Delete the event with the given UID."""
         self._events.pop(uid, None)
+        self._revision += 1
         self.removes.append(uid)
 
+    def remove_events(self, uids: list[str], batch_size: int = 500) -> dict[str, Exception]:
+        """Delete every UID in uids; the fake never fails, so no failures are returned."""
+        for uid in uids:
+            self.remove_event(uid)
+        return {}
+
     def get_event(self, uid: str) -> ICalGLib.Component | None:
         """Return the stored event as an ICalGLib.Component, or None if not found."""
         ical_str = self._events.get(uid)
@@ -70,6 +119,14 @@ class FakeCalendarClient:
             return None
         return ICalGLib.Component.new_from_string(ical_str)
 
+    def get_revision(self) -> str | None:
+        """Return the write counter as the calendar's revision."""
+        return str(self._revision)
+
+    def get_events(self, uids: list[str], batch_size: int = 100) -> dict[str, ICalGLib.Component]:
+        """Return the stored events for uids as components; missing UIDs are omitted."""
+        return {uid: self.get_event(uid) for uid in uids if uid in self._events}
+
     # ------------------------------------------------------------------ #
     # Test helpers                                                          #
     # ------------------------------------------------------------------ #
@@ -81,8 +138,14 @@ class FakeCalendarClient:
     def has_uid(self, uid: str) -> bool:
         return uid in self._events
 
+    def put(self, uid: str, ical_str: str):
+        """Store an event as an external edit would (bumps the revision)."""
+        self._events[uid] = ical_str
+        self._revision += 1
+
     def reset_counters(self):
-        """Clear the create/modify/remove lists between sync runs."""
+        """Clear the create/modify/remove lists and fetch count between sync runs."""
         self.creates.clear()
         self.modifies.clear()
         self.removes.clear()
+        self.fetches = 0
@@ -0,0 +1,102 @@
+"""
+Integration tests: refresh and clear remove only managed events.
+
+Uses FakeCalendarClient + a real SQLite StateDatabase so the refresh/clear
+functions run end-to-end without an EDS daemon.
+"""
+
+from eds_calendar_sync.models import SyncStats
+from eds_calendar_sync.sync.refresh import perform_clear
+from eds_calendar_sync.sync.refresh import perform_refresh
+from eds_calendar_sync.sync.refresh import perform_refresh_two_way
+from tests.conftest import make_managed_vevent
+from tests.conftest import make_vevent
+from tests.fake_client import FakeCalendarClient
+
+
+class TestRefreshTwoWay:
+    def test_removes_tracked_events_and_clears_state(self, state_db, sync_config, sync_logger):
+        """Tracked mirrors are removed from the right calendar; originals are untouched."""
+        work_client = FakeCalendarClient(
+            {"W1": make_vevent("W1"), "W_m1": make_managed_vevent("W_m1")}
+        )
+        personal_client = FakeCalendarClient(
+            {"P1": make_vevent("P1"), "P_m1": make_managed_vevent("P_m1")}
+        )
+        state_db.insert_bidirectional("W1", "P_m1", "hw1", "hpm1", "source")
+        state_db.insert_bidirectional("W_m1", "P1", "hwm1", "hp1", "target")
+        state_db.commit()
+
+        perform_refresh_two_way(
+            sync_config, SyncStats(), sync_logger, work_client, personal_client, state_db
+        )
+
+        assert work_client.removes == ["W_m1"]
+        assert personal_client.removes == ["P_m1"]
+        assert work_client.has_uid("W1") and personal_client.has_uid("P1")
+        assert state_db.get_all_state_bidirectional() == []
+
+    def test_falls_back_to_metadata_scan_when_state_empty(self, state_db, sync_config, sync_logger):
+        """With no state records, managed events are found via CATEGORIES."""
+        work_client = FakeCalendarClient(
+            {"W1": make_vevent("W1"), "W_m1": make_managed_vevent("W_m1")}
+        )
+        personal_client = FakeCalendarClient({"P_m1": make_managed_vevent("P_m1")})
+
+        perform_refresh_two_way(
+            sync_config, SyncStats(), sync_logger, work_client, personal_client, state_db
+        )
+
+        assert work_client.removes == ["W_m1"]
+        assert personal_client.removes == ["P_m1"]
+
+
+class _UnfilteredManagedQueryClient(FakeCalendarClient):
+    """Fake whose backend ignores the has-categories? sexp and returns everything."""
+
+    def get_managed_events(self) -> list:
+        return list(self._events.values())
+
+
+class TestRefresh:
+    def test_metadata_scan_never_deletes_unmanaged_events(self, state_db, sync_config, sync_logger):
+        """An unmanaged event leaking through the managed query is not removed."""
+        personal_client = _UnfilteredManagedQueryClient(
+            {"P1": make_vevent("P1"), "P_m1": make_managed_vevent("P_m1")}
+        )
+
+        perform_refresh(sync_config, SyncStats(), sync_logger, personal_client, state_db)
+
+        assert personal_client.removes == ["P_m1"]
+        assert personal_client.has_uid("P1")
+
+    def test_duplicate_target_uid_is_removed_once(self, state_db, sync_config, sync_logger):
+        """Two state rows pointing at one mirror produce a single removal."""
+        personal_client = FakeCalendarClient({"P_m1": make_managed_vevent("P_m1")})
+        state_db.insert("W1", "P_m1", "hw1")
+        state_db.insert("W2", "P_m1", "hw2")
+        state_db.commit()
+
+        perform_refresh(sync_config, SyncStats(), sync_logger, personal_client, state_db)
+
+        assert personal_client.removes == ["P_m1"]
+        assert state_db.get_all_state() == {}
+
+
+class TestClear:
+    def test_clear_removes_managed_events_only(self, state_db, sync_config, sync_logger):
+        """perform_clear() deletes every managed event and counts them in stats."""
+        work_client = FakeCalendarClient(
+            {"W1": make_vevent("W1"), "W_m1": make_managed_vevent("W_m1")}
+        )
+        personal_client = FakeCalendarClient(
+            {"P_m1": make_managed_vevent("P_m1"), "P_m2": make_managed_vevent("P_m2")}
+        )
+        stats = SyncStats()
+
+        perform_clear(sync_config, stats, sync_logger, work_client, personal_client, state_db)
+
+        assert work_client.event_count == 1 and work_client.has_uid("W1")
+        assert personal_client.event_count == 0
+        assert stats.deleted == 3
+        assert stats.errors == 0
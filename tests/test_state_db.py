@@ -39,6 +39,14 @@ class TestReadPaths:
         assert set(result.keys()) == {"P1"}
         assert result["P1"]["source_uid"] == "W_m1"
 
+    def test_tracked_uids_covers_both_columns(self, state_db):
+        """get_tracked_uids() returns source and target UIDs of every origin."""
+        state_db.insert_bidirectional("W1", "P_m1", "hw1", "hpm1", "source")
+        state_db.insert_bidirectional("W_m1", "P1", "hwm1", "hp1", "target")
+        state_db.commit()
+
+        assert state_db.get_tracked_uids() == {"W1", "P_m1", "W_m1", "P1"}
+
 
 class TestUpsertSemantics:
     def test_upsert_on_conflict_updates_not_errors(self, state_db):
@@ -73,6 +81,39 @@ class TestUpsertSemantics:
         assert row["last_sync_at"] >= original_created_at
 
 
+class TestBulkUpdates:
+    def test_update_hashes_many_updates_each_pair(self, state_db):
+        """update_hashes_many() writes every row's hashes and the shared sanitizer hash."""
+        state_db.insert_bidirectional("W1", "P_m1", "hw1", "hpm1", "source")
+        state_db.insert_bidirectional("W2", "P_m2", "hw2", "hpm2", "source")
+        state_db.commit()
+
+        state_db.update_hashes_many(
+            [("W1", "P_m1", "nw1", "npm1"), ("W2", "P_m2", "nw2", "npm2")], sanitizer_hash="s1"
+        )
+        state_db.commit()
+
+        rows = {row["source_uid"]: row for row in state_db.get_all_state_bidirectional()}
+        assert (rows["W1"]["source_hash"], rows["W1"]["target_hash"]) == ("nw1", "npm1")
+        assert (rows["W2"]["source_hash"], rows["W2"]["target_hash"]) == ("nw2", "npm2")
+        assert {row["sanitizer_hash"] for row in rows.values()} == {"s1"}
+
+    def test_insert_bidirectional_many_upserts_rows(self, state_db):
+        """insert_bidirectional_many() inserts new rows and updates existing ones."""
+        state_db.insert_bidirectional("W1", "P_old", "hw1", "hp_old", "source")
+        state_db.commit()
+
+        state_db.insert_bidirectional_many(
+            [("W1", "P_m1", "nw1", "npm1"), ("W2", "P_m2", "hw2", "hpm2")], "source"
+        )
+        state_db.commit()
+
+        rows = {row["source_uid"]: row for row in state_db.get_all_state_bidirectional()}
+        assert rows["W1"]["target_uid"] == "P_m1"
+        assert rows["W1"]["target_hash"] == "npm1"
+        assert rows["W2"]["origin"] == "source"
+
+
 class TestCalendarPairScoping:
     def test_bidirectional_scoped_to_calendar_pair(self, state_db, db_path):
         """Records from a different calendar pair are invisible to the current pair."""
@@ -119,3 +160,17 @@ class TestDeletion:
         rows = state_db.get_all_state_bidirectional()
         assert len(rows) == 1
         assert rows[0]["source_uid"] == "W2"
+
+    def test_delete_by_target_uids_removes_only_listed_rows(self, state_db):
+        """delete_by_target_uids() drops every listed target and leaves the rest."""
+        state_db.insert_bidirectional("W1", "P_m1", "h1", "h2", "source")
+        state_db.insert_bidirectional("W2", "P_m2", "h3", "h4", "source")
+        state_db.insert_bidirectional("W_m3", "P3", "h5", "h6", "target")
+        state_db.commit()
+
+        state_db.delete_by_target_uids(["P_m1", "P3"])
+        state_db.delete_by_target_uids([])
+        state_db.commit()
+
+        rows = state_db.get_all_state_bidirectional()
+        assert [r["source_uid"] for r in rows] == ["W2"]
@@ -241,3 +241,31 @@ def test_mixed_one_ways_then_both_is_noop(state_db, sync_config, sync_logger):
 
     assert len(work_client.creates) == 0
     assert len(personal_client.creates) == 0
+
+
+def test_both_skips_when_neither_calendar_changed(state_db, sync_config, sync_logger):
+    """
+    Once a --both run finds nothing to do, a later --both with the same
+    calendar revisions is skipped without fetching; an external edit to
+    either calendar makes the next run do a full pass again.
+    """
+    work_client = _work_client()
+    personal_client = _personal_client()
+
+    # Run 1 creates the mirrors; run 2 finds nothing to do and records the revisions
+    _run_both(sync_config, sync_logger, work_client, personal_client, state_db)
+    stats2 = _run_both(sync_config, sync_logger, work_client, personal_client, state_db)
+    assert (stats2.added, stats2.modified, stats2.deleted, stats2.errors) == (0, 0, 0, 0)
+
+    # Run 3: nothing changed → no fetch at all
+    work_client.reset_counters()
+    personal_client.reset_counters()
+    _run_both(sync_config, sync_logger, work_client, personal_client, state_db)
+    assert work_client.fetches == 0 and personal_client.fetches == 0
+
+    # Run 4: a new work event → full pass, mirrored to personal
+    work_client.put("W3", make_vevent("W3", "Work Meeting 3"))
+    stats4 = _run_both(sync_config, sync_logger, work_client, personal_client, state_db)
+    assert work_client.fetches == 1
+    assert stats4.added == 1
+    assert personal_client.event_count == 5
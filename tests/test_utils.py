@@ -6,6 +6,9 @@ exercised (null_time from VALUE=DATE EXDATEs, RecurIterator UNTIL capping,
 child-component as_ical_string() fragility, etc.).
 """
 
+import hashlib
+import logging
+
 import gi
 
 gi.require_version("GLib", "2.0")
@@ -13,13 +16,23 @@ gi.require_version("ICalGLib", "3.0")
 from gi.repository import GLib
 from gi.repository import ICalGLib
 
-from eds_calendar_sync.sync.utils import compute_hash
+from eds_calendar_sync.sync import utils
+from eds_calendar_sync.sync.utils import build_orphan_index
+from eds_calendar_sync.sync.utils import compute_component_hash
+from eds_calendar_sync.sync.utils import compute_source_fingerprint
 from eds_calendar_sync.sync.utils import has_valid_occurrences
+from eds_calendar_sync.sync.utils import ical_date_key
+from eds_calendar_sync.sync.utils import ical_datetime_tuple
 from eds_calendar_sync.sync.utils import is_declined_by_user
 from eds_calendar_sync.sync.utils import is_event_cancelled
 from eds_calendar_sync.sync.utils import is_free_time
 from eds_calendar_sync.sync.utils import is_not_found_error
+from eds_calendar_sync.sync.utils import log_uid_batch
+from eds_calendar_sync.sync.utils import remove_exdates_for_dates
 from eds_calendar_sync.sync.utils import strip_exdates_for_dates
+from tests.conftest import make_managed_vevent
+from tests.conftest import make_vevent
+from tests.fake_client import FakeCalendarClient
 
 # ---------------------------------------------------------------------------
 # Module-level iCal construction helpers
@@ -66,6 +79,40 @@ def _parse(ical_str: str) -> ICalGLib.Component:
     return ICalGLib.Component.new_from_string(ical_str)
 
 
+def _hash(ical_str: str) -> str:
+    return compute_component_hash(_parse(ical_str))
+
+
+def _released_string_hash(ical_str: str) -> str:
+    """Digest stored by releases that hashed the event's iCal string.
+
+    Kept as an independent reference: parse, drop the volatile properties,
+    reserialize and SHA-256 the text, as the old compute_hash() did.
+    """
+    comp = _parse(ical_str)
+    kinds = (
+        ICalGLib.PropertyKind.DTSTAMP_PROPERTY,
+        ICalGLib.PropertyKind.LASTMODIFIED_PROPERTY,
+        ICalGLib.PropertyKind.CREATED_PROPERTY,
+        ICalGLib.PropertyKind.SEQUENCE_PROPERTY,
+    )
+    if comp.isa() == ICalGLib.ComponentKind.VCALENDAR_COMPONENT:
+        events = []
+        event = comp.get_first_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
+        while event:
+            events.append(event)
+            event = comp.get_next_component(ICalGLib.ComponentKind.VEVENT_COMPONENT)
+    else:
+        events = [comp]
+    for event in events:
+        for kind in kinds:
+            prop = event.get_first_property(kind)
+            while prop:
+                event.remove_property(prop)
+                prop = event.get_first_property(kind)
+    return hashlib.sha256(comp.as_ical_string().encode("utf-8")).hexdigest()
+
+
 def _simple_vevent(uid: str) -> str:
     return (
         f"BEGIN:VEVENT\r\n"
@@ -133,6 +180,33 @@ class TestHasValidOccurrences:
         )
         assert has_valid_occurrences(comp) is False
 
+    def test_open_ended_rrule_is_valid_despite_exdates(self):
+        """No COUNT and no UNTIL → valid without expansion, whatever the EXDATEs."""
+        comp = _parse(
+            _make_rrule_vevent(
+                "ROE1",
+                rrule="FREQ=DAILY",
+                exdates=("20260301", "20260302", "20260303"),
+            )
+        )
+        assert has_valid_occurrences(comp) is True
+
+    def test_until_bounded_all_excluded_is_not_open_ended(self):
+        """An RRULE with UNTIL= (no COUNT=) is expanded, not short-circuited."""
+        comp = _parse(
+            _make_rrule_vevent(
+                "RUB1",
+                rrule="FREQ=DAILY;UNTIL=20260302T235959Z",
+                exdates=("20260301", "20260302"),
+            )
+        )
+        assert has_valid_occurrences(comp) is False
+
+    def test_open_ended_rrule_in_vcalendar_is_valid(self):
+        """The open-ended shortcut also applies to a VCALENDAR-wrapped series."""
+        vevent = _make_rrule_vevent("ROE2", rrule="FREQ=WEEKLY", exdates=("20260301",))
+        assert has_valid_occurrences(_parse(_wrap_vcalendar(vevent))) is True
+
     def test_value_date_exdate_fallback_all_excluded(self):
         """EXDATE;VALUE=DATE lines that exclude every occurrence → False.
 
@@ -190,6 +264,40 @@ class TestHasValidOccurrences:
         assert has_valid_occurrences(comp) is False
 
 
+# ---------------------------------------------------------------------------
+# TestRemoveExdatesForDates
+# ---------------------------------------------------------------------------
+
+
+class TestRemoveExdatesForDates:
+    def test_removes_only_matching_dates(self):
+        """Only EXDATEs whose date is in the set are removed from the component."""
+        comp = _parse(_make_rrule_vevent("RED1", exdates=("20260301", "20260302")))
+        ical = remove_exdates_for_dates(comp, {"20260302"}).as_ical_string()
+        assert "EXDATE;VALUE=DATE:20260301" in ical
+        assert "EXDATE;VALUE=DATE:20260302" not in ical
+
+    def test_hash_matches_string_strip(self):
+        """Stripping the component hashes the same as stripping its iCal string."""
+        ical = _make_rrule_vevent("RED2", exdates=("20260301", "20260303"))
+        comp = _parse(ical)
+        comp = remove_exdates_for_dates(comp, {"20260303"})
+        assert compute_component_hash(comp) == _hash(strip_exdates_for_dates(ical, {"20260303"}))
+
+    def test_unreadable_exdate_falls_back_to_string_strip(self, monkeypatch):
+        """When get_exdate() yields null_time, the EXDATEs are stripped by their text."""
+        # Simulate the libical-glib builds that cannot read EXDATE;VALUE=DATE
+        monkeypatch.setattr(utils, "_exdate_key", lambda prop: None)
+        ical = _make_rrule_vevent("RED3", exdates=("20260301", "20260303"))
+        comp = _parse(ical)
+        result = remove_exdates_for_dates(comp, {"20260303"})
+        assert "EXDATE;VALUE=DATE:20260303" not in result.as_ical_string()
+        assert "EXDATE;VALUE=DATE:20260301" in result.as_ical_string()
+        assert compute_component_hash(result) == _hash(strip_exdates_for_dates(ical, {"20260303"}))
+        # The caller's component is not half-edited on the fallback path
+        assert "EXDATE;VALUE=DATE:20260303" in comp.as_ical_string()
+
+
 # ---------------------------------------------------------------------------
 # TestStripExdatesForDates
 # ---------------------------------------------------------------------------
@@ -202,6 +310,11 @@ class TestStripExdatesForDates:
         result = strip_exdates_for_dates(ical, set())
         assert result == ical
 
+    def test_no_exdate_returns_same_string(self):
+        """A body without any EXDATE line is returned as the very same object."""
+        ical = _make_rrule_vevent("SED2")
+        assert strip_exdates_for_dates(ical, {"20260301"}) is ical
+
     def test_strips_value_date_form(self):
         """EXDATE;VALUE=DATE:20260301 is removed when '20260301' is in dates."""
         ical = (
@@ -388,11 +501,11 @@ class TestIsFreeTime:
 
 
 # ---------------------------------------------------------------------------
-# TestComputeHash
+# TestComputeComponentHash
 # ---------------------------------------------------------------------------
 
 
-class TestComputeHash:
+class TestComputeComponentHash:
     def _vevent_with(self, uid: str, extra_lines: list[str] = ()) -> str:
         lines = [
             "BEGIN:VEVENT",
@@ -409,7 +522,14 @@ class TestComputeHash:
         """Different DTSTAMP/LASTMODIFIED/CREATED/SEQUENCE values → identical hash."""
         base = self._vevent_with("VPI1", ["DTSTAMP:20260101T000000Z"])
         other = self._vevent_with("VPI1", ["DTSTAMP:20260224T120000Z", "SEQUENCE:3"])
-        assert compute_hash(base) == compute_hash(other)
+        assert _hash(base) == _hash(other)
+
+    def test_component_hash_matches_string_hash(self):
+        """compute_component_hash(comp) equals the digest of comp's iCal string."""
+        comp = _parse(self._vevent_with("CCH1", ["DTSTAMP:20260101T000000Z", "SEQUENCE:2"]))
+        assert compute_component_hash(comp) == _released_string_hash(comp.as_ical_string())
+        # The caller's component is not normalised in place
+        assert comp.get_first_property(ICalGLib.PropertyKind.SEQUENCE_PROPERTY) is not None
 
     def test_summary_change_differs(self):
         """Changing SUMMARY produces a different hash."""
@@ -429,7 +549,7 @@ class TestComputeHash:
             f"DTEND:{_DTEND}\r\n"
             "END:VEVENT\r\n"
         )
-        assert compute_hash(v1) != compute_hash(v2)
+        assert _hash(v1) != _hash(v2)
 
     def test_vcalendar_normalises_all_vevents(self):
         """VCALENDAR with two VEVENTs: volatile props stripped from both."""
@@ -456,13 +576,139 @@ class TestComputeHash:
 
         vcal_a = make_vcal("20260101T000000Z", "20260101T000000Z")
         vcal_b = make_vcal("20260224T120000Z", "20260224T130000Z")
-        assert compute_hash(vcal_a) == compute_hash(vcal_b)
+        assert _hash(vcal_a) == _hash(vcal_b)
 
     def test_same_content_same_hash(self):
         """Identical input always yields the identical hash (deterministic)."""
         ical = _simple_vevent("SCH1")
-        assert compute_hash(ical) == compute_hash(ical)
-        assert compute_hash(ical) == compute_hash(ical)
+        assert _hash(ical) == _hash(ical)
+        assert _hash(ical) == _hash(ical)
+
+
+# ---------------------------------------------------------------------------
+# TestReleasedHashCompatibility
+# ---------------------------------------------------------------------------
+
+# Realistic shapes as EDS hands them over: a VTIMEZONE plus a TZID'd recurring
+# master with its RECURRENCE-ID exception, all-day VALUE=DATE events, and a
+# DESCRIPTION long enough to be folded across lines.
+_TZ_SERIES_ICAL = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Microsoft Corporation//Outlook 16.0 MIMEDIR//EN\r\n"
+    "BEGIN:VTIMEZONE\r\n"
+    "TZID:Europe/Berlin\r\n"
+    "BEGIN:STANDARD\r\n"
+    "DTSTART:16011028T030000\r\n"
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=10\r\n"
+    "TZOFFSETFROM:+0200\r\n"
+    "TZOFFSETTO:+0100\r\n"
+    "END:STANDARD\r\n"
+    "BEGIN:DAYLIGHT\r\n"
+    "DTSTART:16010325T020000\r\n"
+    "RRULE:FREQ=YEARLY;BYDAY=-1SU;BYMONTH=3\r\n"
+    "TZOFFSETFROM:+0100\r\n"
+    "TZOFFSETTO:+0200\r\n"
+    "END:DAYLIGHT\r\n"
+    "END:VTIMEZONE\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:TZS1\r\n"
+    "SUMMARY:Weekly sync\r\n"
+    "DTSTART;TZID=Europe/Berlin:20260302T110000\r\n"
+    "DTEND;TZID=Europe/Berlin:20260302T113000\r\n"
+    "RRULE:FREQ=WEEKLY;UNTIL=20260601T090000Z;BYDAY=MO\r\n"
+    "EXDATE;TZID=Europe/Berlin:20260309T110000\r\n"
+    "EXDATE;TZID=Europe/Berlin:20260316T110000\r\n"
+    "ATTENDEE;CN=Someone;PARTSTAT=ACCEPTED;ROLE=REQ-PARTICIPANT:mailto:someone@example.com\r\n"
+    "DESCRIPTION:Agenda: review the open items from last week\\, walk through the\r\n"
+    "  release checklist and agree on owners for the follow-up tasks.\r\n"
+    "DTSTAMP:20260224T101500Z\r\n"
+    "LAST-MODIFIED:20260224T101500Z\r\n"
+    "SEQUENCE:4\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:TZS1\r\n"
+    "RECURRENCE-ID;TZID=Europe/Berlin:20260316T110000\r\n"
+    "SUMMARY:Weekly sync (moved)\r\n"
+    "DTSTART;TZID=Europe/Berlin:20260317T140000\r\n"
+    "DTEND;TZID=Europe/Berlin:20260317T143000\r\n"
+    "DTSTAMP:20260224T101500Z\r\n"
+    "SEQUENCE:1\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+_ALL_DAY_SERIES_ICAL = (
+    "BEGIN:VEVENT\r\n"
+    "UID:ADS1\r\n"
+    "SUMMARY:Office closed\r\n"
+    "DTSTART;VALUE=DATE:20260301\r\n"
+    "DTEND;VALUE=DATE:20260302\r\n"
+    "RRULE:FREQ=MONTHLY;COUNT=6\r\n"
+    "EXDATE;VALUE=DATE:20260401\r\n"
+    "TRANSP:TRANSPARENT\r\n"
+    "CREATED:20260101T000000Z\r\n"
+    "DTSTAMP:20260224T000000Z\r\n"
+    "END:VEVENT\r\n"
+)
+
+
+class TestReleasedHashCompatibility:
+    """compute_component_hash must reproduce the digests already in state DBs.
+
+    Earlier releases hashed the event's iCal string; a different digest for the
+    same event would make every existing pair look edited after an upgrade
+    (a conflict on both sides in two-way mode).
+    """
+
+    def test_tzid_series_with_exception(self):
+        """VTIMEZONE + TZID'd master and RECURRENCE-ID exception hash as before."""
+        comp = _parse(_TZ_SERIES_ICAL)
+        assert compute_component_hash(comp) == _released_string_hash(_TZ_SERIES_ICAL)
+
+    def test_value_date_series(self):
+        """All-day VALUE=DATE series with a VALUE=DATE EXDATE hashes as before."""
+        comp = _parse(_ALL_DAY_SERIES_ICAL)
+        assert compute_component_hash(comp) == _released_string_hash(_ALL_DAY_SERIES_ICAL)
+
+    def test_child_vevent_of_listing(self):
+        """A VEVENT taken out of a VCALENDAR hashes like its serialized text."""
+        vevent = _parse(_TZ_SERIES_ICAL).get_first_component(
+            ICalGLib.ComponentKind.VEVENT_COMPONENT
+        )
+        assert compute_component_hash(vevent) == _released_string_hash(vevent.as_ical_string())
+
+    def test_exdate_strip_matches_released_string_strip(self):
+        """Phantom-EXDATE removal hashes like the old strip-then-hash string path."""
+        dates = {"20260316"}
+        comp = remove_exdates_for_dates(_parse(_TZ_SERIES_ICAL).clone(), dates)
+        assert compute_component_hash(comp) == _released_string_hash(
+            strip_exdates_for_dates(_TZ_SERIES_ICAL, dates)
+        )
+
+
+# ---------------------------------------------------------------------------
+# TestIcalDateHelpers
+# ---------------------------------------------------------------------------
+
+
+class TestIcalDateHelpers:
+    def test_date_key_is_zero_padded(self):
+        """ical_date_key() formats as YYYYMMDD with zero padding."""
+        t = ICalGLib.Time.new_from_string("20260301T090500Z")
+        assert ical_date_key(t) == "20260301"
+
+    def test_date_key_of_all_day_value(self):
+        """A DATE value (no time part) yields the same YYYYMMDD key."""
+        t = ICalGLib.Time.new_from_string("20260301")
+        assert ical_date_key(t) == "20260301"
+
+    def test_datetime_tuple_distinguishes_time_of_day(self):
+        """Same date, different time → tuples differ (rescheduled detection)."""
+        a = ICalGLib.Time.new_from_string("20260301T100000Z")
+        b = ICalGLib.Time.new_from_string("20260301T110000Z")
+        assert ical_datetime_tuple(a) == (2026, 3, 1, 10, 0, 0)
+        assert ical_datetime_tuple(a) != ical_datetime_tuple(b)
 
 
 # ---------------------------------------------------------------------------
@@ -516,6 +762,32 @@ class TestIsNotFoundError:
         assert is_not_found_error(Exception("permission denied")) is False
 
 
+# ---------------------------------------------------------------------------
+# TestLogUidBatch
+# ---------------------------------------------------------------------------
+
+
+class TestLogUidBatch:
+    def test_single_truncated_line(self, caplog):
+        """A large batch produces one DEBUG record listing only the first UIDs."""
+        logger = logging.getLogger("test.log_uid_batch")
+        uids = [f"uid-{i}" for i in range(25)]
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            log_uid_batch(logger, "Deleted", uids)
+        assert len(caplog.records) == 1
+        msg = caplog.records[0].getMessage()
+        assert msg.startswith("Deleted 25 events: uid-0, ")
+        assert "uid-9, ..." in msg and "uid-10" not in msg
+
+    def test_silent_when_debug_disabled(self, caplog):
+        """Nothing is emitted when DEBUG is off or the batch is empty."""
+        logger = logging.getLogger("test.log_uid_batch")
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_uid_batch(logger, "Deleted", ["uid-1"])
+            log_uid_batch(logger, "Deleted", [])
+        assert caplog.records == []
+
+
 # ---------------------------------------------------------------------------
 # TestIsDeclinedByUser
 # ---------------------------------------------------------------------------
@@ -593,3 +865,36 @@ class TestIsDeclinedByUser:
             )
         )
         assert is_declined_by_user(comp, self._USER) is False
+
+
+def _orphan_vevent(uid: str, source_uid: str) -> str:
+    """Managed VEVENT carrying the CALENDAR-SYNC-SRC-<fingerprint> category."""
+    fp = compute_source_fingerprint(source_uid)
+    return make_managed_vevent(uid).replace(
+        "END:VEVENT", f"CATEGORIES:CALENDAR-SYNC-SRC-{fp}\r\nEND:VEVENT"
+    )
+
+
+class TestBuildOrphanIndex:
+    def test_untracked_managed_event_is_indexed_with_component(self, state_db, sync_logger):
+        """An untracked fingerprinted event maps to its already-fetched component."""
+        client = FakeCalendarClient({"P_m1": _orphan_vevent("P_m1", "W1"), "P1": make_vevent("P1")})
+        index = build_orphan_index(client, state_db, sync_logger)
+        assert list(index) == [compute_source_fingerprint("W1")]
+        assert index[compute_source_fingerprint("W1")].get_uid() == "P_m1"
+
+    def test_tracked_and_unfingerprinted_events_are_skipped(self, state_db, sync_logger):
+        """Events already in the state DB, or without a fingerprint, are not orphans."""
+        client = FakeCalendarClient(
+            {"P_m1": _orphan_vevent("P_m1", "W1"), "P_m2": make_managed_vevent("P_m2")}
+        )
+        state_db.insert_bidirectional("W1", "P_m1", "h1", "h2", "source")
+        state_db.commit()
+        assert build_orphan_index(client, state_db, sync_logger) == {}
+
+    def test_prefetched_events_are_scanned_without_querying(self, state_db, sync_logger):
+        """A caller-supplied listing is scanned as-is; unmanaged entries are ignored."""
+        client = FakeCalendarClient()
+        events = [_orphan_vevent("P_m1", "W1"), make_vevent("P1")]
+        index = build_orphan_index(client, state_db, sync_logger, events=events)
+        assert index[compute_source_fingerprint("W1")].get_uid() == "P_m1"